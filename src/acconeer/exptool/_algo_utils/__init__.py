@@ -0,0 +1,6 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from .cfar import calculate_cfar_window_mean
+from .history import HistoryBuffer, copy_read_only_arrays
+from .peaks import find_peaks, interpolate_peaks
@@ -0,0 +1,51 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+
+def calculate_cfar_window_mean(
+    sweep: npt.NDArray[np.float_],
+    idx_cfar_pts: npt.ArrayLike,
+    one_sided: bool,
+) -> npt.NDArray[np.float_]:
+    """Calculates the mean of the CFAR window(s) for every point of a sweep
+
+    The window of a point ``idx`` consists of the points ``idx - idx_cfar_pts`` and, unless
+    ``one_sided``, also ``idx + idx_cfar_pts``. Points where the window(s) don't fit within the
+    sweep are set to NaN.
+
+    All windows are gathered into a single ``(points, window)`` array which is averaged in one
+    call. This gives exactly the same result as averaging the windows point by point.
+
+    :param sweep:
+        The sweep, or sweeps stacked in the leading dimensions. The windows are taken over the
+        last dimension.
+    :param idx_cfar_pts: Offsets (in points) from a point to the points of its window.
+    :param one_sided: Whether to only use the window before (closer than) each point.
+    :returns: An array with the same shape as ``sweep``
+    """
+    sweep = np.asarray(sweep)
+    offsets = np.asarray(idx_cfar_pts).astype(int)
+    num_points = sweep.shape[-1]
+
+    start_idx = int(np.max(offsets))
+    if one_sided:
+        relative_indexes = -offsets
+        end_idx = num_points
+    else:
+        relative_indexes = np.concatenate((-offsets, +offsets), axis=0)
+        end_idx = num_points - start_idx
+
+    window_mean = np.full(sweep.shape, np.nan)
+
+    if end_idx > start_idx:
+        idxs = np.arange(start_idx, end_idx)
+        window_mean[..., start_idx:end_idx] = np.mean(
+            sweep[..., idxs[:, None] + relative_indexes[None, :]], axis=-1
+        )
+
+    return window_mean
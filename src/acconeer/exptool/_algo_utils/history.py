@@ -0,0 +1,94 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+from typing import Any, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+
+class HistoryBuffer:
+    """A fixed length history of arrays, replacing ``np.roll(history, -1, axis=0)``
+
+    Pushing a value is equivalent to
+
+    .. code-block:: python
+
+        history = np.roll(history, -1, axis=0)
+        history[-1] = value
+
+    but does not move the rest of the history. Every value is written at two positions in a
+    buffer of twice the length, so that the history, oldest first, is always a contiguous
+    slice of the buffer. :attr:`ordered` is therefore a view and not a copy.
+
+    :param length: Number of values in the history
+    :param shape: Shape of every value
+    :param fill_value: Initial value of the whole history
+    :param dtype: Data type of the values
+    """
+
+    def __init__(
+        self,
+        length: int,
+        shape: Union[int, Tuple[int, ...]] = (),
+        *,
+        fill_value: Any = 0,
+        dtype: npt.DTypeLike = float,
+    ) -> None:
+        if length < 1:
+            raise ValueError("length must be at least 1")
+
+        if isinstance(shape, int):
+            shape = (shape,)
+
+        self._length = length
+        self._buffer = np.full((2 * length,) + shape, fill_value, dtype=dtype)
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return (self._length,) + self._buffer.shape[1:]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._buffer.dtype
+
+    def push(self, value: npt.ArrayLike) -> None:
+        """Appends a value, dropping the oldest"""
+        self._buffer[self._next] = value
+        self._buffer[self._next + self._length] = value
+        self._next = (self._next + 1) % self._length
+
+    def fill(self, value: Any) -> None:
+        """Sets every value of the history"""
+        self._buffer.fill(value)
+
+    @property
+    def ordered(self) -> npt.NDArray[Any]:
+        """The history, oldest first, as a read-only view valid until the next push"""
+        view = self._buffer[self._next : self._next + self._length]
+        view.flags.writeable = False
+        return view
+
+
+def copy_read_only_arrays(obj: Any) -> Any:
+    """Copies the read-only arrays, e.g. :attr:`HistoryBuffer.ordered`, of a processor output
+
+    Processors return histories as views which are only valid until the next frame is
+    processed. Consumers keeping an output for longer, e.g. to plot it from another thread,
+    copy it with this function. Arrays in dicts, lists and tuples are searched for, other
+    objects are returned as they are.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj if obj.flags.writeable else obj.copy()
+    elif isinstance(obj, dict):
+        return {key: copy_read_only_arrays(value) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return type(obj)(copy_read_only_arrays(value) for value in obj)
+    else:
+        return obj
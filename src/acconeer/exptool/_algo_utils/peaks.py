@@ -0,0 +1,137 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+
+def find_peaks(
+    sweep: npt.NDArray[np.float_],
+    threshold: npt.NDArray[np.float_],
+    *,
+    center_plateaus: bool = False,
+) -> Union[list[int], list[list[int]]]:
+    """Finds the peaks of a sweep that are above a threshold
+
+    A peak is either a single point or a plateau consisting of several equal points, all over
+    their threshold. The closest neighboring points on each side of the point/plateau must have
+    a lower value and be over their threshold. At least 3 points above the threshold are thus
+    required to form a peak.
+
+    Only the first contiguous run of non-NaN threshold values is searched. A NaN threshold is
+    expected at the edges of the sweep, as given by a CFAR threshold.
+
+    :param sweep:
+        The sweep, or a stack of sweeps with shape ``(frames, points)``.
+    :param threshold: The threshold, with the same shape as ``sweep``.
+    :param center_plateaus:
+        Whether the peak index of a plateau is its center point (rounded up) or its first point.
+    :returns:
+        A list of peak indexes (ascending). For a stack of sweeps, one such list per sweep.
+    """
+    sweep = np.asarray(sweep)
+    threshold = np.asarray(threshold)
+
+    if sweep.shape != threshold.shape:
+        raise ValueError("sweep and threshold must have the same shape")
+
+    if sweep.ndim == 1:
+        (peaks,) = find_peaks(sweep[None, :], threshold[None, :], center_plateaus=center_plateaus)
+        return peaks  # type: ignore[return-value]
+
+    if sweep.ndim != 2:
+        raise ValueError("sweep must be 1-D or 2-D")
+
+    num_frames, num_points = sweep.shape
+    point_idxs = np.arange(num_points)
+
+    # The searched region, [first, last], is the first run of non-NaN threshold values
+    is_defined = ~np.isnan(threshold)
+    first = np.where(is_defined.any(axis=1), np.argmax(is_defined, axis=1), num_points)
+    is_undefined_after_first = ~is_defined & (point_idxs >= first[:, None])
+    last = (
+        np.where(
+            is_undefined_after_first.any(axis=1),
+            np.argmax(is_undefined_after_first, axis=1),
+            num_points,
+        )
+        - 1
+    )
+
+    is_above = sweep > threshold
+
+    # A peak starts where both the point and the previous point are above the threshold, and the
+    # point is larger than the previous
+    is_start = np.zeros(sweep.shape, dtype=bool)
+    is_start[:, 1:] = is_above[:, 1:] & is_above[:, :-1] & (sweep[:, :-1] < sweep[:, 1:])
+    is_start &= point_idxs >= np.maximum(first, 1)[:, None]
+    is_start &= point_idxs <= np.minimum(last - 1, num_points - 2)[:, None]
+
+    # The first point after a (possible) plateau is the next point with a different value
+    changes = np.full(sweep.shape, num_points)
+    changes[:, 1:] = np.where(sweep[:, 1:] != sweep[:, :-1], point_idxs[1:], num_points)
+    next_change = np.full(sweep.shape, num_points)
+    next_change[:, :-1] = np.minimum.accumulate(changes[:, :0:-1], axis=1)[:, ::-1]
+
+    frame_idxs, starts = np.nonzero(is_start)
+    ends = next_change[frame_idxs, starts]
+
+    # The point after the plateau must be within the searched region, and lower than the
+    # plateau. All points of the plateau and the point after it must be above the threshold.
+    is_peak = ends <= np.minimum(last, num_points - 2)[frame_idxs]
+    ends_in_range = np.where(is_peak, ends, 0)
+    is_peak &= sweep[frame_idxs, ends_in_range] < sweep[frame_idxs, starts]
+
+    num_below = np.cumsum(~is_above, axis=1)
+    is_peak &= num_below[frame_idxs, ends_in_range] == num_below[frame_idxs, starts]
+
+    frame_idxs = frame_idxs[is_peak]
+    peak_idxs = starts[is_peak]
+
+    if center_plateaus:
+        plateau_lengths = ends[is_peak] - peak_idxs
+        peak_idxs = peak_idxs + plateau_lengths // 2
+
+    splits = np.searchsorted(frame_idxs, np.arange(1, num_frames))
+    return [peaks.tolist() for peaks in np.split(peak_idxs, splits)]
+
+
+def interpolate_peaks(
+    sweep: npt.NDArray[np.float_],
+    peak_idxs: npt.ArrayLike,
+    *,
+    frame_idxs: Optional[npt.ArrayLike] = None,
+) -> Tuple[npt.NDArray[np.float_], npt.NDArray[np.float_]]:
+    """Fits a parabola to every peak and its two neighboring points
+
+    :param sweep: The sweep, or a stack of sweeps with shape ``(frames, points)``.
+    :param peak_idxs: Indexes of the peaks, none of which may be at the edges of the sweep.
+    :param frame_idxs: For a stack of sweeps, the frame index of every peak.
+    :returns: The (fractional) index and the amplitude of the top of every parabola
+    """
+    # (https://math.stackexchange.com/questions/680646/get-polynomial-function-from-3-points)
+    x1 = np.asarray(peak_idxs, dtype=int)
+    x0 = x1 - 1
+    x2 = x1 + 1
+
+    if frame_idxs is None:
+        y0 = sweep[x0]
+        y1 = sweep[x1]
+        y2 = sweep[x2]
+    else:
+        frame_idxs = np.asarray(frame_idxs, dtype=int)
+        y0 = sweep[frame_idxs, x0]
+        y1 = sweep[frame_idxs, x1]
+        y2 = sweep[frame_idxs, x2]
+
+    a = (x0 * (y2 - y1) + x1 * (y0 - y2) + x2 * (y1 - y0)) / ((x0 - x1) * (x0 - x2) * (x1 - x2))
+    b = (y1 - y0) / (x1 - x0) - a * (x0 + x1)
+    c = y0 - a * x0**2 - b * x0
+    peak_locs = -b / (2 * a)
+    peak_amplitudes = a * peak_locs**2 + b * peak_locs + c
+
+    return peak_locs, peak_amplitudes
@@ -0,0 +1 @@
+__version__ = "0.0.1.dev1+gcae038d4b"
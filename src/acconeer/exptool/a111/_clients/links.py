@@ -69,6 +69,93 @@ class BaseLink(metaclass=ABCMeta):
         pass
 
 
+class RecvBuffer:
+    """Byte buffer with read and write cursors, shared by the buffered links
+
+    Received data is written at the write cursor, either directly into :meth:`write_view` (e.g.
+    using ``recv_into``) or by :meth:`extend`. Data is consumed from the read cursor, so consumed
+    bytes are never moved around. The unconsumed bytes are only compacted to the start of the
+    buffer (or the buffer grown) when there is not enough free space left at its end.
+
+    :meth:`find` remembers how far the buffer has been searched, so repeated searches while
+    waiting for more data only scan the newly received bytes.
+    """
+
+    DEFAULT_SIZE = 65536
+
+    def __init__(self, size=DEFAULT_SIZE):
+        self._buf = bytearray(size)
+        self._read_pos = 0
+        self._write_pos = 0
+        self._scan_pos = 0
+
+    def __len__(self):
+        return self._write_pos - self._read_pos
+
+    def _reserve(self, num_bytes):
+        if len(self._buf) - self._write_pos >= num_bytes:
+            return
+
+        size = len(self)
+        if size + num_bytes > len(self._buf):
+            new_buf = bytearray(max(2 * len(self._buf), size + num_bytes))
+            new_buf[:size] = self._buf[self._read_pos : self._write_pos]
+            self._buf = new_buf
+        else:
+            self._buf[:size] = self._buf[self._read_pos : self._write_pos]
+
+        self._scan_pos -= self._read_pos
+        self._read_pos = 0
+        self._write_pos = size
+
+    def write_view(self, num_bytes):
+        """Returns a writable memoryview of ``num_bytes`` free bytes after the write cursor.
+
+        The bytes written into it are added to the buffer with :meth:`commit`.
+        """
+        self._reserve(num_bytes)
+        return memoryview(self._buf)[self._write_pos : self._write_pos + num_bytes]
+
+    def commit(self, num_bytes):
+        """Moves the write cursor ``num_bytes`` forward"""
+        self._write_pos += num_bytes
+
+    def extend(self, data):
+        num_bytes = len(data)
+        self._reserve(num_bytes)
+        self._buf[self._write_pos : self._write_pos + num_bytes] = data
+        self._write_pos += num_bytes
+
+    def find(self, bs):
+        """Returns the number of bytes up to and including the first occurrence of ``bs``,
+        or -1 if there is none.
+        """
+        i = self._buf.find(bs, self._scan_pos, self._write_pos)
+
+        if i < 0:
+            self._scan_pos = max(self._read_pos, self._write_pos - len(bs) + 1)
+            return -1
+
+        return i + len(bs) - self._read_pos
+
+    def read(self, num_bytes):
+        """Consumes and returns (as a new bytearray) the first ``num_bytes`` bytes"""
+        start = self._read_pos
+        end = start + num_bytes
+        data = self._buf[start:end]
+
+        if end == self._write_pos:
+            self._read_pos = self._write_pos = self._scan_pos = 0
+        else:
+            self._read_pos = end
+            self._scan_pos = max(self._scan_pos, end)
+
+        return data
+
+    def clear(self):
+        self._read_pos = self._write_pos = self._scan_pos = 0
+
+
 class SocketLink(BaseLink):
     _CHUNK_SIZE = 4096
     _PORT = 6110
@@ -93,44 +180,34 @@ class SocketLink(BaseLink):
             self._sock = None
             raise LinkError("failed to connect") from e
 
-        self._buf = bytearray()
+        self._buf = RecvBuffer()
+
+    def _recv_into_buf(self, num_bytes=_CHUNK_SIZE):
+        try:
+            n = self._sock.recv_into(self._buf.write_view(num_bytes), num_bytes)
+        except OSError as e:
+            raise LinkError from e
+        self._buf.commit(n)
 
     def recv(self, num_bytes):
         while len(self._buf) < num_bytes:
-            try:
-                r = self._sock.recv(self._CHUNK_SIZE)
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
+            self._recv_into_buf(max(num_bytes - len(self._buf), self._CHUNK_SIZE))
 
-        data = self._buf[:num_bytes]
-        self._buf = self._buf[num_bytes:]
-        return data
+        return self._buf.read(num_bytes)
 
     def recv_until(self, bs):
         t0 = time()
         while True:
-            try:
-                i = self._buf.index(bs)
-            except ValueError:
-                pass
-            else:
+            i = self._buf.find(bs)
+            if i >= 0:
                 break
 
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = self._sock.recv(self._CHUNK_SIZE)
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
-
-        i += 1
-        data = self._buf[:i]
-        self._buf = self._buf[i:]
+            self._recv_into_buf()
 
-        return data
+        return self._buf.read(i)
 
     def send(self, data):
         self._sock.sendall(data)
@@ -232,53 +309,43 @@ class ExploreSerialLink(SerialLink):
         self._ser.port = self._port
         self._ser.rtscts = self._flowcontrol
         self._ser.open()
-        self._buf = bytearray()
+        self._buf = RecvBuffer()
 
         if platform.system().lower() == "windows":
             self._ser.set_buffer_size(rx_size=10**6, tx_size=10**6)
 
         self.send_break()
 
+    def _read_into_buf(self, num_bytes=_SERIAL_READ_PACKET_SIZE):
+        try:
+            n = self._ser.readinto(self._buf.write_view(num_bytes))
+        except OSError as e:
+            raise LinkError from e
+        self._buf.commit(n)
+
     def recv(self, num_bytes):
         t0 = time()
         while len(self._buf) < num_bytes:
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = bytearray(self._ser.read(self._SERIAL_READ_PACKET_SIZE))
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
+            self._read_into_buf(max(num_bytes - len(self._buf), self._SERIAL_READ_PACKET_SIZE))
 
-        data = self._buf[:num_bytes]
-        self._buf = self._buf[num_bytes:]
-        return data
+        return self._buf.read(num_bytes)
 
     def recv_until(self, bs):
         t0 = time()
         while True:
-            try:
-                i = self._buf.index(bs)
-            except ValueError:
-                pass
-            else:
+            i = self._buf.find(bs)
+            if i >= 0:
                 break
 
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = bytearray(self._ser.read(self._SERIAL_READ_PACKET_SIZE))
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
-
-        i += 1
-        data = self._buf[:i]
-        self._buf = self._buf[i:]
+            self._read_into_buf()
 
-        return data
+        return self._buf.read(i)
 
 
 class USBLink(BaseLink):
@@ -311,7 +378,7 @@ class USBLink(BaseLink):
             )
 
         self._port.timeout = self._port_timeout
-        self._buf = bytearray()
+        self._buf = RecvBuffer()
         self.send_break()
 
     def send_break(self):
@@ -319,46 +386,35 @@ class USBLink(BaseLink):
         sleep(0.5)
         self._port.reset_input_buffer()
 
+    def _read_into_buf(self):
+        try:
+            self._buf.extend(self._port.read())
+        except OSError as e:
+            raise LinkError from e
+
     def recv(self, num_bytes):
         t0 = time()
         while len(self._buf) < num_bytes:
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = bytearray(self._port.read())
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
+            self._read_into_buf()
 
-        data = self._buf[:num_bytes]
-        self._buf = self._buf[num_bytes:]
-        return data
+        return self._buf.read(num_bytes)
 
     def recv_until(self, bs):
         t0 = time()
         while True:
-            try:
-                i = self._buf.index(bs)
-            except ValueError:
-                pass
-            else:
+            i = self._buf.find(bs)
+            if i >= 0:
                 break
 
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-            try:
-                r = bytearray(self._port.read())
-            except OSError as e:
-                raise LinkError from e
-            self._buf.extend(r)
-
-        i += 1
-        data = self._buf[:i]
-        self._buf = self._buf[i:]
+            self._read_into_buf()
 
-        return data
+        return self._buf.read(i)
 
     def send(self, data):
         self._port.write(data)
@@ -413,7 +469,7 @@ class SerialProcessLink(BaseSerialLink):
 
         log.debug("connect - successful")
 
-        self._buf = bytearray()
+        self._buf = RecvBuffer()
 
     def recv(self, num_bytes):
         self.__empty_queue_into_buf()
@@ -425,36 +481,23 @@ class SerialProcessLink(BaseSerialLink):
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
-        data = self._buf[:num_bytes]
-        self._buf = self._buf[num_bytes:]
-        return data
+        return self._buf.read(num_bytes)
 
     def recv_until(self, bs):
         self.__empty_queue_into_buf()
 
-        n = len(bs)
-        si = 0
         t0 = time()
         while True:
-            buf_size = len(self._buf)
-            if buf_size >= n:
-                try:
-                    i = self._buf.index(bs, si)
-                except ValueError:
-                    pass
-                else:
-                    break
-
-                si = buf_size - n + 1
+            i = self._buf.find(bs)
+            if i >= 0:
+                break
 
             if time() - t0 > self._timeout:
                 raise LinkError("recv timeout")
 
             self.__get_into_buf()
 
-        data = self._buf[: i + n]
-        self._buf = self._buf[i + n :]
-        return data
+        return self._buf.read(i)
 
     def send(self, data):
         self._send_queue.put(data)
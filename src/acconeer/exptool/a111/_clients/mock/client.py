@@ -25,7 +25,22 @@ DATA_LENGTH_KEY = "data_length"
 
 
 class MockClient(BaseClient):
+    """Simulated client
+
+    :param fast:
+        Generate the frames of all sensors at once into a reused output buffer, from signal
+        templates precomputed when setting up the session. The data returned by ``get_next`` is
+        then overwritten by the next call. The simulated movement is the same as in the regular
+        mode, but the small per-frame variations of the signal are left out, and the noise is
+        filtered in the frequency domain, without the edge effects of the regular mode.
+    :param paced:
+        Pace ``get_next`` to the update rate. If ``False``, frames are returned as fast as
+        possible.
+    """
+
     def __init__(self, **kwargs):
+        self._fast = kwargs.pop("fast", False)
+        self._paced = kwargs.pop("paced", True)
         super().__init__(**kwargs)
 
     def _connect(self):
@@ -57,6 +72,10 @@ class MockClient(BaseClient):
             raise ClientError("mode not supported") from e
 
         self._mocker = mock_class(config)
+
+        if self._fast:
+            self._setup_fast()
+
         info = self._mocker.session_info
         info["stitch_count"] = 0
         return info
@@ -71,9 +90,13 @@ class MockClient(BaseClient):
         self._data_count += 1
 
         data_capture_time = self._data_count / self._update_rate
-        now = time() - self._start_time
-        if data_capture_time > now:
-            sleep(data_capture_time - now)
+        if self._paced:
+            now = time() - self._start_time
+            if data_capture_time > now:
+                sleep(data_capture_time - now)
+
+        if self._fast:
+            return self._get_next_fast(data_capture_time)
 
         args = (data_capture_time, self._data_count)
         num_sensors = len(config.sensor)
@@ -82,8 +105,7 @@ class MockClient(BaseClient):
             info, data = self._mocker.get_next(*args, 0)
             info[MISSED_GET_NEXT_KEY] = self._missed
         else:
-            idx_offset = max(0, (num_sensors - 1) / 2)
-            out = [self._mocker.get_next(*args, i - idx_offset) for i in range(num_sensors)]
+            out = [self._mocker.get_next(*args, offset) for offset in self._sensor_offsets()]
             info, data = zip(*out)
             data = np.array(data)
             info = list(info)
@@ -93,6 +115,30 @@ class MockClient(BaseClient):
 
         return info, data
 
+    def _sensor_offsets(self):
+        num_sensors = len(self._config.sensor)
+        idx_offset = max(0, (num_sensors - 1) / 2)
+        return [i - idx_offset for i in range(num_sensors)]
+
+    def _setup_fast(self):
+        offsets = self._sensor_offsets()
+
+        # Seeded from the global state, so that np.random.seed applies to both modes
+        self._rng = np.random.default_rng(np.random.randint(2**31 - 1))
+        self._out = self._mocker.setup_fast(offsets)
+        self._infos = [self._mocker.get_info() for _ in offsets]
+
+        for info in self._infos:
+            info[MISSED_GET_NEXT_KEY] = self._missed
+
+    def _get_next_fast(self, t):
+        self._mocker.get_next_fast(t, self._rng, self._out)
+
+        if self.squeeze and len(self._infos) == 1:
+            return self._infos[0], self._out[0]
+
+        return self._infos, self._out
+
     def _stop_session(self):
         pass
 
@@ -126,12 +172,15 @@ class DenseMocker:
 
 
 class EnvelopeMocker(DenseMocker):
-    def get_next(self, t, i, offset):
-        info = {
+    def get_info(self):
+        return {
             DATA_SATURATED_KEY: False,
             DATA_QUALITY_WARNING_KEY: False,
         }
 
+    def get_next(self, t, i, offset):
+        info = self.get_info()
+
         noise = 100 + 20 * np.random.randn(self.num_depths)
         noise = filtfilt_simple(noise, 0.98)
 
@@ -149,14 +198,35 @@ class EnvelopeMocker(DenseMocker):
 
         return info, data
 
+    def setup_fast(self, offsets):
+        profile = getattr(self.config, "profile", BaseServiceConfig.Profile.PROFILE_2)
+        s = 0.01 + (profile.json_value - 1.0) * 0.03
+        centers = self.range_center + 0.1 * np.array(offsets)
+        self.fast_template = 100 + 2000 * np.exp(
+            -np.square((self.depths[None, :] - centers[:, None]) / s)
+        )
+        self.fast_noise_response = filtfilt_simple_response(self.num_depths, 0.98, real=True)
+
+        return np.empty((len(offsets), self.num_depths))
+
+    def get_next_fast(self, t, rng, out):
+        rng.standard_normal(out=out)
+        out[:] = np.fft.irfft(np.fft.rfft(out) * self.fast_noise_response, self.num_depths)
+        out *= 20
+        out += self.fast_template
+        np.rint(out, out=out)
+
 
 class IQMocker(DenseMocker):
-    def get_next(self, t, i, offset):
-        info = {
+    def get_info(self):
+        return {
             DATA_SATURATED_KEY: False,
             DATA_QUALITY_WARNING_KEY: False,
         }
 
+    def get_next(self, t, i, offset):
+        info = self.get_info()
+
         noise = np.random.randn(self.num_depths) + 1j * np.random.randn(self.num_depths)
         noise *= 0.015
 
@@ -174,6 +244,28 @@ class IQMocker(DenseMocker):
 
         return info, data
 
+    def setup_fast(self, offsets):
+        # After the demodulation, the signal is a filtered Gaussian with a phase which follows
+        # its center
+        self.fast_centers = self.range_center + 0.1 * np.array(offsets)
+        self.fast_template = np.array(
+            [
+                filtfilt_simple(0.2 * np.exp(-np.square((self.depths - center) / 0.05)), 0.98)
+                for center in self.fast_centers
+            ]
+        )
+        self.fast_noise_response = filtfilt_simple_response(self.num_depths, 0.98, real=False)
+
+        return np.empty((len(offsets), self.num_depths), dtype=complex)
+
+    def get_next_fast(self, t, rng, out):
+        rng.standard_normal(out=out.view(float))
+        out[:] = np.fft.ifft(np.fft.fft(out) * self.fast_noise_response)
+        out *= 0.015
+
+        centers = self.fast_centers + 4e-3 * np.sin(t)
+        out += self.fast_template * np.exp(-2j * np.pi * centers / 2.5e-3)[:, None]
+
 
 class PowerBinMocker(EnvelopeMocker):
     def __init__(self, config):
@@ -221,11 +313,14 @@ class SparseMocker:
         self.range_center = (start + end) / 2
         self.depths = np.linspace(start, end, self.num_depths)
 
-    def get_next(self, t, i, offset):
-        info = {
+    def get_info(self):
+        return {
             DATA_SATURATED_KEY: False,
         }
 
+    def get_next(self, t, i, offset):
+        info = self.get_info()
+
         num_sweeps = self.config.sweeps_per_frame
 
         noise = 100 * np.random.randn(num_sweeps, self.num_depths)
@@ -239,6 +334,17 @@ class SparseMocker:
 
         return info, data
 
+    def setup_fast(self, offsets):
+        return np.empty((len(offsets), self.config.sweeps_per_frame, self.num_depths))
+
+    def get_next_fast(self, t, rng, out):
+        rng.standard_normal(out=out)
+        out *= 100
+
+        xs = self.depths - self.range_center + 0.1 * np.sin(t)
+        out += 2**15 + 5000 * np.exp(-np.square(xs / 0.1)) * np.sin(xs / 2.5e-3)
+        np.rint(out, out=out)
+
 
 def lfilter_simple(x, sf):
     y = np.zeros_like(x)
@@ -254,6 +360,12 @@ def filtfilt_simple(x, sf):
     return np.flip(lfilter_simple(np.flip(lfilter_simple(x, sf)), sf))
 
 
+def filtfilt_simple_response(n, sf, real):
+    """The frequency response of filtfilt_simple, for an (r)fft of length n"""
+    freqs = np.fft.rfftfreq(n) if real else np.fft.fftfreq(n)
+    return np.square(np.abs((1 - sf) / (1 - sf * np.exp(-2j * np.pi * freqs))))
+
+
 MOCK_CLASS_MAP = {
     Mode.ENVELOPE: EnvelopeMocker,
     Mode.IQ: IQMocker,
@@ -4,6 +4,7 @@
 import numpy as np
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 from .constants import HISTORY_LENGTH_S
 
@@ -95,10 +96,11 @@ class Processor:
 
         self.f = sensor_config.update_rate
 
-        self.signal_history = np.zeros(int(round(self.f * HISTORY_LENGTH_S)))
-        self.signal_lp_history = np.zeros(int(round(self.f * HISTORY_LENGTH_S)))
-        self.rel_dev_history = np.zeros(int(round(self.f * HISTORY_LENGTH_S)))
-        self.rel_dev_lp_history = np.zeros(int(round(self.f * HISTORY_LENGTH_S)))
+        history_length = int(round(self.f * HISTORY_LENGTH_S))
+        self.signal_history = HistoryBuffer(history_length)
+        self.signal_lp_history = HistoryBuffer(history_length)
+        self.rel_dev_history = HistoryBuffer(history_length)
+        self.rel_dev_lp_history = HistoryBuffer(history_length)
         self.detection_history = []
         self.signal_lp = 0.0
         self.rel_dev_lp = 0
@@ -141,17 +143,13 @@ class Processor:
             detection = True
 
         # Save all signal in history arrays.
-        self.signal_history = np.roll(self.signal_history, -1)
-        self.signal_history[-1] = signal
+        self.signal_history.push(signal)
 
-        self.signal_lp_history = np.roll(self.signal_lp_history, -1)
-        self.signal_lp_history[-1] = self.signal_lp
+        self.signal_lp_history.push(self.signal_lp)
 
-        self.rel_dev_history = np.roll(self.rel_dev_history, -1)
-        self.rel_dev_history[-1] = rel_dev
+        self.rel_dev_history.push(rel_dev)
 
-        self.rel_dev_lp_history = np.roll(self.rel_dev_lp_history, -1)
-        self.rel_dev_lp_history[-1] = self.rel_dev_lp
+        self.rel_dev_lp_history.push(self.rel_dev_lp)
 
         if detection:
             self.detection_history.append(self.sweep_index)
@@ -163,10 +161,10 @@ class Processor:
             self.detection_history.remove(self.detection_history[0])
 
         out_data = {
-            "signal_history": self.signal_history,
-            "signal_lp_history": self.signal_lp_history,
-            "rel_dev_history": self.rel_dev_history,
-            "rel_dev_lp_history": self.rel_dev_lp_history,
+            "signal_history": self.signal_history.ordered,
+            "signal_lp_history": self.signal_lp_history.ordered,
+            "rel_dev_history": self.rel_dev_history.ordered,
+            "rel_dev_lp_history": self.rel_dev_lp_history.ordered,
             "detection_history": (np.array(self.detection_history) - self.sweep_index) / self.f,
             "detection": detection,
             "sweep_index": self.sweep_index,
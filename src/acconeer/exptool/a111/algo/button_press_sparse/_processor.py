@@ -4,6 +4,7 @@
 import numpy as np
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 from .constants import HISTORY_LENGTH_S
 
@@ -121,10 +122,12 @@ class Processor:
 
         self.num_depths = num_depths
         self.f = sensor_config.update_rate
-        self.signal_history = np.zeros((int(round(self.f * HISTORY_LENGTH_S)), num_depths + 1))
-        self.average_history = np.zeros((int(round(self.f * HISTORY_LENGTH_S)), num_depths + 1))
-        self.trig_history = np.zeros((int(round(self.f * HISTORY_LENGTH_S)), num_depths + 1))
-        self.cool_down_history = np.zeros((int(round(self.f * HISTORY_LENGTH_S)), num_depths + 1))
+        # The histories hold one row per frame, with the values per depth followed by their max.
+        history_length = int(round(self.f * HISTORY_LENGTH_S))
+        self.signal_history = HistoryBuffer(history_length, num_depths + 1)
+        self.average_history = HistoryBuffer(history_length, num_depths + 1)
+        self.trig_history = HistoryBuffer(history_length, num_depths + 1)
+        self.cool_down_history = HistoryBuffer(history_length, num_depths + 1)
 
         self.detection_history = []
         self.frame_count = 0
@@ -137,21 +140,22 @@ class Processor:
 
         self.calibrated = 0  # Repeated sending of calibrated signal to exptool plot thread
 
-        self.chilled = [True] * num_depths
-        self.initialized = [False] * num_depths
+        # Per depth state. Filter states are kept as truncated integer values.
+        self.chilled = np.ones(num_depths, dtype=bool)
+        self.initialized = False
 
         # Low pass trig
-        self.lp_trig = [0.0] * num_depths
-        self.lp_trig_const = [0.0] * num_depths
+        self.lp_trig = np.zeros(num_depths)
+        self.lp_trig_const = np.zeros(num_depths)
 
         # Low pass cool down
-        self.lp_cool_down = [0.0] * num_depths
-        self.lp_cool_down_const = [0.0] * num_depths
+        self.lp_cool_down = np.zeros(num_depths)
+        self.lp_cool_down_const = np.zeros(num_depths)
 
         # Low pass average
-        self.lp_average_const = [LP_AVERAGE_CONST_INIT] * num_depths
+        self.lp_average_const = np.full(num_depths, LP_AVERAGE_CONST_INIT)
 
-        self.lp_average = [0.0] * num_depths
+        self.lp_average = np.zeros(num_depths)
 
         self.update_processing_config(processing_config)
 
@@ -169,9 +173,8 @@ class Processor:
         self.set_double_press_speed()
 
     def set_double_press_speed(self):
-        for i in range(self.num_depths):
-            self.lp_trig_const[i] = self.double_press_speed / DOUBLE_PRESS_RATIO
-            self.lp_cool_down_const[i] = self.double_press_speed
+        self.lp_trig_const[:] = self.double_press_speed / DOUBLE_PRESS_RATIO
+        self.lp_cool_down_const[:] = self.double_press_speed
 
     def set_sensitivity(self):
         """
@@ -184,114 +187,99 @@ class Processor:
         self.threshold_trig = int(sens)
         self.threshold_cool_down = int(self.threshold_trig / THRESHOLD_RATIO)
 
-    def lp_cool_down_filter(self, data, index):
-        ret = int(
-            self.lp_cool_down_const[index] * self.lp_cool_down[index]
-            + (1.0 - self.lp_cool_down_const[index]) * data
+    def lp_cool_down_filter(self, data):
+        self.lp_cool_down = np.trunc(
+            self.lp_cool_down_const * self.lp_cool_down + (1.0 - self.lp_cool_down_const) * data
         )
-        self.lp_cool_down[index] = ret
-        return ret
+        return self.lp_cool_down
 
-    def lp_trig_filter(self, data, index):
-        ret = int(
-            self.lp_trig_const[index] * self.lp_trig[index]
-            + (1.0 - self.lp_trig_const[index]) * data
+    def lp_trig_filter(self, data):
+        self.lp_trig = np.trunc(
+            self.lp_trig_const * self.lp_trig + (1.0 - self.lp_trig_const) * data
         )
-        self.lp_trig[index] = ret
-        return ret
+        return self.lp_trig
 
-    def lp_average_filter(self, data, index):
-        ret = int(
-            self.lp_average_const[index] * self.lp_average[index]
-            + (1.0 - self.lp_average_const[index]) * data
+    def lp_average_filter(self, data):
+        self.lp_average = np.trunc(
+            self.lp_average_const * self.lp_average + (1.0 - self.lp_average_const) * data
         )
-        self.lp_average[index] = ret
-        return ret
-
-    def calibrate(self, index):
-        # Update the lp_average constant based on the noise levels.
-        max_diff = max(
-            abs(
-                self.average_history[-self.calibration_limit :, index]
-                - self.signal_history[-self.calibration_limit :, index]
-            )
-        )
-
-        lp_new = (self.lp_average_const[index] * self.noise_level_target) / max_diff
-        if lp_new < LP_AVERAGE_CONST_MAX:
-            self.lp_average_const[index] = lp_new
-
-    def detect(self, trig_val, cool_down_val, index):
-        trig = False
-
-        if trig_val > self.threshold_trig:
-            if all(self.chilled):
-                trig = True
-            self.chilled[index] = False
-        if cool_down_val < self.threshold_cool_down:
-            self.chilled[index] = True
-
-        return trig
-
-    def process(self, frame, data_info):
+        return self.lp_average
 
-        detections = [False] * self.num_depths
-        signal = [0.0] * self.num_depths
+    def calibrate(self, average_row, signal_row):
+        """Updates the lp_average constants based on the noise levels
 
-        for i in range(frame.shape[1]):
+        The windows are the last ``calibration_limit`` rows of the histories, ending with the
+        given rows of the current frame.
+        """
+        start = max(1, len(self.signal_history) - self.calibration_limit + 1)
+        average_window = np.vstack([self.average_history.ordered[start:], average_row])
+        signal_window = np.vstack([self.signal_history.ordered[start:], signal_row])
+        max_diff = np.max(np.abs(average_window - signal_window), axis=0)[:-1]
 
-            if not self.initialized[i]:
-                self.lp_average[i] = int(np.mean(frame[:, i], axis=0))
-                self.initialized[i] = True
+        with np.errstate(divide="ignore"):
+            lp_new = (self.lp_average_const * self.noise_level_target) / max_diff
 
-            signal[i] = np.mean(frame[:, i], axis=0)
-            self.signal_history[-1, -1] = max(self.signal_history[-1, :-1])
+        self.lp_average_const = np.where(
+            lp_new < LP_AVERAGE_CONST_MAX, lp_new, self.lp_average_const
+        )
 
-            lp_average = self.lp_average_filter(signal[i], i)  # Low pass to smooth the signal
-            self.average_history[-1, -1] = max(self.average_history[-1, :-1])
+    def detect(self, trig_val, cool_down_val):
+        """Detections per depth, with the depths updated in order
 
-            diff = int(abs(lp_average - signal[i]))
+        A depth triggers if all depths are chilled, where the ones before it have already been
+        updated with the current frame.
+        """
+        over_threshold = trig_val > self.threshold_trig
+        chilled = (self.chilled & ~over_threshold) | (cool_down_val < self.threshold_cool_down)
 
-            if diff < self.noise_level_target:
-                diff = 0  # Get back to "detect" state asap
+        chilled_before = np.concatenate([[True], np.logical_and.accumulate(chilled)[:-1]])
+        chilled_from = np.logical_and.accumulate(self.chilled[::-1])[::-1]
 
-            diff_sq = (
-                diff * diff
-            )  # Squaring yields a bit simpler behaviour with regards to thresholds.
+        self.chilled = chilled
+        return over_threshold & chilled_before & chilled_from
 
-            trig_val = self.lp_trig_filter(diff_sq, i)
-            cool_down_val = self.lp_cool_down_filter(diff_sq, i)
+    def process(self, frame, data_info):
+        # Summed along contiguous rows, to get the same rounding as taking the mean per depth
+        signal = np.mean(np.ascontiguousarray(frame.T), axis=1)
 
-            # Triggering checks if it is considered a button press.
-            # Cool down checks if we can trigger again.
-            detection = self.detect(trig_val, cool_down_val, i)
+        if not self.initialized:
+            self.lp_average = np.trunc(signal)
+            self.initialized = True
 
-            if self.frame_count % self.recalibration_frame_period == self.calibration_limit:
-                self.calibrate(i)
-                self.calibrated = 5
+        # The rows of the current frame replace the oldest ones, which stand in for them until
+        # they are written. This matches rolling the histories after every frame.
+        oldest_signal_row = self.signal_history.ordered[0].copy()
+        oldest_average_row = self.average_history.ordered[0].copy()
 
-            if self.frame_count <= self.calibration_limit:
-                detection = False
+        lp_average = self.lp_average_filter(signal)  # Low pass to smooth the signal
 
-            self.signal_history[-1, i] = signal[i]
+        diff = np.trunc(np.abs(lp_average - signal))
+        diff[diff < self.noise_level_target] = 0  # Get back to "detect" state asap
 
-            self.average_history[-1, i] = lp_average
+        # Squaring yields a bit simpler behaviour with regards to thresholds.
+        diff_sq = diff * diff
 
-            self.trig_history[-1, i] = trig_val
+        trig_val = self.lp_trig_filter(diff_sq)
+        cool_down_val = self.lp_cool_down_filter(diff_sq)
 
-            self.cool_down_history[-1, i] = cool_down_val
+        # Triggering checks if it is considered a button press.
+        # Cool down checks if we can trigger again.
+        detections = self.detect(trig_val, cool_down_val)
 
-            detections[i] = detection
+        if self.frame_count % self.recalibration_frame_period == self.calibration_limit:
+            self.calibrate(oldest_average_row, oldest_signal_row)
+            self.calibrated = 5
 
-        detection = any(detections)
-        self.cool_down_history[-1, -1] = max(self.cool_down_history[-1, :-1])
+        if self.frame_count <= self.calibration_limit:
+            detections[:] = False
 
-        self.trig_history[-1, -1] = max(self.trig_history[-1, :-1])
+        detection = bool(np.any(detections))
 
-        self.cool_down_history = np.roll(self.cool_down_history, -1, axis=0)
-        self.trig_history = np.roll(self.trig_history, -1, axis=0)
-        self.average_history = np.roll(self.average_history, -1, axis=0)
-        self.signal_history = np.roll(self.signal_history, -1, axis=0)
+        # The maxes of the signal and average were taken before the last depth was written
+        self.signal_history.push(self._history_row(signal, oldest_signal_row[-2]))
+        self.average_history.push(self._history_row(lp_average, oldest_average_row[-2]))
+        self.trig_history.push(self._history_row(trig_val, trig_val[-1]))
+        self.cool_down_history.push(self._history_row(cool_down_val, cool_down_val[-1]))
 
         if detection:
             self.detection_history.append(self.frame_count)
@@ -303,10 +291,10 @@ class Processor:
             calibrated = False
 
         out_data = {
-            "signal_history": self.signal_history[:, -1],
-            "average_history": self.average_history[:, -1],
-            "trig_history": self.trig_history[:, -1],
-            "cool_down_history": self.cool_down_history[:, -1],
+            "signal_history": self._plot_history(self.signal_history),
+            "average_history": self._plot_history(self.average_history),
+            "trig_history": self._plot_history(self.trig_history),
+            "cool_down_history": self._plot_history(self.cool_down_history),
             "threshold": self.threshold_trig,
             "detection_history": (np.array(self.detection_history) - self.frame_count) / self.f,
             "detection": detection,
@@ -317,3 +305,14 @@ class Processor:
         self.frame_count += 1
 
         return out_data
+
+    @staticmethod
+    def _history_row(values, last_value):
+        # The values per depth followed by their max, taking last_value for the last depth
+        return np.append(values, np.max(values[:-1], initial=last_value))
+
+    @staticmethod
+    def _plot_history(history):
+        # The history of the maxes, last being the oldest, as in the rolled history
+        maxes = history.ordered[:, -1]
+        return np.concatenate([maxes[1:], maxes[:1]])
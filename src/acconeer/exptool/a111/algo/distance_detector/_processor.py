@@ -10,6 +10,7 @@ from typing import Optional
 import numpy as np
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import calculate_cfar_window_mean, find_peaks
 
 from .calibration import DistanceDetectorCalibration
 
@@ -135,23 +136,7 @@ class Processor:
         return calibration
 
     def calculate_cfar_threshold(self, sweep, idx_cfar_pts, alpha, one_side):
-
-        threshold = np.full(sweep.shape, np.nan)
-
-        start_idx = np.max(idx_cfar_pts)
-        if one_side:
-            rel_indexes = -idx_cfar_pts
-            end_idx = sweep.size
-        else:
-            rel_indexes = np.concatenate((-idx_cfar_pts, +idx_cfar_pts), axis=0)
-            end_idx = sweep.size - start_idx
-
-        for idx in np.arange(start_idx, end_idx):
-            threshold[int(idx)] = (
-                1.0 / (alpha + 1e-10) * np.mean(sweep[(idx + rel_indexes).astype(int)])
-            )
-
-        return threshold
+        return 1.0 / (alpha + 1e-10) * calculate_cfar_window_mean(sweep, idx_cfar_pts, one_side)
 
     def find_first_point_above_threshold(self, sweep, threshold):
 
@@ -166,72 +151,11 @@ class Processor:
         return np.argmax(points_above)
 
     def find_peaks(self, sweep, threshold):
-        #  Not written for optimal speed.
-
         if threshold is None or np.all(np.isnan(threshold)):
             return []
 
-        found_peaks = []
-
         # Note: at least 3 samples above threshold are required to form a peak
-
-        d = 1
-        N = len(sweep)
-        while d < (N - 1):
-            # Skip to when threshold starts, applicable only for CFAR
-            if np.isnan(threshold[d - 1]):
-                d += 1
-                continue
-
-            # Break when threshold ends, applicable only for CFAR
-            if np.isnan(threshold[d + 1]):
-                break
-
-            # At this point, threshold is defined (not Nan)
-
-            # If the current point is not over threshold, the next will not be a peak
-            if sweep[d] <= threshold[d]:
-                d += 2
-                continue
-
-            # Continue if previous point is not over threshold
-            if sweep[d - 1] <= threshold[d - 1]:
-                d += 1
-                continue
-
-            # Continue if this point isn't larger than the previous
-            if sweep[d - 1] >= sweep[d]:
-                d += 1
-                continue
-
-            # A peak is either a single point or a plateau consisting of several equal points,
-            # all over their threshold. The closest neighboring points on each side of the
-            # point/plateau must have a lower value and be over their threshold.
-            # Now, decide if the following point(s) are a peak:
-
-            d_upper = d + 1
-            while True:
-                if (d_upper) >= (N - 1):  # If out of range or on last point
-                    break
-
-                if np.isnan(threshold[d_upper]):
-                    break
-
-                if sweep[d_upper] <= threshold[d_upper]:
-                    break
-
-                if sweep[d_upper] > sweep[d]:
-                    break
-                elif sweep[d_upper] < sweep[d]:
-                    delta = d_upper - d
-                    found_peaks.append(d + int(np.ceil((delta - 1) / 2.0)))
-                    break
-                else:  # equal
-                    d_upper += 1
-
-            d = d_upper
-
-        return found_peaks
+        return find_peaks(sweep, threshold, center_plateaus=True)
 
     def merge_peaks(self, peak_indexes, merge_max_range):
         merged_peaks = copy(peak_indexes)
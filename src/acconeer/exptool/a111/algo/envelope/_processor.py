@@ -6,6 +6,7 @@ from enum import Enum
 import numpy as np
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 from .calibration import EnvelopeCalibration
 
@@ -67,7 +68,7 @@ class Processor:
         self.bg_buffer = np.zeros([buffer_length, num_sensors, num_depths])
 
         history_length = self.processing_config.history_length
-        self.history = np.zeros([history_length, num_sensors, num_depths])
+        self.history = HistoryBuffer(history_length, (num_sensors, num_depths))
 
         self.data_index = 0
         self.calibration = calibration
@@ -90,8 +91,7 @@ class Processor:
 
             bg = self.calibration.background
 
-        self.history = np.roll(self.history, -1, axis=0)
-        self.history[-1] = output_data
+        self.history.push(output_data)
 
         peak_ampls = [np.max(sweep) for sweep in output_data]
         peak_depths = [self.depths[np.argmax(sweep)] for sweep in output_data]
@@ -100,7 +100,7 @@ class Processor:
         output = {
             "output_data": output_data,
             "bg": bg,
-            "history": self.history,
+            "history": self.history.ordered,
             "peak_depths": filtered_peak_depths,
         }
         if new_calibration is not None:
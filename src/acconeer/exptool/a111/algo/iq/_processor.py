@@ -4,6 +4,7 @@
 import numpy as np
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 
 def get_sensor_config():
@@ -42,7 +43,7 @@ class Processor:
         num_depths = depths.size
         num_sensors = len(sensor_config.sensor)
         history_length = processing_config.history_length
-        self.history = np.zeros([history_length, num_sensors, num_depths], dtype="complex")
+        self.history = HistoryBuffer(history_length, (num_sensors, num_depths), dtype="complex")
         self.lp_data = np.zeros([num_sensors, num_depths], dtype="complex")
         self.update_index = 0
         self.update_processing_config(processing_config)
@@ -54,8 +55,7 @@ class Processor:
         return min(static_sf, 1.0 - 1.0 / (1.0 + self.update_index))
 
     def process(self, data, data_info):
-        self.history = np.roll(self.history, -1, axis=0)
-        self.history[-1] = data
+        self.history.push(data)
 
         sf = self.dynamic_sf(self.sf)
         self.lp_data = sf * self.lp_data + (1 - sf) * data
@@ -64,5 +64,5 @@ class Processor:
 
         return {
             "data": self.lp_data,
-            "history": self.history,
+            "history": self.history.ordered,
         }
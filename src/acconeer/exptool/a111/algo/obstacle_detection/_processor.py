@@ -14,6 +14,7 @@ from numpy import pi, unravel_index
 from scipy.fftpack import fft, fftshift
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 from .calibration import ObstacleDetectionCalibration
 from .constants import WAVELENGTH
@@ -321,23 +322,23 @@ class Processor:
         """Resets all arrays used for calculations. This was done on first sweep before."""
         self.sweep_map = np.zeros((1, len_range, self.fft_len), dtype="complex")
         self.fft_bg = np.zeros((1, len_range, self.fft_len))
-        self.hamming_map = np.zeros((len_range, self.fft_len))
-
-        for i in range(len_range):
-            self.hamming_map[i, :] = np.hamming(self.fft_len)
+        self.hamming_map = np.tile(np.hamming(self.fft_len), (len_range, 1))
 
         self.env_xs = np.linspace(*self.sensor_config.range_interval * 100, len_range)
         self.peak_prop_num = 4
-        self.peak_hist = np.zeros((1, self.nr_locals, self.peak_prop_num, self.peak_hist_len))
-        self.peak_hist *= float(np.nan)
+        self.peak_hist = HistoryBuffer(
+            self.peak_hist_len, (self.nr_locals, self.peak_prop_num), fill_value=np.nan
+        )
         self.mask = np.zeros((len_range, self.fft_len))
-        self.threshold_map = np.zeros((len_range, self.fft_len))
-
-        for dist in range(len_range):
-            for freq in range(self.fft_len):
-                self.threshold_map[dist, freq] = self.variable_thresholding(
-                    freq, dist, self.threshold, self.static_threshold
-                )
+        self.threshold_map = np.broadcast_to(
+            self.variable_thresholding(
+                np.arange(self.fft_len),
+                np.arange(len_range)[:, None],
+                self.threshold,
+                self.static_threshold,
+            ),
+            (len_range, self.fft_len),
+        )
 
     def _process_single_sensor(self, sweep, fft_psd):
         self.push(sweep[0, :], self.sweep_map[0, :, :])
@@ -372,31 +373,24 @@ class Processor:
             fft_max_env = signalPSD[:, int(fft_peaks[0, 1])]
             zero = np.floor(self.fft_len / 2)
 
-            for i in range(self.nr_locals):
-                bin_index = fft_peaks[i, 2] - zero
-                velocity = (bin_index / zero) * WAVELENGTH * self.sensor_config.update_rate / 4
-                angle = np.arccos(self.clamp(abs(velocity) / self.robot_velocity, -1.0, 1.0))
-                angle = np.sign(velocity) * angle / pi * 180
-                peak_idx = int(fft_peaks[i, 0])
-                distance = self.env_xs[int(fft_peaks[i, 0])]
-                amp = fft_peaks[i, 3]
-
-                if not amp:
-                    distance = float(np.nan)
-                    velocity = float(np.nan)
-                    angle = float(np.nan)
-                    amp = float(np.nan)
-
-                self.push_vec(distance, self.peak_hist[0, i, 0, :])
-                self.push_vec(velocity, self.peak_hist[0, i, 1, :])
-                self.push_vec(angle, self.peak_hist[0, i, 2, :])
-                self.push_vec(amp, self.peak_hist[0, i, 3, :])
+            bin_index = fft_peaks[:, 2] - zero
+            velocities = (bin_index / zero) * WAVELENGTH * self.sensor_config.update_rate / 4
+            angles = np.arccos(self.clamp(np.abs(velocities) / self.robot_velocity, -1.0, 1.0))
+            angles = np.sign(velocities) * angles / pi * 180
+            peak_indexes = fft_peaks[:, 0].astype(int)
+            amps = fft_peaks[:, 3]
+
+            peak_props = np.stack([self.env_xs[peak_indexes], velocities, angles, amps], axis=-1)
+            peak_props[amps == 0] = np.nan
+            self.peak_hist.push(peak_props)
+
+            # The outputs are those of the last local peak
+            _, velocity, angle, _ = peak_props[-1]
+            peak_idx = peak_indexes[-1]
 
             fft_peaks = fft_peaks[:peaks_found, :]
         else:
-            for i in range(self.nr_locals):
-                for j in range(self.peak_prop_num):
-                    self.push_vec(float(np.nan), self.peak_hist[0, i, j, :])
+            self.peak_hist.push(np.nan)
 
         out_data.update(
             {
@@ -407,7 +401,8 @@ class Processor:
                 "angle": angle,
                 "velocity": velocity,
                 "fft_peaks": fft_peaks,
-                "peak_hist": self.peak_hist[0, :, :, :],
+                # Newest first, with the history along the last axis
+                "peak_hist": np.moveaxis(self.peak_hist.ordered[::-1], 0, -1),
                 "sweep_index": self.sweep_index,
                 "peaks_found": peaks_found,
             }
@@ -434,8 +429,8 @@ class Processor:
         fft_bg = None
         fft_bg_send = None
         if self.sweep_index < 3 * self.fft_len:  # Make sure data gets send to ui
-            fft_bg = self.fft_bg[0, :, :]
-            fft_bg_send = self.fft_bg
+            fft_bg_send = self.fft_bg.copy()
+            fft_bg = fft_bg_send[0, :, :]
 
         threshold_map = None
         if self.sweep_index < 3 * self.fft_len:  # Make sure data gets send to ui
@@ -465,9 +460,7 @@ class Processor:
         return val * m + b
 
     def clamp(self, val, a, b):
-        val = max(val, a)
-        val = min(val, b)
-        return val
+        return np.minimum(np.maximum(val, a), b)
 
     def push(self, sweep, arr):
         res = np.empty_like(arr)
@@ -475,12 +468,6 @@ class Processor:
         res[:, 1:] = arr[:, :-1]
         arr[...] = res
 
-    def push_vec(self, val, vec):
-        res = np.empty_like(vec)
-        res[0] = val
-        res[1:] = vec[:-1]
-        vec[...] = res
-
     def parameterize_bg(self, fft_bg):
         dist_len = fft_bg.shape[0]
 
@@ -489,35 +476,13 @@ class Processor:
         moving_range = [*range(adjacent_idx[0]), *range(adjacent_idx[1] + 1, self.fft_len)]
         pwl_static_points = 5
 
-        static_pwl_amp = []
-        static_pwl_dist = []
+        static_bg = fft_bg[:, static_idx]
+        moving_bg = fft_bg[:, moving_range]
 
-        static_sum = 0.0
-        adjacent_sum = np.zeros(2)
-        moving_sum = 0.0
-        moving_sum_sqr = 0.0
-        moving_mean_array = np.zeros(dist_len)
-
-        moving_max = 0.0
-        moving_min = 0.0
-
-        for dist_index in range(dist_len):
-            static_sum += fft_bg[dist_index, static_idx]
-            adjacent_sum[0] += fft_bg[dist_index, adjacent_idx[0]]
-            adjacent_sum[1] += fft_bg[dist_index, adjacent_idx[1]]
-
-            current_dist_moving_sum = 0.0
-            for freq_index in moving_range:
-                val = fft_bg[dist_index, freq_index]
-                current_dist_moving_sum += val
-                if val > moving_max:
-                    moving_max = val
-                if val < moving_min:
-                    moving_min = val
-                moving_sum += val
-                moving_sum_sqr += val * val
-
-            moving_mean_array[dist_index] = current_dist_moving_sum / len(moving_range)
+        static_sum = np.sum(static_bg)
+        adjacent_sum = np.sum(fft_bg[:, adjacent_idx], axis=0)
+        moving_max = np.max(moving_bg, initial=0.0)
+        moving_mean_array = np.sum(moving_bg, axis=1) / len(moving_range)
 
         segs = self.adapt_background_segment_step(moving_mean_array, dist_len)
         segs_nr = int(len(segs) / 2)
@@ -533,29 +498,20 @@ class Processor:
 
         bin_width = dist_len / pwl_static_points
 
-        pwl_y_max = 0
-        pwl_x_max = 0
+        # The position and value of the (positive) max of the static background in every bin
+        static_pwl_dist = np.zeros(pwl_static_points)
+        static_pwl_amp = np.zeros(pwl_static_points)
         for point_index in range(pwl_static_points):
             dist_begin = int(point_index * bin_width)
             dist_end = int((point_index + 1) * bin_width)
 
-            if point_index == pwl_static_points:
-                dist_end = dist_len
-
-            pwl_x_max = 0.0
-            pwl_y_max = 0.0
-            for dist_index in range(dist_begin, dist_end):
-                val = fft_bg[dist_index, static_idx]
-                if val > pwl_y_max:
-                    pwl_x_max = dist_index
-                    pwl_y_max = val
+            if dist_begin < dist_end:
+                max_index = np.argmax(static_bg[dist_begin:dist_end])
+                if static_bg[dist_begin + max_index] > 0:
+                    static_pwl_dist[point_index] = dist_begin + max_index
+                    static_pwl_amp[point_index] = static_bg[dist_begin + max_index]
 
-            static_pwl_dist.append(pwl_x_max)
-            static_pwl_amp.append(pwl_y_max)
-
-        for i in range(pwl_static_points):
-            if static_pwl_amp[i] < moving_max:
-                static_pwl_amp[i] = moving_max
+        static_pwl_amp = np.maximum(static_pwl_amp, moving_max)
 
         bg_params = {
             "static_pwl_dist": [float(i) for i in static_pwl_dist],
@@ -571,15 +527,8 @@ class Processor:
     def adapt_background_segment_step(self, data_y, data_length):
         mid_index = int(data_length / 2)
 
-        y1 = 0
-        for i in range(mid_index):
-            if y1 < data_y[i]:
-                y1 = data_y[i]
-
-        y2 = 0
-        for i in range(mid_index, int(data_length)):
-            if y2 < data_y[i]:
-                y2 = data_y[i]
+        y1 = np.max(data_y[:mid_index], initial=0)
+        y2 = np.max(data_y[mid_index : int(data_length)], initial=0)
 
         # Check the plateau levels and return early if the step is non-decreasing
         if y1 <= y2:
@@ -592,9 +541,12 @@ class Processor:
         if intersection_threshold > y2 * BACKGROUND_PLATEAU_FACTOR:
             intersection_threshold = y2 * BACKGROUND_PLATEAU_FACTOR
 
-        intersection_index = mid_index
-        while intersection_index > 1 and data_y[intersection_index - 1] < intersection_threshold:
-            intersection_index -= 1
+        # Step down from the middle to just after the last point reaching the threshold
+        (reaching_indexes,) = np.nonzero(data_y[1:mid_index] >= intersection_threshold)
+        if reaching_indexes.size > 0:
+            intersection_index = int(reaching_indexes[-1]) + 2
+        else:
+            intersection_index = min(mid_index, 1)
 
         x2 = float(intersection_index)
         y2 = data_y[intersection_index]
@@ -603,11 +555,10 @@ class Processor:
             x1 = 0
             return [x1, x2, y1, y2]
 
-        max_neg_slope = 0
-        for i in range(intersection_index):
-            neg_slope = (data_y[i] - y2) / float(intersection_index - i)
-            if max_neg_slope < neg_slope:
-                max_neg_slope = neg_slope
+        neg_slopes = (data_y[:intersection_index] - y2) / (
+            intersection_index - np.arange(intersection_index, dtype=float)
+        )
+        max_neg_slope = np.max(neg_slopes, initial=0)
         x1 = x2 - (y1 - y2) / max_neg_slope
 
         return [x1, x2, y1, y2]
@@ -618,7 +569,6 @@ class Processor:
         moving_range = [*range(adjacent_idx[0]), *range(adjacent_idx[1] + 1, self.fft_len)]
         pwl_static_points = 5
         pwl_moving_points = 2
-        dist_len = fft_bg.shape[0]
         fac = bg_params["static_adjacent_factor"][0]
         static_pwl_amp = bg_params["static_pwl_amp"]
         static_pwl_dist = bg_params["static_pwl_dist"]
@@ -630,21 +580,17 @@ class Processor:
             fft_bg, static_idx, static_pwl_dist, static_pwl_amp, pwl_static_points
         )
 
-        for dist_index in range(dist_len):
-            static_val = fft_bg[dist_index, 8]
-            if static_val < moving_max:
-                static_val = moving_max
-                fft_bg[dist_index, static_idx] = static_val
-
-            interp_adjacent = moving_max
-            if fac > 0:
-                interp_adjacent = static_val / fac
-                fft_bg[dist_index, adjacent_idx] = interp_adjacent
-
-        for freq_index in moving_range:
-            self.apply_pwl_segments(
-                fft_bg, freq_index, moving_pwl_dist, moving_pwl_amp, pwl_moving_points
-            )
+        static_val = fft_bg[:, 8].copy()
+        below_moving_max = static_val < moving_max
+        static_val[below_moving_max] = moving_max
+        fft_bg[below_moving_max, static_idx] = moving_max
+
+        if fac > 0:
+            fft_bg[:, adjacent_idx] = (static_val / fac)[:, None]
+
+        self.apply_pwl_segments(
+            fft_bg, moving_range, moving_pwl_dist, moving_pwl_amp, pwl_moving_points
+        )
 
     def apply_pwl_segments(self, fft_bg, freq_index, pwl_dist, pwl_amp, pwl_points):
         dist_len = fft_bg.shape[0]
@@ -654,6 +600,8 @@ class Processor:
         y_start = pwl_amp[0]
         y_stop = pwl_amp[0]
 
+        # The interpolated values are computed once and written to all the given frequencies
+        interp = np.empty(dist_len)
         segment_stop = 0
         for dist_index in range(dist_len):
             if x_stop < dist_index:
@@ -665,8 +613,9 @@ class Processor:
                     y_stop = pwl_amp[segment_stop]
                 else:
                     x_stop = dist_len - 1
-            interp = self.remap(dist_index, x_start, x_stop, y_start, y_stop)
-            fft_bg[dist_index, freq_index] = interp
+            interp[dist_index] = self.remap(dist_index, x_start, x_stop, y_start, y_stop)
+
+        fft_bg.T[freq_index] = interp
 
     def find_peaks(self, arr):
         if not self.nr_locals:
@@ -677,9 +626,7 @@ class Processor:
         peak_avg = peak[1]
 
         peak_val = arr[peak[0], peak[1]]
-        thresh = self.variable_thresholding(
-            peak[1], peak[0], self.threshold, self.static_threshold
-        )
+        thresh = self.threshold_map[peak[0], peak[1]]
 
         if peak_val < thresh:
             peak = None
@@ -699,9 +646,7 @@ class Processor:
             for i in range(self.nr_locals - 1):
                 self.peak_masking(local_peaks[i, :])
                 p = np.asarray(unravel_index(np.argmax(self.mask), arr.shape))
-                thresh = self.variable_thresholding(
-                    p[1], p[0], self.threshold, self.static_threshold
-                )
+                thresh = self.threshold_map[p[0], p[1]]
                 peak_val = arr[p[0], p[1]]
                 if peak_val > thresh:
                     dist_edge = self.edge(arr[:, p[1]], p[0], self.edge_ratio)
@@ -795,16 +740,17 @@ class Processor:
         null_frequency = self.fft_len / 2
         frequency_gradient = self.static_freq_limit
 
-        if freq_index <= null_frequency:
-            freq = self.clamp(freq_index, null_frequency - frequency_gradient, null_frequency)
-            thresh = self.remap(
-                freq, null_frequency - frequency_gradient, null_frequency, min_thresh, thresh
-            )
-        else:
-            freq = self.clamp(freq_index, null_frequency, null_frequency + frequency_gradient)
-            thresh = self.remap(
-                freq, null_frequency, null_frequency + frequency_gradient, thresh, min_thresh
-            )
+        freq_below = self.clamp(freq_index, null_frequency - frequency_gradient, null_frequency)
+        freq_above = self.clamp(freq_index, null_frequency, null_frequency + frequency_gradient)
+        thresh = np.where(
+            freq_index <= null_frequency,
+            self.remap(
+                freq_below, null_frequency - frequency_gradient, null_frequency, min_thresh, thresh
+            ),
+            self.remap(
+                freq_above, null_frequency, null_frequency + frequency_gradient, thresh, min_thresh
+            ),
+        )
 
         thresh_add = self.remap(
             dist,
@@ -4,6 +4,7 @@
 import numpy as np
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 
 ENVELOPE_BACKGROUND_LEVEL = 100
@@ -62,7 +63,7 @@ class Processor:
         self.queued_distances = []
 
         history_length = int(round(self.f * processing_config.history_length_s)) + 1
-        self.detection_history = np.zeros(history_length) * float("nan")
+        self.detection_history = HistoryBuffer(history_length, fill_value=np.nan)
         self.detection_history_t = np.linspace(-(history_length - 1) / self.f, 0, history_length)
 
     def process(self, data, data_info):
@@ -124,8 +125,7 @@ class Processor:
             and distance_max - distance_min <= self.distance_difference_limit
         )
 
-        self.detection_history = np.roll(self.detection_history, -1)
-        self.detection_history[-1] = detection
+        self.detection_history.push(detection)
 
         # Calculates limits_center used to visualize the detection criterion
         limits_center = (np.sqrt(weight_min * weight_max), (distance_min + distance_max) / 2)
@@ -139,7 +139,7 @@ class Processor:
             "queued_weights": np.array(self.queued_weights),
             "queued_distances": np.array(self.queued_distances),
             "limits_center": limits_center,
-            "detection_history": self.detection_history,
+            "detection_history": self.detection_history.ordered,
             "detection_history_t": self.detection_history_t,
         }
 
@@ -6,6 +6,7 @@ from numpy import cos, pi, sqrt, square
 from scipy.special import binom
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 
 def get_sensor_config():
@@ -236,7 +237,9 @@ class Processor:
         self.presence_distance_index = 0
         self.presence_distance = 0
 
-        self.presence_history = np.zeros(int(round(self.f * processing_config.history_length_s)))
+        self.presence_history = HistoryBuffer(
+            int(round(self.f * processing_config.history_length_s))
+        )
         self.update_index = 0
 
         self.update_processing_config(processing_config)
@@ -394,8 +397,7 @@ class Processor:
 
         presence_detected = self.presence_score > self.threshold
 
-        self.presence_history = np.roll(self.presence_history, -1)
-        self.presence_history[-1] = self.presence_score
+        self.presence_history.push(self.presence_score)
 
         if max_depthwise_presence > self.threshold:
             self.presence_distance_index = np.argmax(depthwise_presence)
@@ -412,7 +414,7 @@ class Processor:
             "presence_score": self.presence_score,
             "presence_distance_index": self.presence_distance_index,
             "presence_distance": self.presence_distance,
-            "presence_history": self.presence_history,
+            "presence_history": self.presence_history.ordered,
             "presence_detected": presence_detected,
         }
 
@@ -5,6 +5,10 @@ import numpy as np
 from scipy import signal
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
+
+
+HISTORY_LENGTH_S = 600
 
 
 def get_sensor_config():
@@ -124,10 +128,19 @@ class Processor:
         # Parameter init
         self.sweeps_in_block = int(np.ceil(n_dft * self.f_s))
         self.new_sweeps_per_results = int(np.ceil(t_freq_est * self.f_s))
-        self.phi_vec = np.zeros((self.sweeps_in_block, 1))
-        self.f_est_vec = np.zeros(1)
-        self.f_dft_est_vec = np.zeros(1)
-        self.snr_vec = 0
+        self.phi_vec = HistoryBuffer(self.sweeps_in_block)
+        self.phi_filt_vec = HistoryBuffer(self.sweeps_in_block)
+        self.phi_filt_zi = np.zeros(max(len(self.a), len(self.b)) - 1)
+
+        # Estimation history, bounded to HISTORY_LENGTH_S
+        estimates_per_s = self.f_s / max(1, self.new_sweeps_per_results - 1)
+        history_length = int(np.ceil(HISTORY_LENGTH_S * estimates_per_s)) + 1
+        self.f_est_vec = HistoryBuffer(history_length)
+        self.f_dft_est_vec = HistoryBuffer(history_length)
+        self.snr_vec = HistoryBuffer(history_length)
+        self.num_estimates = 0
+
+        self.estimation_matrix = self.get_estimation_matrix()
 
         self.sweep_index = 0
 
@@ -135,37 +148,20 @@ class Processor:
         sweep = data
 
         if self.sweep_index == 0:
-            delay_points = int(np.ceil(np.size(sweep) / self.D))
-            self.data_s_d_mat = np.zeros((self.sweeps_in_block, delay_points), dtype="complex")
-            self.data_s_d_mat[self.sweep_index, :] = self.downsample(sweep, self.D)
+            self.data_s_d = self.downsample(sweep, self.D)
+            self.push_phase(0)
 
             out_data = None
         elif self.sweep_index < self.sweeps_in_block:
-            self.data_s_d_mat[self.sweep_index, :] = self.iq_lp_filter_time(
-                self.data_s_d_mat[self.sweep_index - 1, :], self.downsample(sweep, self.D)
-            )
-
-            temp_phi = self.unwrap_phase(
-                self.phi_vec[self.sweep_index - 1],
-                self.data_s_d_mat[self.sweep_index, :],
-                self.data_s_d_mat[self.sweep_index - 1, :],
-            )
-
-            self.phi_vec[self.sweep_index] = self.unwrap_phase(
-                self.phi_vec[self.sweep_index - 1],
-                self.data_s_d_mat[self.sweep_index, :],
-                self.data_s_d_mat[self.sweep_index - 1, :],
-            )
-
-            phi_filt = signal.lfilter(self.b, self.a, self.phi_vec, axis=0)
+            self.update_phase(sweep)
 
             out_data = {
-                "phi_raw": self.phi_vec,
-                "phi_filt": phi_filt,
+                "phi_raw": self.phi_vec.ordered,
+                "phi_filt": self.phi_filt_vec.ordered,
                 "power_spectrum": np.zeros(self.dft_points),
                 "x_dft": np.linspace(self.f_low, self.f_high, self.dft_points),
-                "f_dft_est_hist": self.f_dft_est_vec,
-                "f_est_hist": self.f_est_vec,
+                "f_dft_est_hist": self.estimate_history(self.f_dft_est_vec),
+                "f_est_hist": self.estimate_history(self.f_est_vec),
                 "f_dft_est": 0,
                 "f_est": 0,
                 "f_low": self.f_low,
@@ -177,36 +173,25 @@ class Processor:
                 "init_progress": round(100 * self.sweep_index / self.sweeps_in_block),
             }
         else:
-            # Lowpass filter IQ data downsampled in distance points
-            self.data_s_d_mat = np.roll(self.data_s_d_mat, -1, axis=0)
-            self.data_s_d_mat[-1, :] = self.iq_lp_filter_time(
-                self.data_s_d_mat[-2, :], self.downsample(sweep, self.D)
-            )
-
-            # Phase unwrapping of IQ data
-            temp_phi = self.unwrap_phase(
-                self.phi_vec[-1], self.data_s_d_mat[-1, :], self.data_s_d_mat[-2, :]
-            )
-            self.phi_vec = np.roll(self.phi_vec, -1, axis=0)
-            self.phi_vec[-1] = temp_phi
+            self.update_phase(sweep)
 
             if np.mod(self.sweep_index, self.new_sweeps_per_results - 1) == 0:
-                # Bandpass filter unwrapped data
-                phi_filt_vec = signal.lfilter(self.b, self.a, self.phi_vec, axis=0)
-                P, dft_est, _ = self.dft(self.downsample(phi_filt_vec, self.M))
+                P = self.power_spectrum(self.phi_vec.ordered)
+                dft_est = self.dft_f_vec[np.argmax(P)]
                 f_breath_est, _, snr, _ = self.breath_freq_est(P)
 
-                self.f_est_vec = np.append(self.f_est_vec, f_breath_est)
-                self.f_dft_est_vec = np.append(self.f_dft_est_vec, dft_est)
-                self.snr_vec = np.append(self.snr_vec, snr)
+                self.f_est_vec.push(f_breath_est)
+                self.f_dft_est_vec.push(dft_est)
+                self.snr_vec.push(snr)
+                self.num_estimates += 1
 
                 out_data = {
-                    "phi_raw": self.phi_vec,
-                    "phi_filt": phi_filt_vec,
+                    "phi_raw": self.phi_vec.ordered,
+                    "phi_filt": self.phi_filt_vec.ordered,
                     "power_spectrum": P,
                     "x_dft": np.linspace(self.f_low, self.f_high, self.dft_points),
-                    "f_dft_est_hist": self.f_dft_est_vec,
-                    "f_est_hist": self.f_est_vec,
+                    "f_dft_est_hist": self.estimate_history(self.f_dft_est_vec),
+                    "f_est_hist": self.estimate_history(self.f_est_vec),
                     "f_dft_est": dft_est,
                     "f_est": f_breath_est,
                     "f_low": self.f_low,
@@ -223,6 +208,27 @@ class Processor:
         self.sweep_index += 1
         return out_data
 
+    def update_phase(self, sweep):
+        # Lowpass filter IQ data downsampled in distance points
+        data_s_d = self.iq_lp_filter_time(self.data_s_d, self.downsample(sweep, self.D))
+
+        # Phase unwrapping of IQ data
+        phi = self.unwrap_phase(self.phi_vec.ordered[-1], data_s_d, self.data_s_d)
+
+        self.data_s_d = data_s_d
+        self.push_phase(phi)
+
+    def push_phase(self, phi):
+        # The bandpass filter runs continuously, its output is only used for plotting
+        phi_filt, self.phi_filt_zi = signal.lfilter(self.b, self.a, [phi], zi=self.phi_filt_zi)
+
+        self.phi_vec.push(phi)
+        self.phi_filt_vec.push(phi_filt[0])
+
+    def estimate_history(self, history):
+        # Grows like the unbounded history did until the buffer is full
+        return history.ordered[-min(self.num_estimates + 1, len(history)) :]
+
     def downsample(self, data, n):
         return data[::n]
 
@@ -232,14 +238,27 @@ class Processor:
     def unwrap_phase(self, phase_lp, data_1, data_2):
         return phase_lp * self.alpha_phi + np.angle(np.mean(data_2 * np.conjugate(data_1)))
 
-    def dft(self, data):
-        data = np.squeeze(data)
-        n_vec = np.arange(data.size) * self.M
+    def get_estimation_matrix(self):
+        """Maps a phase window to its DFT at the frequencies of interest
+
+        Bandpass filtering the window from a zero state, downsampling it in time and taking the
+        DFT are all linear, and are combined into a single matrix once. The filter is applied as
+        its impulse response, truncated to the window.
+        """
+        n = self.sweeps_in_block
+        impulse = np.zeros(n)
+        impulse[0] = 1
+        h = signal.lfilter(self.b, self.a, impulse)
+
+        n_vec = np.arange(0, n, self.M)
+        lags = n_vec[:, None] - np.arange(n)
+        filt_downsample = np.where(lags >= 0, h[np.maximum(lags, 0)], 0)
+
         dft = np.exp((2j * np.pi / self.f_s) * np.outer(self.dft_f_vec, n_vec))
-        P = np.square(np.abs(np.matmul(dft, data)))
-        idx_f = np.argmax(P)
-        dft_est = self.dft_f_vec[idx_f]
-        return P, dft_est, P[idx_f]
+        return dft @ filt_downsample
+
+    def power_spectrum(self, phi):
+        return np.square(np.abs(self.estimation_matrix @ phi))
 
     def noise_est(self, P):
         return np.mean(np.sort(P)[: (self.dft_points // 2) - 1])
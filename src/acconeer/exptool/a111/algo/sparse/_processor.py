@@ -1,9 +1,8 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
-import numpy as np
-
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 from acconeer.exptool.a111.algo.presence_detection_sparse import _processor as presence_processing
 
 
@@ -57,8 +56,10 @@ class Processor:
         except AssertionError:
             self.pd_processors = None
 
-        self.data_history = np.ones([history_len, num_sensors, num_depths]) * 2**15
-        self.presence_history = np.zeros([history_len, num_sensors, num_depths])
+        self.data_history = HistoryBuffer(
+            history_len, (num_sensors, num_depths), fill_value=2**15
+        )
+        self.presence_history = HistoryBuffer(history_len, (num_sensors, num_depths))
 
     def process(self, data, data_info):
         if self.pd_processors:
@@ -71,16 +72,14 @@ class Processor:
 
             presences = [d["depthwise_presence"] for d in processed_datas]
 
-            self.presence_history = np.roll(self.presence_history, -1, axis=0)
-            self.presence_history[-1] = presences
+            self.presence_history.push(presences)
 
-        self.data_history = np.roll(self.data_history, -1, axis=0)
-        self.data_history[-1] = data.mean(axis=1)
+        self.data_history.push(data.mean(axis=1))
 
         out_data = {
             "data": data,
-            "data_history": self.data_history,
-            "presence_history": self.presence_history,
+            "data_history": self.data_history.ordered,
+            "presence_history": self.presence_history.ordered,
         }
 
         return out_data
@@ -4,6 +4,7 @@
 import numpy as np
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 
 def get_sensor_config():
@@ -91,7 +92,7 @@ class Processor:
         self.num_depths = depths.size
 
         max_window_size = 2**ProcessingConfiguration.WINDOW_SIZE_POW_OF_2_MAX
-        self.sweep_history = np.full([max_window_size, self.num_depths], np.nan)
+        self.sweep_history = HistoryBuffer(max_window_size, self.num_depths, fill_value=np.nan)
 
         self.collapsed_asd = None
         self.collapsed_asd_history = None
@@ -116,11 +117,9 @@ class Processor:
         self.rolling_history_size = int(processing_config.rolling_history_size)
 
         if invalid:
-            self.collapsed_asd_history = np.zeros(
-                [
-                    ProcessingConfiguration.ROLLING_HISTORY_SIZE_MAX,
-                    self.window_size // 2,
-                ]
+            self.collapsed_asd_history = HistoryBuffer(
+                ProcessingConfiguration.ROLLING_HISTORY_SIZE_MAX,
+                self.window_size // 2,
             )
 
         if invalid and self.tick_idx > 0:
@@ -131,8 +130,7 @@ class Processor:
 
         mean_sweep = frame.mean(axis=0)
 
-        self.sweep_history = np.roll(self.sweep_history, -1, axis=0)
-        self.sweep_history[-1] = mean_sweep
+        self.sweep_history.push(mean_sweep)
 
         outdated = (self.tick_idx - self.last_update_tick) > self.frames_between_updates
         if self.tick_idx == 0 or outdated:
@@ -143,7 +141,7 @@ class Processor:
         return self.gather_result()
 
     def update_spect(self):
-        x = self.sweep_history[-self.window_size :]
+        x = self.sweep_history.ordered[-self.window_size :]
         x = x - np.nanmean(x, axis=0, keepdims=True)
         x = np.nan_to_num(x)
         fft = np.fft.rfft(x.T * np.hanning(x.shape[0]), axis=1)
@@ -152,8 +150,7 @@ class Processor:
         self.collapsed_asd = asd.sum(axis=0)
         self.dw_asd = asd
 
-        self.collapsed_asd_history = np.roll(self.collapsed_asd_history, -1, axis=0)
-        self.collapsed_asd_history[-1] = self.collapsed_asd
+        self.collapsed_asd_history.push(self.collapsed_asd)
 
         self.last_update_tick = self.tick_idx
 
@@ -165,11 +162,11 @@ class Processor:
             ts *= 1 / self.f
             fs *= 0.5 * self.f / fs[-1]
 
-        cropped_history = self.collapsed_asd_history[-self.rolling_history_size :]
+        cropped_history = self.collapsed_asd_history.ordered[-self.rolling_history_size :]
 
         return {
             "ts": ts,
-            "sweep_history": self.sweep_history[-self.window_size :],
+            "sweep_history": self.sweep_history.ordered[-self.window_size :],
             "fs": fs,
             "collapsed_asd": self.collapsed_asd,
             "collapsed_asd_history": cropped_history,
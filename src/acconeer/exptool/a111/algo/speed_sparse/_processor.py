@@ -4,15 +4,18 @@
 from enum import Enum
 
 import numpy as np
+import scipy.fft
 from scipy.signal.windows import hann
 
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 
 from .constants import EST_VEL_HISTORY_LENGTH, HALF_WAVELENGTH, HISTORY_LENGTH, NUM_SAVED_SEQUENCES
 
 
 SD_HISTORY_LENGTH = HISTORY_LENGTH  # s
 SEQUENCE_TIMEOUT_LENGTH = 0.5  # s
+FFT_BLOCK_SIZE = 2**15  # Max number of FFT output points per block of depths
 
 
 def get_sensor_config():
@@ -105,6 +108,19 @@ class ProcessingConfiguration(et.configbase.ProcessingConfig):
         order=13,
     )
 
+    fft_workers = et.configbase.IntParameter(
+        label="FFT workers",
+        default_value=1,
+        limits=(1, None),
+        updateable=False,
+        category=et.configbase.Category.ADVANCED,
+        help=(
+            "Number of threads computing the FFTs of a frame."
+            "\nMore threads may help with many depths and sweeps per frame."
+        ),
+        order=14,
+    )
+
     shown_speed_unit = et.configbase.EnumParameter(
         label="Speed unit",
         default_value=SpeedUnit.METER_PER_SECOND,
@@ -201,12 +217,37 @@ class Processor:
         est_frame_rate = sweep_rate / self.sweeps_per_frame
         self.depths = et.a111.get_range_depths(sensor_config, session_info)
 
-        if processing_config.processing_method == ProcessingConfiguration.ProcessingMethod.WELCH:
-            segment_length = 2 * self.sweeps_per_frame // (processing_config.num_segments + 1)
+        self.num_segments = processing_config.num_segments
+        self.processing_method = processing_config.processing_method
+        self.fft_workers = processing_config.fft_workers
+
+        if self.processing_method == ProcessingConfiguration.ProcessingMethod.WELCH:
+            # Overlap is 50% of the segment size
+            segment_length = 2 * self.sweeps_per_frame // (self.num_segments + 1)
+            segment_offsets = np.arange(self.num_segments) * segment_length // 2
+        else:
+            segment_length = self.sweeps_per_frame // self.num_segments
+            segment_offsets = np.arange(self.num_segments) * segment_length
+
+        # Sweep indexes of the segments, shaped (segment, sweep)
+        self.segment_indexes = segment_offsets[:, None] + np.arange(segment_length)
+
+        window = hann(segment_length, sym=False)
+        self.window_norm = np.sum(window**2)
+
+        if self.processing_method == ProcessingConfiguration.ProcessingMethod.WELCH:
+            self.window = window[:, None]
         else:
-            segment_length = self.sweeps_per_frame // processing_config.num_segments
+            self.window = None
 
         self.fft_length = segment_length * processing_config.fft_oversampling_factor
+        psd_length = self.fft_length // 2 + 1
+
+        # Normalization of the summed segment spectra, doubling all frequencies but DC and Nyquist
+        self.psd_scale = np.full((psd_length, 1), 2.0 / (self.num_segments * self.window_norm))
+        self.psd_scale[[0, -1]] /= 2
+
+        self.depths_per_block = max(1, FFT_BLOCK_SIZE // (self.num_segments * self.fft_length))
         self.num_noise_est_bins = 3
         noise_est_tc = 1.0
 
@@ -218,17 +259,14 @@ class Processor:
         self.bin_vs = self.bin_fs * HALF_WAVELENGTH
 
         num_bins = self.bin_fs.size
-        self.nasd_history = np.zeros([sd_history_size, num_bins])
-        self.est_vel_history = np.full(est_vel_history_size, np.nan)
-        self.belongs_to_last_sequence = np.zeros(est_vel_history_size, dtype=bool)
+        self.nasd_history = HistoryBuffer(sd_history_size, num_bins)
+        self.est_vel_history = HistoryBuffer(est_vel_history_size, fill_value=np.nan)
+        self.belongs_to_last_sequence = HistoryBuffer(est_vel_history_size, dtype=bool)
         self.noise_est = 0
         self.current_sequence_idle = self.sequence_timeout_count + 1
         self.sequence_vels = np.zeros(NUM_SAVED_SEQUENCES)
         self.update_idx = 0
 
-        self.num_segments = processing_config.num_segments
-        self.processing_method = processing_config.processing_method
-
         self.update_processing_config(processing_config)
 
     def update_processing_config(self, processing_config):
@@ -250,48 +288,26 @@ class Processor:
         # Basic speed estimate using Welch's method
 
         zero_mean_frame = frame - frame.mean(axis=0, keepdims=True)
-        psd_length = self.fft_length // 2 + 1
+        psds = np.empty((self.psd_scale.size, zero_mean_frame.shape[1]))
 
-        if self.processing_method == ProcessingConfiguration.ProcessingMethod.WELCH:
-            # Overlap is 50% of the segment size
-            segment_length = 2 * self.sweeps_per_frame // (self.num_segments + 1)
-        else:
-            segment_length = self.sweeps_per_frame // self.num_segments
+        # All segments of a block of depths at once, shaped (segment, sweep, depth). The blocks
+        # are kept small enough for the FFTs to stay in cache.
+        for start in range(0, zero_mean_frame.shape[1], self.depths_per_block):
+            block = slice(start, start + self.depths_per_block)
+            segments = zero_mean_frame[self.segment_indexes, block]
 
-        window = hann(segment_length, sym=False)
-        window_norm = np.sum(window**2)
-
-        fft_segments = np.empty((self.num_segments, psd_length, len(self.depths)))
-
-        for i in range(self.num_segments):
-            if self.processing_method == ProcessingConfiguration.ProcessingMethod.WELCH:
-                offset_segment = i * segment_length // 2
-            else:
-                offset_segment = i * segment_length
-
-            current_segment = zero_mean_frame[offset_segment : offset_segment + segment_length]
-
-            if self.processing_method == ProcessingConfiguration.ProcessingMethod.WELCH:
-                current_segment = current_segment * window[:, None]
-
-            fft_segments[i] = (
-                np.square(
-                    np.abs(
-                        np.fft.rfft(
-                            current_segment,
-                            self.fft_length,
-                            axis=0,
-                        )
-                    )
-                )
-                / window_norm
-            )  # rfft automatically pads if n<nfft
+            if self.window is not None:
+                segments *= self.window
 
-        # Add FFTs of different segments and average to decrease FFT variance
+            # rfft automatically pads if n<nfft
+            spectra = scipy.fft.rfft(segments, self.fft_length, axis=1, workers=self.fft_workers)
+            power = np.abs(spectra)
+            np.square(power, out=power)
 
-        psds = np.mean(fft_segments, axis=0)
+            # Add FFTs of different segments and average to decrease FFT variance
+            np.sum(power, axis=0, out=psds[:, block])
 
-        psds[1 : psd_length - 1] *= 2  # Double frequencies except DC and Nyquist
+        psds *= self.psd_scale
 
         psd = np.max(psds, axis=1)  # Power Spectral Density
         asd = np.sqrt(psd)  # Amplitude Spectral Density
@@ -315,36 +331,36 @@ class Processor:
 
         # Sequence
 
-        self.belongs_to_last_sequence = np.roll(self.belongs_to_last_sequence, -1)
-
         if np.isnan(est_vel):
             self.current_sequence_idle += 1
+
+            # Like rolling the history without setting the newest value
+            self.belongs_to_last_sequence.push(self.belongs_to_last_sequence.ordered[0])
         else:
             if self.current_sequence_idle > self.sequence_timeout_count:
                 self.sequence_vels = np.roll(self.sequence_vels, -1)
                 self.sequence_vels[-1] = est_vel
-                self.belongs_to_last_sequence[:] = False
+                self.belongs_to_last_sequence.fill(False)
 
             self.current_sequence_idle = 0
-            self.belongs_to_last_sequence[-1] = True
+            self.belongs_to_last_sequence.push(True)
 
             if est_vel > self.sequence_vels[-1]:
                 self.sequence_vels[-1] = est_vel
 
         # Data for plots
 
-        self.est_vel_history = np.roll(self.est_vel_history, -1, axis=0)
-        self.est_vel_history[-1] = est_vel
+        self.est_vel_history.push(est_vel)
+        est_vel_history = self.est_vel_history.ordered
 
-        if np.all(np.isnan(self.est_vel_history)):
+        if np.all(np.isnan(est_vel_history)):
             output_vel = None
         else:
-            output_vel = np.nanmax(self.est_vel_history)
+            output_vel = np.nanmax(est_vel_history)
 
-        self.nasd_history = np.roll(self.nasd_history, -1, axis=0)
-        self.nasd_history[-1] = nasd
+        self.nasd_history.push(nasd)
 
-        nasd_temporal_max = np.max(self.nasd_history, axis=0)
+        nasd_temporal_max = np.max(self.nasd_history.ordered, axis=0)
 
         temporal_max_threshold = self.threshold
 
@@ -355,8 +371,8 @@ class Processor:
             "nasd": nasd,
             "nasd_temporal_max": nasd_temporal_max,
             "temporal_max_threshold": temporal_max_threshold,
-            "vel_history": self.est_vel_history,
+            "vel_history": est_vel_history,
             "vel": output_vel,
             "sequence_vels": self.sequence_vels,
-            "belongs_to_last_sequence": self.belongs_to_last_sequence,
+            "belongs_to_last_sequence": self.belongs_to_last_sequence.ordered,
         }
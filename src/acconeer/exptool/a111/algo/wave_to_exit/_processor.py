@@ -1,9 +1,8 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
-import numpy as np
-
 import acconeer.exptool as et
+from acconeer.exptool._algo_utils import HistoryBuffer
 from acconeer.exptool.a111.algo import presence_detection_sparse
 
 
@@ -100,7 +99,7 @@ class Processor:
         self.update_rate = sensor_config.update_rate
 
         history_length = int(processing_config.history_length_s * sensor_config.update_rate)
-        self.detection_history = np.zeros(history_length)
+        self.detection_history = HistoryBuffer(history_length)
 
         self.cool_trig = True
         self.cool_time = True
@@ -135,8 +134,7 @@ class Processor:
                 self.cool_time = True
 
         presence_result["detection"] = button_press
-        self.detection_history = np.roll(self.detection_history, -1)
-        self.detection_history[-1] = button_press
-        presence_result["detection_history"] = self.detection_history
+        self.detection_history.push(button_press)
+        presence_result["detection_history"] = self.detection_history.ordered
 
         return presence_result
@@ -5,11 +5,14 @@ from __future__ import annotations
 
 import copy
 import datetime
+import io
 import json
+import struct
 import time
 import warnings
+import zipfile
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
 
 import attr
 import h5py
@@ -65,6 +68,38 @@ class Record:
         return _configs.load(self.sensor_config_dump, self.mode)
 
 
+def _create_record(
+    mode: _modes.Mode,
+    sensor_config: configbase.SensorConfig,
+    session_info: dict,
+    module_key: Optional[str],
+    processing_config: Optional[configbase.ProcessingConfig],
+    rss_version: Optional[str],
+) -> Record:
+    """Creates a record without data, validating the configs"""
+
+    if not isinstance(sensor_config, configbase.SensorConfig):
+        raise TypeError("Unexpected sensor config type")
+
+    if isinstance(processing_config, configbase.ProcessingConfig):
+        processing_config_dump = processing_config._dumps()
+    elif processing_config is None:
+        processing_config_dump = None
+    else:
+        raise TypeError("Unexpected processing config type")
+
+    return Record(
+        mode=mode,
+        sensor_config_dump=sensor_config._dumps(),
+        session_info=copy.deepcopy(session_info),
+        module_key=module_key,
+        processing_config_dump=processing_config_dump,
+        rss_version=rss_version,
+        lib_version=et.__version__,
+        timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
+    )
+
+
 class Recorder:
     def __init__(self, **kwargs):
         sensor_config = kwargs.pop("sensor_config")
@@ -82,27 +117,9 @@ class Recorder:
             msg = "Recorder got an unexpected keyword argument '{}'".format(key)
             raise TypeError(msg)
 
-        if not isinstance(sensor_config, configbase.SensorConfig):
-            raise TypeError("Unexpected sensor config type")
-
-        if isinstance(processing_config, configbase.ProcessingConfig):
-            processing_config_dump = processing_config._dumps()
-        elif processing_config is None:
-            processing_config_dump = None
-        else:
-            raise TypeError("Unexpected processing config type")
-
-        self.record = Record(
-            mode=mode,
-            sensor_config_dump=sensor_config._dumps(),
-            session_info=copy.deepcopy(session_info),
-            module_key=module_key,
-            processing_config_dump=processing_config_dump,
-            rss_version=rss_version,
-            lib_version=et.__version__,
-            timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
+        self.record = _create_record(
+            mode, sensor_config, session_info, module_key, processing_config, rss_version
         )
-
         self.record.data = []
         self.record.sample_times = []
 
@@ -129,6 +146,341 @@ class Recorder:
         return self.record
 
 
+class RingBufferRecorder:
+    """Recorder keeping the last ``max_len`` frames, e.g. as a "last N seconds" flight recorder
+
+    Unlike :class:`Recorder` with ``max_len`` set, the storage is preallocated from the session
+    info and nothing is allocated, copied around or evicted per frame. The data info is stored
+    as a structured array with one field per key of the first sampled data info. Keys not
+    present in it are not recorded.
+
+    Every frame is written twice, in a buffer of length ``2 * max_len``, so that the last
+    ``max_len`` frames are always contiguous. :meth:`snapshot` can therefore return views of
+    the data, data info and sample times without copying.
+    """
+
+    def __init__(
+        self,
+        *,
+        sensor_config: configbase.SensorConfig,
+        session_info: dict,
+        max_len: int,
+        module_key: Optional[str] = None,
+        processing_config: Optional[configbase.ProcessingConfig] = None,
+        rss_version: Optional[str] = None,
+        mode: Optional[_modes.Mode] = None,
+    ) -> None:
+        if max_len < 1:
+            raise ValueError("max_len must be at least 1")
+
+        if mode is None:
+            mode = sensor_config.mode
+
+        self.max_len = max_len
+        self.record = _create_record(
+            mode, sensor_config, session_info, module_key, processing_config, rss_version
+        )
+
+        num_sensors = len(sensor_config.sensor)
+        frame_shape = get_frame_shape(mode, sensor_config, session_info)
+        dtype = complex if mode == _modes.Mode.IQ else float
+
+        self._data = np.zeros((2 * max_len, num_sensors) + frame_shape, dtype=dtype)
+        self._sample_times = np.zeros(2 * max_len)
+        self._data_info: Optional[np.ndarray] = None
+        self._num_sampled = 0
+
+    def __len__(self) -> int:
+        return min(self._num_sampled, self.max_len)
+
+    @property
+    def num_sampled(self) -> int:
+        """Total number of sampled frames, including the ones no longer kept"""
+        return self._num_sampled
+
+    def sample(self, data_info: list, data: np.ndarray) -> None:
+        if data.ndim != self._data.ndim - 1:  # then assume data is squeezed
+            data = data[None, ...]
+            data_info = [data_info]
+
+        if self._data_info is None:
+            self._data_info = self._allocate_data_info(data_info)
+
+        i = self._num_sampled % self.max_len
+        sample_time = time.time()
+        names = self._data_info.dtype.names
+        data_info_row = np.array(
+            [
+                tuple(sensor_data_info.get(name, 0) for name in names)
+                for sensor_data_info in data_info
+            ],
+            dtype=self._data_info.dtype,
+        )
+
+        for j in (i, i + self.max_len):
+            self._data[j] = data
+            self._data_info[j] = data_info_row
+            self._sample_times[j] = sample_time
+
+        self._num_sampled += 1
+
+    def _allocate_data_info(self, data_info: list) -> np.ndarray:
+        # The field types are inferred from the values, e.g. bool for data_saturated
+        dtype = np.dtype([(key, np.asarray(value).dtype) for key, value in data_info[0].items()])
+        return np.zeros((2 * self.max_len, len(data_info)), dtype=dtype)
+
+    def _window(self) -> slice:
+        if self._num_sampled <= self.max_len:
+            return slice(0, self._num_sampled)
+
+        start = self._num_sampled % self.max_len
+        return slice(start, start + self.max_len)
+
+    @property
+    def data_info_columns(self) -> Optional[np.ndarray]:
+        """The data info of the kept frames as a structured array view, oldest first
+
+        The shape is ``(frames, sensors)`` with one field per data info key.
+        """
+        if self._data_info is None:
+            return None
+
+        return self._data_info[self._window()]
+
+    def snapshot(self, copy: bool = False) -> Record:
+        """Gets a record of the kept frames, oldest first
+
+        The data, data info and sample times are views into the ring buffer, valid until the
+        next call to :meth:`sample`, unless ``copy`` is set. The data info is a sequence over
+        :attr:`data_info_columns`, which converts frames to dicts only when accessed, e.g. when
+        the record is saved.
+        """
+        window = self._window()
+        data = self._data[window]
+        sample_times = self._sample_times[window]
+        data_info_columns = self.data_info_columns
+
+        if copy:
+            data = data.copy()
+            sample_times = sample_times.copy()
+
+            if data_info_columns is not None:
+                data_info_columns = data_info_columns.copy()
+
+        data_info: Sequence = []
+        if data_info_columns is not None:
+            data_info = _DataInfoColumns(data_info_columns)
+
+        return attr.evolve(
+            self.record,
+            data=data,
+            data_info=data_info,
+            sample_times=sample_times,
+        )
+
+    def close(self) -> Record:
+        self.record = self.snapshot()
+        return self.record
+
+
+class _DataInfoColumns(Sequence):
+    """The data info of a :class:`RingBufferRecorder` snapshot, converted when accessed"""
+
+    def __init__(self, columns: np.ndarray) -> None:
+        self.columns = columns
+
+    def _convert(self, row: np.ndarray) -> list:
+        names = row.dtype.names
+        return [dict(zip(names, values)) for values in row.tolist()]
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice):
+            return [self._convert(row) for row in self.columns[key]]
+
+        return self._convert(self.columns[key])
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __eq__(self, other: Any) -> bool:
+        return list(self) == list(other)
+
+
+def get_frame_shape(
+    mode: _modes.Mode, sensor_config: configbase.SensorConfig, session_info: dict
+) -> tuple[int, ...]:
+    """Gets the shape of the data of a single sensor in a frame"""
+
+    if mode == _modes.Mode.SPARSE:
+        sweeps_per_frame = sensor_config.sweeps_per_frame
+        return (sweeps_per_frame, session_info["data_length"] // sweeps_per_frame)
+    elif mode == _modes.Mode.POWER_BINS:
+        return (session_info["bin_count"],)
+    else:
+        return (session_info["data_length"],)
+
+
+class H5Recorder:
+    """Recorder writing frames to an HDF5 file as they arrive
+
+    The file has the same layout as the ones written by :func:`save_h5`, and is read with
+    :func:`load`. Frames are buffered and written, compressed, ``chunk_size`` at a time, so the
+    memory use does not grow with the session length. The data info of every frame is written
+    along with the data and is joined into the ``data_info`` dataset when closing.
+
+    If the recorder is never closed, e.g. after a crash, the frames written so far can still be
+    loaded. The file is flushed after every chunk, so at most ``chunk_size`` frames are lost.
+
+    Like :func:`pack`, real data is stored as 16 bit unsigned integers while all frames are
+    representable as such.
+    """
+
+    _DATA_INFO_ROWS_KEY = "data_info_rows"
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        *,
+        sensor_config: configbase.SensorConfig,
+        session_info: dict,
+        module_key: Optional[str] = None,
+        processing_config: Optional[configbase.ProcessingConfig] = None,
+        rss_version: Optional[str] = None,
+        mode: Optional[_modes.Mode] = None,
+        chunk_size: int = 64,
+        compression: Optional[str] = "gzip",
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        if mode is None:
+            mode = sensor_config.mode
+
+        filename = str(filename)
+        if not filename.lower().endswith(".h5"):
+            filename = filename + ".h5"
+
+        record = _create_record(
+            mode, sensor_config, session_info, module_key, processing_config, rss_version
+        )
+
+        num_sensors = len(sensor_config.sensor)
+        frame_shape = (num_sensors,) + get_frame_shape(mode, sensor_config, session_info)
+        dtype = complex if mode == _modes.Mode.IQ else float
+
+        self.filename = filename
+        self._chunk_size = chunk_size
+        self._compression = compression
+        self._buffer = np.zeros((chunk_size,) + frame_shape, dtype=dtype)
+        self._buffered_sample_times = np.zeros(chunk_size)
+        self._buffered_data_info: list[str] = []
+        self._num_written = 0
+
+        self.file = h5py.File(filename, "w")
+
+        str_dtype = h5py.special_dtype(vlen=str)
+        for k, v in _pack_strings(record).items():
+            self.file.create_dataset(k, data=v, dtype=str_dtype)
+
+        # All datasets are created up front, so that the file can be loaded before the first
+        # chunk is written. Real data is stored as u16 until a frame is not representable as such.
+        self._data = self._create_appendable(
+            "data", frame_shape, "u2" if dtype is float else dtype
+        )
+        self._sample_times = self._create_appendable("sample_times", (), float)
+        self._data_info_rows = self._create_appendable(self._DATA_INFO_ROWS_KEY, (), str_dtype)
+
+    def _create_appendable(self, name: str, shape: tuple[int, ...], dtype: Any) -> h5py.Dataset:
+        return self.file.create_dataset(
+            name,
+            shape=(0,) + shape,
+            maxshape=(None,) + shape,
+            chunks=(self._chunk_size,) + shape,
+            dtype=dtype,
+            compression=self._compression if shape else None,
+        )
+
+    def __enter__(self) -> H5Recorder:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @property
+    def num_frames(self) -> int:
+        return self._num_written + len(self._buffered_data_info)
+
+    def sample(self, data_info: list, data: np.ndarray) -> None:
+        if data.ndim != self._buffer.ndim - 1:  # then assume data is squeezed
+            data = data[None, ...]
+            data_info = [data_info]
+
+        i = len(self._buffered_data_info)
+        self._buffer[i] = data
+        self._buffered_sample_times[i] = time.time()
+        self._buffered_data_info.append(json.dumps(data_info))
+
+        if len(self._buffered_data_info) == self._chunk_size:
+            self._write_buffered()
+
+    def _write_buffered(self) -> None:
+        n = len(self._buffered_data_info)
+        if n == 0:
+            return
+
+        data = self._buffer[:n]
+
+        if self._data.dtype == np.dtype("u2") and not _is_u16(data):
+            self._data = self._promote_data()
+
+        start = self._num_written
+        end = start + n
+
+        for dataset in [self._data, self._sample_times, self._data_info_rows]:
+            dataset.resize(end, axis=0)
+
+        self._data[start:end] = data
+        self._sample_times[start:end] = self._buffered_sample_times[:n]
+        self._data_info_rows[start:end] = self._buffered_data_info
+
+        self._num_written = end
+        self._buffered_data_info = []
+        self.file.flush()
+
+    def _promote_data(self) -> h5py.Dataset:
+        """Rewrites the data written as u16 as floats, chunk by chunk"""
+        promoted = self._create_appendable("promoted_data", self._data.shape[1:], float)
+        promoted.resize(len(self._data), axis=0)
+
+        for start in range(0, len(self._data), self._chunk_size):
+            end = start + self._chunk_size
+            promoted[start:end] = self._data[start:end]
+
+        del self.file["data"]
+        self.file.move("promoted_data", "data")
+        return self.file["data"]
+
+    def flush(self) -> None:
+        """Writes the buffered frames without waiting for a full chunk"""
+        self._write_buffered()
+
+    def close(self) -> None:
+        if not self.file:
+            return
+
+        self._write_buffered()
+
+        data_info_rows = self._data_info_rows.asstr()[()]
+        self.file.create_dataset(
+            "data_info",
+            data="[" + ",".join(data_info_rows) + "]",
+            dtype=h5py.special_dtype(vlen=str),
+        )
+        del self.file[self._DATA_INFO_ROWS_KEY]
+
+        self.file.close()
+
+
 def save(filename: Union[str, Path], record: Record):
     filename = str(filename)
 
@@ -142,17 +494,26 @@ def save(filename: Union[str, Path], record: Record):
         raise ValueError("Unknown file format")
 
 
-def pack(record: Record) -> dict:
+def _pack_strings(record: Record) -> dict:
+    """Packs the string fields, i.e. everything but the data, data info and sample times"""
+
     packed = attr.asdict(record, filter=lambda attr, v: attr.type in (str, Optional[str]))
     packed["mode"] = record.mode.name.lower()
     packed["session_info"] = json.dumps(record.session_info)
-    packed["data_info"] = json.dumps(record.data_info)
+    return {k: v for k, v in packed.items() if v is not None}
 
-    data = np.array(record.data)
-    if np.isrealobj(data):
-        data_u16 = data.astype("u2")
-        if np.all(data == data_u16):
-            data = data_u16
+
+def _is_u16(data: np.ndarray) -> bool:
+    return bool(np.all(data == data.astype("u2")))
+
+
+def pack(record: Record) -> dict:
+    packed = _pack_strings(record)
+    packed["data_info"] = json.dumps(list(record.data_info))
+
+    data = np.asarray(record.data)
+    if np.isrealobj(data) and _is_u16(data):
+        data = data.astype("u2")
 
     packed["data"] = data
 
@@ -208,13 +569,19 @@ def load(filename: Union[str, Path]) -> Record:
 
 
 def unpack(packed: dict) -> Record:
-    kwargs = {}
-
     data = packed["data"]
     if np.isrealobj(data):
         data = data.astype("float")
 
-    kwargs["data"] = data
+    data_info = json.loads(packed["data_info"])
+
+    assert len(data) == len(data_info)
+
+    return Record(**_unpack_kwargs(packed, data=data, data_info=data_info))
+
+
+def _unpack_kwargs(packed: dict, **kwargs: Any) -> dict:
+    """Unpacks everything but the data and data info, which are passed as is"""
 
     for a in attr.fields(Record):
         k = a.name
@@ -232,13 +599,9 @@ def unpack(packed: dict) -> Record:
     kwargs["mode"] = mode
 
     kwargs["session_info"] = json.loads(packed["session_info"])
-    kwargs["data_info"] = json.loads(packed["data_info"])
-
     kwargs["sample_times"] = packed.get("sample_times", None)
 
-    assert len(kwargs["data"]) == len(kwargs["data_info"])
-
-    return Record(**kwargs)
+    return kwargs
 
 
 def load_npz(filename: Union[str, Path]) -> Record:
@@ -259,13 +622,245 @@ def load_h5(filename: Union[str, Path]) -> Record:
     filename = str(filename)
 
     with h5py.File(filename, "r") as f:
-        packed = {k: v[()] for k, v in f.items()}
+        packed = _read_h5(f, skip=[])
+        packed["data_info"] = _read_h5_data_info(f)
+
+    return unpack(packed)
+
 
-    for k, v in packed.items():
+def _read_h5(f: h5py.File, skip: list[str]) -> dict:
+    packed = {}
+    for k, v in f.items():
+        if k in skip or k in ["data_info", H5Recorder._DATA_INFO_ROWS_KEY]:
+            continue
+
+        v = v[()]
         if isinstance(v, bytes):
-            packed[k] = v.decode()
+            v = v.decode()
 
-    return unpack(packed)
+        packed[k] = v
+
+    return packed
+
+
+def _read_h5_data_info(f: h5py.File) -> str:
+    if "data_info" not in f and H5Recorder._DATA_INFO_ROWS_KEY in f:
+        # Written by an H5Recorder which was never closed
+        data_info_rows = f[H5Recorder._DATA_INFO_ROWS_KEY].asstr()[()]
+        return "[" + ",".join(data_info_rows) + "]"
+
+    data_info = f["data_info"][()]
+    return data_info.decode() if isinstance(data_info, bytes) else data_info
+
+
+class _LazyFrames:
+    """The frames of a record on file, read and converted to float when indexed
+
+    Integer indexes are read a block at a time, so that iterating over the frames one by one
+    does not decompress the same chunk of an HDF5 dataset over and over.
+    """
+
+    def __init__(self, source: Union[h5py.Dataset, np.ndarray]) -> None:
+        self._source = source
+        self._is_real = not np.issubdtype(source.dtype, np.complexfloating)
+
+        chunks = getattr(source, "chunks", None)
+        self._block_size = chunks[0] if chunks else 1
+        self._block_start: Optional[int] = None
+        self._block: Optional[np.ndarray] = None
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(self._source.shape)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(float) if self._is_real else self._source.dtype
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def _convert(self, frames: np.ndarray) -> np.ndarray:
+        frames = np.asarray(frames)
+        return frames.astype(float) if self._is_real else frames
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if isinstance(key, (int, np.integer)) and self._block_size > 1:
+            return self._get_frame(int(key))
+
+        return self._convert(self._source[key])
+
+    def _get_frame(self, index: int) -> np.ndarray:
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+
+        block_start = index - index % self._block_size
+        if block_start != self._block_start:
+            block_end = block_start + self._block_size
+            self._block = self._convert(self._source[block_start:block_end])
+            self._block_start = block_start
+
+        assert self._block is not None
+        return self._block[index - block_start].copy()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype: Any = None) -> np.ndarray:
+        frames = self[...]
+        return frames if dtype is None else frames.astype(dtype)
+
+
+class _LazyDataInfo(Sequence):
+    """The data info of a record on file, decoded when first accessed"""
+
+    def __init__(self, read: Callable[[], str]) -> None:
+        self._read = read
+        self._data_info: Optional[list] = None
+
+    def _get(self) -> list:
+        if self._data_info is None:
+            self._data_info = json.loads(self._read())
+
+        return self._data_info
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._get()[key]
+
+    def __len__(self) -> int:
+        return len(self._get())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._get() == list(other)
+
+
+@attr.s
+class PersistentRecord(Record):
+    """A record returned by :func:`open`, reading its data from file when accessed
+
+    ``data`` can be indexed and sliced like an array, e.g. ``record.data[100:200]``, and
+    reads and converts only the requested frames to float. ``data_info`` is decoded when first
+    accessed. Use as a context manager, or call :meth:`close`, to close the file.
+    """
+
+    file = attr.ib(default=None, repr=False)
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+    def __enter__(self) -> PersistentRecord:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+def open(filename: Union[str, Path]) -> PersistentRecord:
+    """Opens a record without loading its data into memory
+
+    HDF5 files are kept open. The data of uncompressed npz files is memory mapped, while that
+    of compressed ones (as written by :func:`save_npz`) is loaded as stored, i.e. without the
+    conversion to float.
+    """
+    filename = str(filename)
+
+    if filename.lower().endswith(".h5"):
+        return open_h5(filename)
+    elif filename.lower().endswith(".npz"):
+        return open_npz(filename)
+    else:
+        raise ValueError("Unknown file format")
+
+
+def open_h5(filename: Union[str, Path]) -> PersistentRecord:
+    f = h5py.File(str(filename), "r")
+
+    try:
+        packed = _read_h5(f, skip=["data"])
+        kwargs = _unpack_kwargs(
+            packed,
+            data=_LazyFrames(f["data"]),
+            data_info=_LazyDataInfo(lambda: _read_h5_data_info(f)),
+        )
+    except Exception:
+        f.close()
+        raise
+
+    return PersistentRecord(**kwargs, file=f)
+
+
+def open_npz(filename: Union[str, Path]) -> PersistentRecord:
+    filename = str(filename)
+
+    packed = {}
+    with np.load(filename, allow_pickle=False) as f:
+        for k in f.files:
+            if k == "data":
+                continue
+
+            v = f[k]
+            if v.dtype.type is np.unicode_:
+                v = str(v)
+
+            packed[k] = v
+
+        data = _memmap_npz_member(filename, "data.npy")
+        if data is None:
+            data = f["data"]
+
+    data_info = packed["data_info"]
+    kwargs = _unpack_kwargs(
+        packed,
+        data=_LazyFrames(data),
+        data_info=_LazyDataInfo(lambda: data_info),
+    )
+    return PersistentRecord(**kwargs)
+
+
+def _memmap_npz_member(filename: str, name: str) -> Optional[np.memmap]:
+    """Memory maps an uncompressed array in an npz file, returns ``None`` if compressed"""
+
+    with zipfile.ZipFile(filename) as zip_file:
+        info = zip_file.getinfo(name)
+
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    with io.open(filename, "rb") as f:
+        # The member data follows its local file header, which has variable length fields
+        f.seek(info.header_offset)
+        local_header = f.read(30)
+        name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+        offset = f.tell()
+
+    if np.prod(shape) == 0:
+        return np.zeros(shape, dtype=dtype)
+
+    return np.memmap(
+        filename,
+        dtype=dtype,
+        mode="r",
+        shape=shape,
+        order="F" if fortran_order else "C",
+        offset=offset,
+    )
 
 
 if __name__ == "__main__":
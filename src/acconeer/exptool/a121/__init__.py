@@ -7,6 +7,7 @@ from ._cli import ExampleArgumentParser, get_client_args
 from ._core import (
     _H5PY_STR_DTYPE,
     PRF,
+    AsyncClient,
     Client,
     ClientError,
     ClientInfo,
@@ -14,8 +15,11 @@ from ._core import (
     H5Recorder,
     IdleState,
     InMemoryRecord,
+    LatencyMonitor,
+    LatencyStats,
     Metadata,
     PersistentRecord,
+    PrefetchStats,
     Profile,
     Record,
     Recorder,
@@ -36,5 +40,5 @@ from ._core import (
     save_record,
     save_record_to_h5,
 )
-from ._core_ext import _ReplayingClient, _StopReplay
+from ._core_ext import _ReplayingClient, _SimulatedExplorationServer, _StopReplay
 from ._perf_calc import _PerformanceCalc
@@ -0,0 +1,453 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+"""Benchmarks of the a121 streaming, recording and processing pipeline
+
+Run with ``python -m acconeer.exptool.a121._bench``. Each benchmark is run for every
+combination of ``sweeps_per_frame``, ``num_points`` and number of subsweeps, and the timings are
+written as JSON, to be compared between releases with ``--compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import sys
+import tempfile
+import timeit
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+import attrs
+import h5py
+import importlib_metadata
+import numpy as np
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core.peripherals.communication.exploration_protocol import (
+    ExplorationProtocol,
+)
+from acconeer.exptool.a121._core_ext._simulated_server import _synthetic_frames, simulate_metadata
+from acconeer.exptool.a121.algo import distance, presence, sparse_iq, virtual_button
+
+
+SCHEMA_VERSION = 1
+
+SWEEPS_PER_FRAME = (1, 16, 64)
+NUM_POINTS = (20, 160)
+NUM_SUBSWEEPS = (1, 4)
+
+_QUICK_SWEEPS_PER_FRAME = (16,)
+_QUICK_NUM_POINTS = (160,)
+_QUICK_NUM_SUBSWEEPS = (1,)
+
+_TICKS_PER_SECOND = 1000000
+_NUM_RECORDED_FRAMES = 100
+_SERVER_INFO = a121.ServerInfo(
+    rss_version=f"a121-v{a121.SDK_VERSION}",
+    sensor_count=1,
+    ticks_per_second=_TICKS_PER_SECOND,
+    sensor_infos={1: a121.SensorInfo(connected=True)},
+    hardware_name="benchmark",
+)
+
+
+@attrs.frozen(kw_only=True)
+class BenchmarkCase:
+    """The session a benchmark is run with"""
+
+    sweeps_per_frame: int = attrs.field()
+    num_points: int = attrs.field()
+    num_subsweeps: int = attrs.field()
+
+    @property
+    def sensor_config(self) -> a121.SensorConfig:
+        return a121.SensorConfig(
+            sweeps_per_frame=self.sweeps_per_frame,
+            sweep_rate=1000.0,
+            frame_rate=10.0,
+            subsweeps=[
+                a121.SubsweepConfig(
+                    start_point=80 + i * self.num_points,
+                    num_points=self.num_points,
+                    phase_enhancement=True,
+                )
+                for i in range(self.num_subsweeps)
+            ],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return attrs.asdict(self)
+
+
+@attrs.frozen(kw_only=True)
+class BenchmarkResult:
+    """Timings of a benchmark, in seconds per iteration"""
+
+    name: str = attrs.field()
+    params: dict[str, Any] = attrs.field()
+    number: int = attrs.field()
+    """Number of iterations per timed round"""
+    min: float = attrs.field()
+    median: float = attrs.field()
+    mean: float = attrs.field()
+
+    @property
+    def rate(self) -> float:
+        """Iterations per second, based on the median"""
+        return 1.0 / self.median
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(attrs.asdict(self), rate=self.rate)
+
+
+class _SessionData:
+    """Metadata, encoded data packages and decoded results of a single sensor session"""
+
+    def __init__(self, case: BenchmarkCase) -> None:
+        self.sensor_config = case.sensor_config
+        self.session_config = a121.SessionConfig(self.sensor_config, extended=True)
+        self.metadata = simulate_metadata(self.sensor_config)
+        self.extended_metadata = [{1: self.metadata}]
+        # Decodes the headers like the Client does, with the session's decoder
+        self.header_decoder = ExplorationProtocol.get_next_header_decoder(
+            extended_metadata=self.extended_metadata, ticks_per_second=_TICKS_PER_SECOND
+        )
+
+        frames = _synthetic_frames(self.metadata, seed=0)
+        self.payloads = [frame.tobytes() for frame in frames]
+        self.headers = [self._header(i, len(payload)) for i, payload in enumerate(self.payloads)]
+        self.extended_results = [self.decode(i) for i in range(len(frames))]
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def close(self) -> None:
+        self._tmp_dir.cleanup()
+
+    @property
+    def record_path(self) -> Path:
+        return Path(self._tmp_dir.name) / "record.h5"
+
+    @staticmethod
+    def _header(tick: int, payload_size: int) -> bytes:
+        result_info = dict(
+            tick=tick,
+            data_saturated=False,
+            frame_delayed=False,
+            calibration_needed=False,
+            temperature=25,
+        )
+        header = {"status": "ok", "result_info": [[result_info]], "payload_size": payload_size}
+        return json.dumps(header, separators=(",", ":")).encode()
+
+    def decode_header(self, i: int) -> list[dict[int, a121.Result]]:
+        _, partial_results = self.header_decoder(self.headers[i])
+        return partial_results
+
+    def decode(self, i: int) -> list[dict[int, a121.Result]]:
+        return ExplorationProtocol.get_next_payload(self.payloads[i], self.decode_header(i))
+
+    def results(self) -> Iterator[a121.Result]:
+        return itertools.cycle(extended_result[0][1] for extended_result in self.extended_results)
+
+    def create_recorder(self, path_or_file: Union[Path, h5py.File]) -> a121.H5Recorder:
+        recorder = a121.H5Recorder(path_or_file, mode="w")
+        recorder._start(
+            client_info=a121.ClientInfo(),
+            extended_metadata=self.extended_metadata,
+            server_info=_SERVER_INFO,
+            session_config=self.session_config,
+        )
+        return recorder
+
+    def write_record(self, path_or_file: Union[Path, h5py.File]) -> None:
+        recorder = self.create_recorder(path_or_file)
+        for i in range(_NUM_RECORDED_FRAMES):
+            recorder._sample(self.extended_results[i % len(self.extended_results)])
+        recorder._stop()
+
+
+def _in_memory_h5_file() -> h5py.File:
+    return h5py.File(f"{uuid.uuid4()}.h5", "w", driver="core", backing_store=False)
+
+
+def _cycle(func: Callable[[int], Any], n: int) -> Callable[[], Any]:
+    counter = itertools.count()
+
+    def run() -> None:
+        func(next(counter) % n)
+
+    return run
+
+
+def bench_get_next_header(data: _SessionData) -> Callable[[], Any]:
+    return _cycle(data.decode_header, len(data.headers))
+
+
+def bench_get_next_payload(data: _SessionData) -> Callable[[], Any]:
+    partial_results = [data.decode_header(i) for i in range(len(data.headers))]
+
+    def decode(i: int) -> None:
+        ExplorationProtocol.get_next_payload(data.payloads[i], partial_results[i])
+
+    return _cycle(decode, len(partial_results))
+
+
+def bench_h5_recorder_sample(data: _SessionData) -> Callable[[], Any]:
+    recorder = data.create_recorder(_in_memory_h5_file())
+    return _cycle(lambda i: recorder._sample(data.extended_results[i]), len(data.extended_results))
+
+
+def bench_h5_record_iteration(data: _SessionData) -> Callable[[], Any]:
+    """Per frame, iterating over a record of ``_NUM_RECORDED_FRAMES`` frames"""
+    file = _in_memory_h5_file()
+    data.write_record(file)
+    record = a121.H5Record(file)
+
+    def iterate() -> None:
+        for _ in record.extended_results:
+            pass
+
+    return iterate
+
+
+def bench_load_record(data: _SessionData) -> Callable[[], Any]:
+    """Per frame, loading a record of ``_NUM_RECORDED_FRAMES`` frames"""
+    data.write_record(data.record_path)
+    return lambda: a121.load_record(data.record_path)
+
+
+def _processor_benchmark(
+    create_processor: Callable[[_SessionData], Any], *, single_subsweep: bool = False
+) -> Callable[[_SessionData], Callable[[], Any]]:
+    def bench(data: _SessionData) -> Callable[[], Any]:
+        if single_subsweep and data.sensor_config.num_subsweeps > 1:
+            raise ValueError("Multiple subsweeps are not supported")
+
+        processor = create_processor(data)
+        results = data.results()
+        return lambda: processor.process(next(results))
+
+    return bench
+
+
+BENCHMARKS: dict[str, tuple[Callable[[_SessionData], Callable[[], Any]], int]] = {
+    "protocol.get_next_header": (bench_get_next_header, 1),
+    "protocol.get_next_payload": (bench_get_next_payload, 1),
+    "h5_recorder.sample": (bench_h5_recorder_sample, 1),
+    "h5_record.iterate": (bench_h5_record_iteration, _NUM_RECORDED_FRAMES),
+    "load_record": (bench_load_record, _NUM_RECORDED_FRAMES),
+    "processor.sparse_iq": (
+        _processor_benchmark(
+            lambda data: sparse_iq.Processor(
+                sensor_config=data.sensor_config,
+                metadata=data.metadata,
+                processor_config=sparse_iq.ProcessorConfig(),
+            )
+        ),
+        1,
+    ),
+    "processor.presence": (
+        _processor_benchmark(
+            lambda data: presence.Processor(
+                sensor_config=data.sensor_config,
+                metadata=data.metadata,
+                processor_config=presence.ProcessorConfig(),
+            )
+        ),
+        1,
+    ),
+    "processor.distance": (
+        _processor_benchmark(
+            lambda data: distance.Processor(
+                sensor_config=data.sensor_config,
+                metadata=data.metadata,
+                processor_config=distance.ProcessorConfig(
+                    measurement_type=distance.MeasurementType.FAR_RANGE
+                ),
+            )
+        ),
+        1,
+    ),
+    "processor.virtual_button": (
+        _processor_benchmark(
+            lambda data: virtual_button.Processor(
+                sensor_config=data.sensor_config,
+                metadata=data.metadata,
+                processor_config=virtual_button.ProcessorConfig(),
+            ),
+            single_subsweep=True,
+        ),
+        1,
+    ),
+}
+"""Benchmark name to (setup, number of frames per call). The setup returns the timed call."""
+
+
+def time_call(func: Callable[[], Any], *, repeat: int = 5) -> tuple[int, list[float]]:
+    """Times a call like ``timeit`` does, in rounds of at least 0.2 s
+
+    :returns: The number of calls per round and the time per call of every round
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return number, [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+
+def run_benchmarks(
+    cases: list[BenchmarkCase],
+    names: Optional[list[str]] = None,
+    *,
+    repeat: int = 5,
+    progress: Optional[Callable[[str], None]] = None,
+) -> list[BenchmarkResult]:
+    """Runs the benchmarks for each case
+
+    Benchmarks not applicable to a case, i.e. where the setup raises a ``ValueError`` (e.g. a
+    processor not supporting multiple subsweeps), are left out.
+
+    :param names: Names of the benchmarks to run, all if ``None``
+    """
+    if names is None:
+        names = list(BENCHMARKS)
+
+    results: list[BenchmarkResult] = []
+    for case in cases:
+        data = _SessionData(case)
+
+        try:
+            results.extend(_run_case(data, case, names, repeat=repeat, progress=progress))
+        finally:
+            data.close()
+
+    return results
+
+
+def _run_case(
+    data: _SessionData,
+    case: BenchmarkCase,
+    names: list[str],
+    *,
+    repeat: int,
+    progress: Optional[Callable[[str], None]],
+) -> Iterator[BenchmarkResult]:
+    for name in names:
+        setup, frames_per_call = BENCHMARKS[name]
+
+        try:
+            func = setup(data)
+        except ValueError as exc:
+            if progress is not None:
+                progress(f"{name} {case.to_dict()}: skipped ({exc!r})")
+            continue
+
+        number, times = time_call(func, repeat=repeat)
+        times = [t / frames_per_call for t in times]
+        result = BenchmarkResult(
+            name=name,
+            params=case.to_dict(),
+            number=number,
+            min=min(times),
+            median=float(np.median(times)),
+            mean=float(np.mean(times)),
+        )
+
+        if progress is not None:
+            progress(f"{name} {case.to_dict()}: {result.median * 1e6:.1f} us")
+
+        yield result
+
+
+def get_environment() -> dict[str, Any]:
+    return dict(
+        exptool_version=importlib_metadata.version("acconeer-exptool"),
+        python_version=platform.python_version(),
+        numpy_version=np.__version__,
+        h5py_version=h5py.__version__,
+        platform=platform.platform(),
+        machine=platform.machine(),
+    )
+
+
+def to_json(results: list[BenchmarkResult]) -> dict[str, Any]:
+    return dict(
+        schema_version=SCHEMA_VERSION,
+        timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
+        environment=get_environment(),
+        results=[result.to_dict() for result in results],
+    )
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[tuple[str, float]]:
+    """Relative change in median time per benchmark and case present in both, positive is slower"""
+
+    def key(result: dict[str, Any]) -> str:
+        params = ",".join(f"{k}={v}" for k, v in sorted(result["params"].items()))
+        return f"{result['name']}[{params}]"
+
+    baseline_medians = {key(result): result["median"] for result in baseline["results"]}
+    return [
+        (key(result), result["median"] / baseline_medians[key(result)] - 1.0)
+        for result in current["results"]
+        if key(result) in baseline_medians
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-o", "--output", metavar="path", help="Write the JSON here instead of to stdout"
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        dest="name_filter",
+        metavar="substring",
+        help="Only run benchmarks with names containing this",
+    )
+    parser.add_argument("--quick", action="store_true", help="Only run a single case")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed rounds")
+    parser.add_argument(
+        "--compare",
+        metavar="path",
+        help="Print the change relative to a previously written JSON",
+    )
+    args = parser.parse_args()
+
+    matrix: tuple[tuple[int, ...], ...]
+    if args.quick:
+        matrix = (_QUICK_SWEEPS_PER_FRAME, _QUICK_NUM_POINTS, _QUICK_NUM_SUBSWEEPS)
+    else:
+        matrix = (SWEEPS_PER_FRAME, NUM_POINTS, NUM_SUBSWEEPS)
+
+    cases = [
+        BenchmarkCase(sweeps_per_frame=spf, num_points=num_points, num_subsweeps=num_subsweeps)
+        for spf, num_points, num_subsweeps in itertools.product(*matrix)
+    ]
+    names = [name for name in BENCHMARKS if args.name_filter is None or args.name_filter in name]
+
+    results = run_benchmarks(
+        cases, names, repeat=args.repeat, progress=lambda s: print(s, file=sys.stderr)
+    )
+    output = to_json(results)
+
+    if args.output is None:
+        json.dump(output, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        for name, change in compare(baseline, output):
+            print(f"{change:+7.1%}  {name}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
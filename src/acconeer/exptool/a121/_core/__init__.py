@@ -22,9 +22,10 @@ from .entities import (
     ValidationResult,
     ValidationWarning,
 )
-from .mediators import ClientError, Recorder
+from .mediators import ClientError, LatencyMonitor, LatencyStats, PrefetchStats, Recorder
 from .peripherals import (
     _H5PY_STR_DTYPE,
+    AsyncClient,
     Client,
     H5Record,
     H5Recorder,
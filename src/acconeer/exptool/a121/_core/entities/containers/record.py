@@ -95,6 +95,43 @@ class Record(abc.ABC):
 
         return self.stacked_results.frame
 
+    def extended_result_at(self, index: int) -> list[dict[int, Result]]:
+        """Retrieves the extended result of a single frame
+
+        :param index: The frame index. Negative indexes count from the end.
+        :raises: IndexError if the index is out of range
+        """
+
+        return utils.map_over_extended_structure(
+            lambda stacked_results: stacked_results[index], self.extended_stacked_results
+        )
+
+    def result_at(self, index: int) -> Result:
+        """Retrieves the sole result of a single frame
+
+        :raises: ValueError if there are multiple entries in the :attr:`extended_results`
+        """
+
+        return utils.unextend(self.extended_result_at(index))
+
+    def extended_stacked_results_at(self, frames: slice) -> list[dict[int, StackedResults]]:
+        """Retrieves the extended stacked results of a slice of frames
+
+        Like :attr:`extended_stacked_results`, but only for the given frames.
+        """
+
+        return utils.map_over_extended_structure(
+            lambda stacked_results: stacked_results[frames], self.extended_stacked_results
+        )
+
+    def stacked_results_at(self, frames: slice) -> StackedResults:
+        """Retrieves the sole stacked results of a slice of frames
+
+        :raises: ValueError if there are multiple entries in the :attr:`extended_stacked_results`
+        """
+
+        return utils.unextend(self.extended_stacked_results_at(frames))
+
     @property
     @abc.abstractmethod
     def lib_version(self) -> str:
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from typing import Any, Optional
+
 import attrs
 import numpy as np
 import numpy.typing as npt
@@ -50,21 +52,51 @@ class Result:
     """
 
     _frame: npt.NDArray = attrs.field(eq=attrs_ndarray_eq)
-    """Frame data in the original data format (complex int16)"""
+    """Frame data in the original data format (complex int16)
+
+    This may be a read-only view into a larger buffer (e.g. a received payload). Use
+    ``np.copy`` to get an array that owns its data.
+    """
 
     tick: int = attrs.field()
     """Server tick when the server got the interrupt from the sensor"""
 
     _context: ResultContext = attrs.field()
 
+    _converted_frame: Optional[npt.NDArray[np.complex_]] = attrs.field(
+        default=None, init=False, eq=False, repr=False
+    )
+
     @property
     def frame(self) -> npt.NDArray[np.complex_]:
         """Frame data in a complex float data format
 
         2-D with dimensions (sweep, distance).
+
+        Converted on first access and then cached, so the returned array is read-only.
         """
 
-        return int16_complex_array_to_complex(self._frame)
+        if self._converted_frame is None:
+            converted_frame = int16_complex_array_to_complex(self._frame)
+            converted_frame.flags.writeable = False
+            # Frozen class, so the cache has to bypass __setattr__
+            object.__setattr__(self, "_converted_frame", converted_frame)
+
+        return self._converted_frame  # type: ignore[return-value]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The converted frame is only a cache, so it is left out of pickles and copies
+        return {
+            field.name: getattr(self, field.name)
+            for field in attrs.fields(type(self))
+            if field.name != "_converted_frame"
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        object.__setattr__(self, "_converted_frame", None)
 
     @property
     def subframes(self) -> list[npt.NDArray[np.complex_]]:
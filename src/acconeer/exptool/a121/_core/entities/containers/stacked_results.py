@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from typing import Any, Iterator, Optional, Union, overload
+
 import attrs
 import numpy as np
 import numpy.typing as npt
@@ -40,9 +42,35 @@ class StackedResults:
 
     _context: ResultContext = attrs.field()
 
+    _converted_frame: Optional[npt.NDArray[np.complex_]] = attrs.field(
+        default=None, init=False, eq=False, repr=False
+    )
+
     @property
     def frame(self) -> npt.NDArray[np.complex_]:
-        return int16_complex_array_to_complex(self._frame)
+        """Converted on first access and then cached, so the returned array is read-only"""
+
+        if self._converted_frame is None:
+            converted_frame = int16_complex_array_to_complex(self._frame)
+            converted_frame.flags.writeable = False
+            # Frozen class, so the cache has to bypass __setattr__
+            object.__setattr__(self, "_converted_frame", converted_frame)
+
+        return self._converted_frame  # type: ignore[return-value]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The converted frame is only a cache, so it is left out of pickles and copies
+        return {
+            field.name: getattr(self, field.name)
+            for field in attrs.fields(type(self))
+            if field.name != "_converted_frame"
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        object.__setattr__(self, "_converted_frame", None)
 
     @property
     def subframes(self) -> list[npt.NDArray[np.complex_]]:
@@ -55,7 +83,33 @@ class StackedResults:
     def __len__(self) -> int:
         return len(self._frame)
 
+    def __iter__(self) -> Iterator[Result]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @overload
     def __getitem__(self, key: int) -> Result:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> StackedResults:
+        ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Result, StackedResults]:
+        """Gets the :class:`Result` of a frame, or the :class:`StackedResults` of a slice of
+        frames
+        """
+        if isinstance(key, slice):
+            return StackedResults(
+                calibration_needed=self.calibration_needed[key],
+                data_saturated=self.data_saturated[key],
+                frame_delayed=self.frame_delayed[key],
+                temperature=self.temperature[key],
+                tick=self.tick[key],
+                frame=self._frame[key],
+                context=self._context,
+            )
+
         return Result(
             calibration_needed=self.calibration_needed[key],
             data_saturated=self.data_saturated[key],
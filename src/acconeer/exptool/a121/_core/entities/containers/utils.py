@@ -13,6 +13,11 @@ from .metadata import Metadata
 
 T = TypeVar("T", bound=np.generic)
 
+_COMPLEX_TO_FLOAT_DTYPE: dict[np.dtype, np.dtype] = {
+    np.dtype(np.complex64): np.dtype(np.float32),
+    np.dtype(np.complex128): np.dtype(np.float64),
+}
+
 
 def get_subsweeps_from_frame(frame: npt.NDArray[T], metadata: Metadata) -> list[npt.NDArray[T]]:
     """Gets the subsweeps from a frame (2D, (<sweeps>, <data points>))
@@ -24,11 +29,28 @@ def get_subsweeps_from_frame(frame: npt.NDArray[T], metadata: Metadata) -> list[
     return [frame[..., o : o + l] for o, l in zip(offsets, lengths)]
 
 
-def int16_complex_array_to_complex(array: npt.NDArray) -> npt.NDArray[np.complex_]:
+def int16_complex_array_to_complex(
+    array: npt.NDArray, dtype: npt.DTypeLike = np.complex_
+) -> npt.NDArray[np.complexfloating]:
     """Converts an array with dtype = INT_16_COMPLEX
     (structured with parts "real" and "imag") into
     an array with plain complex dtype (non-structured).
+
+    :param array: The array to convert
+    :param dtype: The complex output dtype. ``np.complex64`` halves the memory usage.
     """
-    real = array["real"].astype("float")
-    imaginary = array["imag"].astype("float")
-    return real + 1.0j * imaginary  # type: ignore[no-any-return]
+    complex_dtype = np.dtype(dtype)
+    float_dtype = _COMPLEX_TO_FLOAT_DTYPE.get(complex_dtype)
+    if float_dtype is None:
+        raise ValueError(f"Unsupported dtype: {complex_dtype}")
+
+    if array.ndim > 0 and array.flags.c_contiguous:
+        # The (real, imag) int16 pairs have the same layout as a complex number, so the whole
+        # array can be cast in one go (no intermediate real and imaginary arrays).
+        # Changing the dtype of non-contiguous arrays requires numpy>=1.23.
+        return array.view(np.int16).astype(float_dtype).view(complex_dtype)
+
+    converted = np.empty(array.shape, dtype=complex_dtype)
+    converted.real = array["real"]
+    converted.imag = array["imag"]
+    return converted
@@ -2,6 +2,9 @@
 # All rights reserved
 
 from .agnostic_client import AgnosticClient, ClientError
+from .async_agnostic_client import AsyncAgnosticClient
 from .communication_protocol import CommunicationProtocol
-from .link import BufferedLink, Link
+from .latency_monitor import LatencyMonitor, LatencyStats
+from .link import AsyncBufferedLink, BufferedLink, Link
+from .prefetcher import OverflowPolicy, PrefetchStats, ResultPrefetcher
 from .recorder import Recorder
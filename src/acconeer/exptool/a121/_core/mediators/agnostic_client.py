@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Optional, Tuple, Type, Union
+from typing import Any, Callable, Optional, Tuple, Type, Union
 
 import attrs
 
@@ -26,7 +26,9 @@ from acconeer.exptool.a121._core.utils import (
 from acconeer.exptool.a121._perf_calc import _PerformanceCalc
 
 from .communication_protocol import CommunicationProtocol
-from .link import BufferedLink
+from .latency_monitor import LatencyMonitor, _NullLatencyMonitor
+from .link import AsyncBufferedLink, BufferedLink
+from .prefetcher import OverflowPolicy, PrefetchStats, ResultPrefetcher
 from .recorder import Recorder
 
 
@@ -37,25 +39,37 @@ class ClientError(Exception):
     pass
 
 
-class AgnosticClient:
-    _link: BufferedLink
+class AgnosticClientBase:
+    """The state of a client, shared by :class:`AgnosticClient` and ``AsyncAgnosticClient``
+
+    Holds everything but the I/O. The subclasses send the commands of the protocol over their
+    link and hand the responses over to the ``_handle_*`` methods.
+    """
+
+    _link: Union[BufferedLink, AsyncBufferedLink]
     _default_link_timeout: float
     _link_timeout: float
     _protocol: Type[CommunicationProtocol]
     _server_info: Optional[ServerInfo]
     _session_config: Optional[SessionConfig]
     _metadata: Optional[list[dict[int, Metadata]]]
+    _header_decoder: Optional[Callable[[bytes], Tuple[int, list[dict[int, Result]]]]]
     _session_is_started: bool
     _recorder: Optional[Recorder]
     _tick_unwrapper: TickUnwrapper
 
-    def __init__(self, link: BufferedLink, protocol: Type[CommunicationProtocol]) -> None:
+    def __init__(
+        self,
+        link: Union[BufferedLink, AsyncBufferedLink],
+        protocol: Type[CommunicationProtocol],
+    ) -> None:
         self._link = link
         self._protocol = protocol
         self._server_info = None
         self._session_config = None
         self._session_is_started = False
         self._metadata = None
+        self._header_decoder = None
         self._recorder = None
         self._tick_unwrapper = TickUnwrapper()
 
@@ -73,48 +87,28 @@ class AgnosticClient:
         if not self.session_is_started:
             raise ClientError("Session is not started.")
 
-    def connect(self) -> None:
-        """Connects to the specified host.
-
-        :raises: Exception if the host cannot be connected to.
-        """
+    def _prepare_connect(self) -> None:
         self._default_link_timeout = self._link.timeout
         self._link_timeout = self._default_link_timeout
-        self._link.connect()
 
-        self._link.send(self._protocol.get_sensor_info_command())
-        sens_response = self._link.recv_until(self._protocol.end_sequence)
-        sensor_infos = self._protocol.get_sensor_info_response(sens_response)
+    def _handle_connect_responses(self, sens_response: bytes, sys_response: bytes) -> None:
+        """Stores the server info
 
-        self._link.send(self._protocol.get_system_info_command())
-        sys_response = self._link.recv_until(self._protocol.end_sequence)
-        self._server_info, sensor = self._protocol.get_system_info_response(
-            sys_response, sensor_infos
-        )
+        :raises: ``ClientError`` if the server is not an a121 server
+        """
+        sensor_infos = self._protocol.get_sensor_info_response(sens_response)
+        server_info, sensor = self._protocol.get_system_info_response(sys_response, sensor_infos)
 
         if sensor != "a121":
-            self._link.disconnect()
             raise ClientError(f"Wrong sensor version, expected a121 but got {sensor}")
 
-    def setup_session(
-        self,
-        config: Union[SensorConfig, SessionConfig],
-    ) -> Union[Metadata, list[dict[int, Metadata]]]:
-        """Sets up the session specified by ``config``.
-
-        If the Client is not already connected, it will connect before setting up the session.
+        self._server_info = server_info
 
-        :param config: The session to set up.
-        :raises:
-            ``ValueError`` if the config is invalid.
+    def _prepare_setup(self, config: Union[SensorConfig, SessionConfig]) -> SessionConfig:
+        """Validates ``config`` and adapts the link timeout to it
 
-        :returns:
-            ``Metadata`` if ``config.extended is False``,
-            ``list[dict[int, Metadata]]`` otherwise.
+        :returns: The session config to set up
         """
-        if not self.connected:
-            self.connect()
-
         if self.session_is_started:
             raise ClientError("Session is currently running, can't setup.")
 
@@ -133,25 +127,188 @@ class AgnosticClient:
 
         self._link.timeout = self._link_timeout
 
-        self._link.send(self._protocol.setup_command(config))
-        reponse_bytes = self._link.recv_until(self._protocol.end_sequence)
+        return config
+
+    def _handle_setup_response(
+        self, config: SessionConfig, reponse_bytes: bytes
+    ) -> Union[Metadata, list[dict[int, Metadata]]]:
         self._session_config = config
         self._metadata = self._protocol.setup_response(
             reponse_bytes, context_session_config=config
         )
+        self._header_decoder = self._protocol.get_next_header_decoder(
+            extended_metadata=self._metadata,
+            ticks_per_second=self.server_info.ticks_per_second,
+        )
 
         if self.session_config.extended:
             return self._metadata
         else:
             return unextend(self._metadata)
 
-    def start_session(self, recorder: Optional[Recorder] = None) -> None:
+    def _prepare_start(self, recorder: Optional[Recorder]) -> None:
+        if recorder is not None:
+            self._recorder = recorder
+            self._recorder._start(
+                client_info=self.client_info,
+                extended_metadata=self.extended_metadata,
+                server_info=self.server_info,
+                session_config=self.session_config,
+            )
+
+        self._link.timeout = self._link_timeout
+
+    def _handle_start_response(self, reponse_bytes: bytes) -> None:
+        self._protocol.start_streaming_response(reponse_bytes)
+        self._session_is_started = True
+
+    def _stop_recorder(self) -> Any:
+        recorder_result = None
+        if self._recorder is not None:
+            recorder_result = self._recorder._stop()
+            self._recorder = None
+
+        return recorder_result
+
+    def _reset_session(self) -> None:
+        self._link.timeout = self._default_link_timeout
+        self._session_is_started = False
+        self._tick_unwrapper = TickUnwrapper()
+
+    def _unextend_if_needed(
+        self, extended_results: list[dict[int, Result]]
+    ) -> Union[Result, list[dict[int, Result]]]:
+        if self.session_config.extended:
+            return extended_results
+        else:
+            return unextend(extended_results)
+
+    @property
+    def connected(self) -> bool:
+        """Whether this Client is connected."""
+        return self._server_info is not None
+
+    @property
+    def session_is_setup(self) -> bool:
+        """Whether this Client has a session set up."""
+        return self._session_config is not None
+
+    @property
+    def session_is_started(self) -> bool:
+        """Whether this Client's session is started."""
+        return self._session_is_started
+
+    @property
+    def server_info(self) -> ServerInfo:
+        """The ``ServerInfo``."""
+        self._assert_connected()
+
+        return self._server_info  # type: ignore[return-value]
+
+    @property
+    def client_info(self) -> ClientInfo:
+        """The ``ClientInfo``."""
+        return ClientInfo()
+
+    @property
+    def session_config(self) -> SessionConfig:
+        """The :class:`SessionConfig` for the current session"""
+
+        self._assert_session_setup()
+        assert self._session_config is not None  # Should never happen if session is setup
+        return self._session_config
+
+    @property
+    def extended_metadata(self) -> list[dict[int, Metadata]]:
+        """The extended :class:`Metadata` for the current session"""
+
+        self._assert_session_setup()
+        assert self._metadata is not None  # Should never happen if session is setup
+        return self._metadata
+
+
+class AgnosticClient(AgnosticClientBase):
+    _link: BufferedLink
+    _latency_monitor: Optional[LatencyMonitor]
+    _stage_monitor: Union[LatencyMonitor, _NullLatencyMonitor]
+    _prefetcher: Optional[ResultPrefetcher]
+    _last_prefetch_stats: Optional[PrefetchStats]
+
+    def __init__(self, link: BufferedLink, protocol: Type[CommunicationProtocol]) -> None:
+        super().__init__(link, protocol)
+        self._latency_monitor = None
+        self._stage_monitor = _NullLatencyMonitor()
+        self._prefetcher = None
+        self._last_prefetch_stats = None
+
+    def connect(self) -> None:
+        """Connects to the specified host.
+
+        :raises: Exception if the host cannot be connected to.
+        """
+        self._prepare_connect()
+        self._link.connect()
+
+        self._link.send(self._protocol.get_sensor_info_command())
+        sens_response = self._link.recv_until(self._protocol.end_sequence)
+
+        self._link.send(self._protocol.get_system_info_command())
+        sys_response = self._link.recv_until(self._protocol.end_sequence)
+
+        try:
+            self._handle_connect_responses(sens_response, sys_response)
+        except ClientError:
+            self._link.disconnect()
+            raise
+
+    def setup_session(
+        self,
+        config: Union[SensorConfig, SessionConfig],
+    ) -> Union[Metadata, list[dict[int, Metadata]]]:
+        """Sets up the session specified by ``config``.
+
+        If the Client is not already connected, it will connect before setting up the session.
+
+        :param config: The session to set up.
+        :raises:
+            ``ValueError`` if the config is invalid.
+
+        :returns:
+            ``Metadata`` if ``config.extended is False``,
+            ``list[dict[int, Metadata]]`` otherwise.
+        """
+        if not self.connected:
+            self.connect()
+
+        session_config = self._prepare_setup(config)
+
+        self._link.send(self._protocol.setup_command(session_config))
+        reponse_bytes = self._link.recv_until(self._protocol.end_sequence)
+        return self._handle_setup_response(session_config, reponse_bytes)
+
+    def start_session(
+        self,
+        recorder: Optional[Recorder] = None,
+        *,
+        latency_monitor: Optional[LatencyMonitor] = None,
+        prefetch_depth: Optional[int] = None,
+        prefetch_overflow: OverflowPolicy = "block",
+    ) -> None:
         """Starts the already set up session.
 
         After this call, the server starts streaming data to the client.
 
         :param recorder:
             An optional ``Recorder``, which samples every ``get_next()``
+        :param latency_monitor:
+            An optional ``LatencyMonitor``, which times the stages of every ``get_next()``
+        :param prefetch_depth:
+            If set, results are received by a background thread into a buffer of this many
+            results, from which ``get_next()`` returns. Results are then received while the
+            previous ones are processed. See :attr:`prefetch_stats`.
+        :param prefetch_overflow:
+            What to do when the prefetch buffer is full. Either ``"block"``, to stop receiving
+            until there is room, or ``"drop_oldest"``.
         :raises: ``ClientError`` if ``Client``'s  session is not set up.
         """
         self._assert_session_setup()
@@ -159,21 +316,32 @@ class AgnosticClient:
         if self.session_is_started:
             raise ClientError("Session is already started.")
 
-        if recorder is not None:
-            self._recorder = recorder
-            self._recorder._start(
-                client_info=self.client_info,
-                extended_metadata=self.extended_metadata,
-                server_info=self.server_info,
+        prefetcher = None
+        if prefetch_depth is not None:
+            prefetcher = ResultPrefetcher(
+                self._get_next_extended, prefetch_depth, prefetch_overflow
+            )
+
+        self._latency_monitor = latency_monitor
+        if latency_monitor is None:
+            self._stage_monitor = _NullLatencyMonitor()
+        else:
+            latency_monitor._start(
                 session_config=self.session_config,
+                ticks_per_second=self.server_info.ticks_per_second,
             )
+            self._stage_monitor = latency_monitor
 
-        self._link.timeout = self._link_timeout
+        self._prepare_start(recorder)
 
         self._link.send(self._protocol.start_streaming_command())
         reponse_bytes = self._link.recv_until(self._protocol.end_sequence)
-        self._protocol.start_streaming_response(reponse_bytes)
-        self._session_is_started = True
+        self._handle_start_response(reponse_bytes)
+
+        self._prefetcher = prefetcher
+        self._last_prefetch_stats = None
+        if prefetcher is not None:
+            prefetcher.start()
 
     def get_next(self) -> Union[Result, list[dict[int, Result]]]:
         """Gets results from the server.
@@ -185,24 +353,43 @@ class AgnosticClient:
             ``ClientError`` if ``Client``'s session is not started.
         """
         self._assert_session_started()
+        assert self._header_decoder is not None  # Should never happen if session is setup
 
-        payload_size, partial_results = self._protocol.get_next_header(
-            bytes_=self._link.recv_until(self._protocol.end_sequence),
-            extended_metadata=self.extended_metadata,
-            ticks_per_second=self.server_info.ticks_per_second,
-        )
+        if self._prefetcher is None:
+            extended_results = self._get_next_extended()
+        else:
+            maybe_extended_results = self._prefetcher.get(timeout=self._link.timeout)
+
+            if maybe_extended_results is None:
+                raise ClientError("Client timed out when waiting for prefetched results.")
+
+            extended_results = maybe_extended_results
+
+        return self._unextend_if_needed(extended_results)
+
+    def _get_next_extended(self) -> list[dict[int, Result]]:
+        assert self._header_decoder is not None  # Should never happen if session is setup
+
+        # Gets a timestamp after every stage. A no-op unless a LatencyMonitor is passed.
+        monitor = self._stage_monitor
+
+        monitor._begin_frame()
+        header = self._link.recv_until(self._protocol.end_sequence)
+        monitor._stamp(0)
+        payload_size, partial_results = self._header_decoder(header)
+        monitor._stamp(1)
         payload = self._link.recv(payload_size)
+        monitor._stamp(2)
         extended_results = self._protocol.get_next_payload(payload, partial_results)
-
+        monitor._stamp(3)
         extended_results = self._tick_unwrapper.unwrap_ticks(extended_results)
-
+        monitor._stamp(4)
         if self._recorder is not None:
             self._recorder._sample(extended_results)
+        monitor._stamp(5)
+        monitor._end_frame(extended_results)
 
-        if self.session_config.extended:
-            return extended_results
-        else:
-            return unextend(extended_results)
+        return extended_results
 
     def stop_session(self) -> Any:
         """Stops an on-going session
@@ -214,21 +401,23 @@ class AgnosticClient:
         """
         self._assert_session_started()
 
-        recorder_result = None
-        if self._recorder is not None:
-            recorder_result = self._recorder._stop()
-            self._recorder = None
+        if self._prefetcher is not None:
+            # Stop the reader thread at a result boundary, before draining the rest
+            prefetcher_stopped = self._prefetcher.stop(timeout=self._link.timeout + 1)
+            self._last_prefetch_stats = self._prefetcher.stats
+            self._prefetcher = None
+
+            if not prefetcher_stopped:
+                raise ClientError("Client timed out when waiting for the prefetch thread.")
+
+        recorder_result = self._stop_recorder()
 
         try:
             self._link.send(self._protocol.stop_streaming_command())
             reponse_bytes = self._drain_buffer(self._link.timeout + 1)
             self._protocol.stop_streaming_response(reponse_bytes)
-        except Exception:
-            raise
         finally:
-            self._link.timeout = self._default_link_timeout
-            self._session_is_started = False
-            self._tick_unwrapper = TickUnwrapper()
+            self._reset_session()
 
         return recorder_result
 
@@ -236,16 +425,13 @@ class AgnosticClient:
         self, timeout_s: float = 3.0
     ) -> bytes:  # TODO: Make `timeout_s` session-dependant
         """Drains data in the buffer. Returning the first bytes that are not data packets."""
+        assert self._header_decoder is not None  # Should never happen if session is setup
         start = time.time()
 
         while time.time() < start + timeout_s:
             next_header = self._link.recv_until(self._protocol.end_sequence)
             try:
-                payload_size, _ = self._protocol.get_next_header(
-                    bytes_=next_header,
-                    extended_metadata=self.extended_metadata,
-                    ticks_per_second=self.server_info.ticks_per_second,
-                )
+                payload_size, _ = self._header_decoder(next_header)
                 _ = self._link.recv(payload_size)
             except Exception:
                 return next_header
@@ -276,47 +462,23 @@ class AgnosticClient:
         self.disconnect()
 
     @property
-    def connected(self) -> bool:
-        """Whether this Client is connected."""
-        return self._server_info is not None
+    def latency_monitor(self) -> Optional[LatencyMonitor]:
+        """The ``LatencyMonitor`` passed to the latest ``start_session``, if any"""
 
-    @property
-    def session_is_setup(self) -> bool:
-        """Whether this Client has a session set up."""
-        return self._session_config is not None
+        return self._latency_monitor
 
     @property
-    def session_is_started(self) -> bool:
-        """Whether this Client's session is started."""
-        return self._session_is_started
-
-    @property
-    def server_info(self) -> ServerInfo:
-        """The ``ServerInfo``."""
-        self._assert_connected()
-
-        return self._server_info  # type: ignore[return-value]
-
-    @property
-    def client_info(self) -> ClientInfo:
-        """The ``ClientInfo``."""
-        return ClientInfo()
+    def prefetch_stats(self) -> Optional[PrefetchStats]:
+        """The counters of the prefetch buffer, if the latest session prefetches
+        (see ``start_session``)
 
-    @property
-    def session_config(self) -> SessionConfig:
-        """The :class:`SessionConfig` for the current session"""
-
-        self._assert_session_setup()
-        assert self._session_config is not None  # Should never happen if session is setup
-        return self._session_config
+        After the session is stopped, these are the final counters of the session.
+        """
 
-    @property
-    def extended_metadata(self) -> list[dict[int, Metadata]]:
-        """The extended :class:`Metadata` for the current session"""
+        if self._prefetcher is None:
+            return self._last_prefetch_stats
 
-        self._assert_session_setup()
-        assert self._metadata is not None  # Should never happen if session is setup
-        return self._metadata
+        return self._prefetcher.stats
 
 
 class TickUnwrapper:
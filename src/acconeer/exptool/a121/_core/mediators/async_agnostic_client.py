@@ -0,0 +1,327 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Optional, Type, Union
+
+from acconeer.exptool.a121._core.entities import Metadata, Result, SensorConfig, SessionConfig
+
+from .agnostic_client import AgnosticClientBase, ClientError
+from .communication_protocol import CommunicationProtocol
+from .link import AsyncBufferedLink
+from .prefetcher import OVERFLOW_POLICIES, OverflowPolicy
+from .recorder import Recorder
+
+
+log = logging.getLogger(__name__)
+
+
+class AsyncAgnosticClient(AgnosticClientBase):
+    """The asyncio counterpart of :class:`AgnosticClient`
+
+    While a session is started, a reader task keeps receiving and decoding results into a
+    prefetch buffer of ``prefetch_size`` results, from which :meth:`get_next` and
+    :meth:`results` are served. Results are thereby received while the previous ones are
+    processed. When the buffer is full, the reader either waits (``overflow="block"``) or
+    drops the oldest result (``overflow="drop_oldest"``), see :attr:`num_dropped_results`.
+
+    :param link: The link to communicate over
+    :param protocol: The communication protocol
+    :param prefetch_size: Number of results to buffer
+    :param overflow: What to do when the prefetch buffer is full
+    """
+
+    _link: AsyncBufferedLink
+    _reader_task: Optional[asyncio.Task[Optional[bytes]]]
+    _reader_error: Optional[Exception]
+    _reader_is_done: bool
+    _buffer: Deque[list[dict[int, Result]]]
+    _buffer_changed: Optional[asyncio.Condition]
+
+    def __init__(
+        self,
+        link: AsyncBufferedLink,
+        protocol: Type[CommunicationProtocol],
+        *,
+        prefetch_size: int = 8,
+        overflow: OverflowPolicy = "block",
+    ) -> None:
+        if prefetch_size < 1:
+            raise ValueError("prefetch_size must be positive")
+
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}")
+
+        super().__init__(link, protocol)
+        self._prefetch_size = prefetch_size
+        self._overflow = overflow
+        self._reader_task = None
+        self._reader_error = None
+        self._reader_is_done = False
+        self._stopping = False
+        self._buffer = deque()
+        self._buffer_changed = None
+        self._num_dropped_results = 0
+
+    async def connect(self) -> None:
+        """Connects to the specified host.
+
+        :raises: Exception if the host cannot be connected to.
+        """
+        self._prepare_connect()
+        await self._link.connect()
+
+        await self._link.send(self._protocol.get_sensor_info_command())
+        sens_response = await self._link.recv_until(self._protocol.end_sequence)
+
+        await self._link.send(self._protocol.get_system_info_command())
+        sys_response = await self._link.recv_until(self._protocol.end_sequence)
+
+        try:
+            self._handle_connect_responses(sens_response, sys_response)
+        except ClientError:
+            await self._link.disconnect()
+            raise
+
+    async def setup_session(
+        self,
+        config: Union[SensorConfig, SessionConfig],
+    ) -> Union[Metadata, list[dict[int, Metadata]]]:
+        """Sets up the session specified by ``config``.
+
+        If the Client is not already connected, it will connect before setting up the session.
+
+        :param config: The session to set up.
+        :raises:
+            ``ValueError`` if the config is invalid.
+
+        :returns:
+            ``Metadata`` if ``config.extended is False``,
+            ``list[dict[int, Metadata]]`` otherwise.
+        """
+        if not self.connected:
+            await self.connect()
+
+        session_config = self._prepare_setup(config)
+
+        await self._link.send(self._protocol.setup_command(session_config))
+        reponse_bytes = await self._link.recv_until(self._protocol.end_sequence)
+        return self._handle_setup_response(session_config, reponse_bytes)
+
+    async def start_session(self, recorder: Optional[Recorder] = None) -> None:
+        """Starts the already set up session.
+
+        After this call, the server starts streaming data to the client, which is received in
+        the background.
+
+        :param recorder:
+            An optional ``Recorder``, which samples every received result, including the ones
+            dropped from the prefetch buffer.
+        :raises: ``ClientError`` if ``Client``'s  session is not set up.
+        """
+        self._assert_session_setup()
+
+        if self.session_is_started:
+            raise ClientError("Session is already started.")
+
+        self._prepare_start(recorder)
+
+        await self._link.send(self._protocol.start_streaming_command())
+        reponse_bytes = await self._link.recv_until(self._protocol.end_sequence)
+        self._handle_start_response(reponse_bytes)
+
+        self._stopping = False
+        self._reader_error = None
+        self._reader_is_done = False
+        self._buffer.clear()
+        self._buffer_changed = asyncio.Condition()
+        self._num_dropped_results = 0
+        self._reader_task = asyncio.ensure_future(self._read_results())
+
+    async def _read_results(self) -> Optional[bytes]:
+        """Receives results into the prefetch buffer until the session is stopped
+
+        :returns: The response to the stop command, or ``None`` on error
+        """
+        assert self._header_decoder is not None  # Should never happen if session is started
+        assert self._buffer_changed is not None
+
+        try:
+            while True:
+                header = await self._link.recv_until(self._protocol.end_sequence)
+
+                try:
+                    payload_size, partial_results = self._header_decoder(header)
+                except Exception:
+                    if self._stopping:
+                        return header
+
+                    raise
+
+                payload = await self._link.recv(payload_size)
+                extended_results = self._protocol.get_next_payload(payload, partial_results)
+                extended_results = self._tick_unwrapper.unwrap_ticks(extended_results)
+
+                if self._recorder is not None:
+                    self._recorder._sample(extended_results)
+
+                if self._stopping:
+                    log.debug("Threw away get_next package when draining buffer")
+                    continue
+
+                async with self._buffer_changed:
+                    if len(self._buffer) >= self._prefetch_size:
+                        if self._overflow == "block":
+                            await self._buffer_changed.wait_for(
+                                lambda: len(self._buffer) < self._prefetch_size or self._stopping
+                            )
+                        else:
+                            self._buffer.popleft()
+                            self._num_dropped_results += 1
+
+                    if not self._stopping:
+                        self._buffer.append(extended_results)
+                        self._buffer_changed.notify_all()
+        except Exception as exc:
+            self._reader_error = exc
+            return None
+        finally:
+            self._reader_is_done = True
+
+            async with self._buffer_changed:
+                self._buffer_changed.notify_all()
+
+    async def _get_next_extended(self) -> Optional[list[dict[int, Result]]]:
+        """Waits for the next result in the prefetch buffer
+
+        :returns: The extended results, or ``None`` if the session was stopped
+        """
+        assert self._buffer_changed is not None
+
+        async with self._buffer_changed:
+            await self._buffer_changed.wait_for(
+                lambda: bool(self._buffer) or self._stopping or self._reader_is_done
+            )
+
+            if self._buffer and not self._stopping:
+                extended_results = self._buffer.popleft()
+                self._buffer_changed.notify_all()
+                return extended_results
+
+        if self._reader_error is not None:
+            raise self._reader_error
+
+        return None
+
+    async def get_next(self) -> Union[Result, list[dict[int, Result]]]:
+        """Gets the next result from the prefetch buffer, waiting for it if needed
+
+        :returns:
+            A ``Result`` if the setup ``SessionConfig.extended is False``,
+            ``list[dict[int, Result]]`` otherwise.
+        :raises:
+            ``ClientError`` if ``Client``'s session is not started or is stopped while waiting.
+        """
+        self._assert_session_started()
+
+        extended_results = await self._get_next_extended()
+
+        if extended_results is None:
+            raise ClientError("Session was stopped.")
+
+        return self._unextend_if_needed(extended_results)
+
+    async def results(self) -> AsyncIterator[Union[Result, list[dict[int, Result]]]]:
+        """Iterates over the results until the session is stopped
+
+        .. code-block:: python
+
+            async for result in client.results():
+                ...
+
+        :raises:
+            ``ClientError`` if ``Client``'s session is not started.
+        """
+        self._assert_session_started()
+
+        while self.session_is_started:
+            extended_results = await self._get_next_extended()
+
+            if extended_results is None:
+                return
+
+            yield self._unextend_if_needed(extended_results)
+
+    async def stop_session(self) -> Any:
+        """Stops an on-going session
+
+        :returns:
+            The return value of the passed ``Recorder.stop()`` passed in ``start_session``.
+        :raises:
+            ``ClientError`` if ``Client``'s session is not started.
+        """
+        self._assert_session_started()
+        assert self._reader_task is not None
+        assert self._buffer_changed is not None
+
+        recorder_result = self._stop_recorder()
+
+        self._stopping = True
+
+        try:
+            async with self._buffer_changed:
+                self._buffer_changed.notify_all()
+
+            await self._link.send(self._protocol.stop_streaming_command())
+
+            try:
+                reponse_bytes = await asyncio.wait_for(
+                    asyncio.shield(self._reader_task), self._link.timeout + 1
+                )
+            except asyncio.TimeoutError:
+                raise ClientError("Client timed out when waiting for 'stop'-response.")
+
+            if reponse_bytes is None:
+                assert self._reader_error is not None
+                raise self._reader_error
+
+            self._protocol.stop_streaming_response(reponse_bytes)
+        finally:
+            # The reader may be stuck in the link on timeout or error. It is waited for, so
+            # that it has let go of the link before the link is used again.
+            self._reader_task.cancel()
+            await asyncio.wait([self._reader_task])
+            self._reader_task = None
+            self._buffer.clear()
+            self._reset_session()
+
+        return recorder_result
+
+    async def disconnect(self) -> None:
+        """Disconnects the client from the host.
+
+        :raises: ``ClientError`` if ``Client`` is not connected.
+        """
+        self._assert_connected()
+
+        if self.session_is_started:
+            _ = await self.stop_session()
+
+        self._server_info = None
+        await self._link.disconnect()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, type_, value, traceback):
+        await self.disconnect()
+
+    @property
+    def num_dropped_results(self) -> int:
+        """Number of results dropped from the full prefetch buffer in the current session"""
+        return self._num_dropped_results
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Callable, Tuple
 
 from typing_extensions import Protocol
 
@@ -76,6 +76,16 @@ class CommunicationProtocol(Protocol):
         """
         ...
 
+    @classmethod
+    def get_next_header_decoder(
+        cls, extended_metadata: list[dict[int, Metadata]], ticks_per_second: int
+    ) -> Callable[[bytes], Tuple[int, list[dict[int, Result]]]]:
+        """Creates a session-scoped header parser. Calling it with the header of a data package
+        is equivalent to calling `get_next_header`, but is faster as it can reuse what is
+        constant during the session.
+        """
+        ...
+
     @classmethod
     def get_next_payload(
         cls, bytes_: bytes, partial_results: list[dict[int, Result]]
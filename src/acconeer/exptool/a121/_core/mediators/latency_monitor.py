@@ -0,0 +1,167 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+import attrs
+import numpy as np
+
+from acconeer.exptool.a121._core.entities import Result, SessionConfig
+from acconeer.exptool.a121._core.utils import iterate_extended_structure_values
+
+
+@attrs.frozen(kw_only=True)
+class LatencyStats:
+    """Latency statistics of the latest frames
+
+    The latencies are in seconds, with one entry per stage of ``Client.get_next``
+    (see :attr:`LatencyMonitor.STAGES`) and a ``"total"`` entry.
+    """
+
+    num_frames: int = attrs.field()
+    """Number of frames monitored in total"""
+
+    dropped_frames: int = attrs.field()
+    """Number of frames missing in the tick sequence. Only counted if the rate is set."""
+
+    delayed_frames: int = attrs.field()
+    """Number of frames with :attr:`Result.frame_delayed` set"""
+
+    p50: dict[str, float] = attrs.field()
+    """Median latency per stage over the latest frames"""
+
+    p99: dict[str, float] = attrs.field()
+    """99th percentile latency per stage over the latest frames"""
+
+
+class LatencyMonitor:
+    """Records the latency of every stage of ``Client.get_next``
+
+    Pass to ``Client.start_session`` to enable. A timestamp is stored after every stage in a
+    preallocated ring buffer of ``capacity`` frames, over which :attr:`stats` is calculated.
+
+    :param capacity: Number of frames to keep timestamps for
+    :param callback: Optional callback, called with the :attr:`stats` every ``callback_interval``
+        frames
+    :param callback_interval: Number of frames between the calls to ``callback``
+    """
+
+    STAGES = (
+        "header_wait",
+        "header_decode",
+        "payload_wait",
+        "payload_decode",
+        "tick_unwrap",
+        "record",
+    )
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        callback: Optional[Callable[[LatencyStats], None]] = None,
+        callback_interval: int = 100,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+
+        if callback_interval < 1:
+            raise ValueError("callback_interval must be positive")
+
+        self._timestamps = np.zeros((capacity, len(self.STAGES) + 1))
+        self._callback = callback
+        self._callback_interval = callback_interval
+        self._reset()
+
+    def _reset(self) -> None:
+        self._row = 0
+        self._num_frames = 0
+        self._dropped_frames = 0
+        self._delayed_frames = 0
+        self._last_tick: Optional[int] = None
+        self._ticks_per_frame: Optional[float] = None
+
+    def _start(self, session_config: SessionConfig, ticks_per_second: int) -> None:
+        self._reset()
+
+        if session_config.update_rate is not None:
+            rate: Optional[float] = session_config.update_rate
+        elif not session_config.extended:
+            rate = session_config.sensor_config.frame_rate
+        else:
+            rate = None
+
+        if rate is not None:
+            self._ticks_per_frame = ticks_per_second / rate
+
+    def _begin_frame(self) -> None:
+        self._row = self._num_frames % len(self._timestamps)
+        self._timestamps[self._row, 0] = time.perf_counter()
+
+    def _stamp(self, stage_index: int) -> None:
+        self._timestamps[self._row, stage_index + 1] = time.perf_counter()
+
+    def _end_frame(self, extended_results: list[dict[int, Result]]) -> None:
+        first_tick = None
+
+        for result in iterate_extended_structure_values(extended_results):
+            if first_tick is None:
+                first_tick = result.tick
+
+            if result.frame_delayed:
+                self._delayed_frames += 1
+
+        if first_tick is not None:
+            if self._last_tick is not None and self._ticks_per_frame is not None:
+                num_frames_since_last = round(
+                    (first_tick - self._last_tick) / self._ticks_per_frame
+                )
+                self._dropped_frames += max(num_frames_since_last - 1, 0)
+
+            self._last_tick = first_tick
+
+        self._num_frames += 1
+
+        if self._callback is not None and self._num_frames % self._callback_interval == 0:
+            self._callback(self.stats)
+
+    @property
+    def stats(self) -> LatencyStats:
+        """Latency statistics over the frames in the ring buffer"""
+
+        timestamps = self._timestamps[: min(self._num_frames, len(self._timestamps))]
+        keys = self.STAGES + ("total",)
+
+        if len(timestamps) == 0:
+            p50 = {key: float("nan") for key in keys}
+            p99 = {key: float("nan") for key in keys}
+        else:
+            durations = np.empty((len(timestamps), len(keys)))
+            durations[:, :-1] = np.diff(timestamps, axis=1)
+            durations[:, -1] = timestamps[:, -1] - timestamps[:, 0]
+            p50_arr, p99_arr = np.percentile(durations, [50, 99], axis=0)
+            p50 = dict(zip(keys, p50_arr.tolist()))
+            p99 = dict(zip(keys, p99_arr.tolist()))
+
+        return LatencyStats(
+            num_frames=self._num_frames,
+            dropped_frames=self._dropped_frames,
+            delayed_frames=self._delayed_frames,
+            p50=p50,
+            p99=p99,
+        )
+
+
+class _NullLatencyMonitor:
+    """Stands in for a :class:`LatencyMonitor` when none is passed, ignoring every timestamp"""
+
+    def _begin_frame(self) -> None:
+        pass
+
+    def _stamp(self, stage_index: int) -> None:
+        pass
+
+    def _end_frame(self, extended_results: list[dict[int, Result]]) -> None:
+        pass
@@ -38,3 +38,39 @@ class BufferedLink(Link, Protocol):
         returning what was collected
         """
         ...
+
+
+class AsyncBufferedLink(Protocol):
+    """The asyncio counterpart of :class:`BufferedLink`"""
+
+    @property
+    def timeout(self) -> float:
+        """Return link timout."""
+        ...
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        """Set return link timeout."""
+        ...
+
+    async def connect(self) -> None:
+        """Establishes a connection."""
+        ...
+
+    async def recv(self, num_bytes: int) -> bytes:
+        """Recieves `num_bytes` bytes."""
+        ...
+
+    async def recv_until(self, byte_sequence: bytes) -> bytes:
+        """Collects all bytes until `byte_sequence` is encountered,
+        returning what was collected
+        """
+        ...
+
+    async def send(self, bytes_: bytes) -> None:
+        """Sends all `bytes_` over the link."""
+        ...
+
+    async def disconnect(self) -> None:
+        """Tears down the connection."""
+        ...
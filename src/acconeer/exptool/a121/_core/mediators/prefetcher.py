@@ -0,0 +1,145 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Optional
+
+import attrs
+from typing_extensions import Literal
+
+from acconeer.exptool.a121._core.entities import Result
+
+
+OverflowPolicy = Literal["block", "drop_oldest"]
+OVERFLOW_POLICIES = ("block", "drop_oldest")
+
+
+@attrs.frozen(kw_only=True)
+class PrefetchStats:
+    """Counters of a prefetching session, see ``Client.start_session``"""
+
+    num_received: int = attrs.field()
+    """Number of results received by the reader thread"""
+
+    num_dropped: int = attrs.field()
+    """Number of results dropped since the prefetch buffer was full, i.e. not processed in time,
+    or since they were still buffered or received while stopping
+    """
+
+    num_buffered: int = attrs.field()
+    """Number of results currently waiting in the prefetch buffer"""
+
+
+class ResultPrefetcher:
+    """A reader thread receiving results into a bounded buffer
+
+    :param read_next: Receives the next extended results, called repeatedly by the thread
+    :param depth: Number of results to buffer
+    :param overflow:
+        What to do when the buffer is full. Either wait for room (``"block"``) or drop the
+        oldest result (``"drop_oldest"``).
+    """
+
+    def __init__(
+        self,
+        read_next: Callable[[], list[dict[int, Result]]],
+        depth: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        if depth < 1:
+            raise ValueError("The prefetch depth must be positive")
+
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}")
+
+        self._read_next = read_next
+        self._depth = depth
+        self._overflow = overflow
+        self._buffer: Deque[list[dict[int, Result]]] = deque()
+        self._buffer_changed = threading.Condition()
+        self._stopping = False
+        self._error: Optional[Exception] = None
+        self._num_received = 0
+        self._num_dropped = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            while not self._stopping:
+                extended_results = self._read_next()
+
+                with self._buffer_changed:
+                    self._num_received += 1
+
+                    if len(self._buffer) >= self._depth:
+                        if self._overflow == "block":
+                            self._buffer_changed.wait_for(
+                                lambda: len(self._buffer) < self._depth or self._stopping
+                            )
+                        else:
+                            self._buffer.popleft()
+                            self._num_dropped += 1
+
+                    if self._stopping:  # Stopped while the result was received or blocked
+                        self._num_dropped += 1
+                    else:
+                        self._buffer.append(extended_results)
+                        self._buffer_changed.notify_all()
+        except Exception as exc:
+            self._error = exc
+        finally:
+            with self._buffer_changed:
+                self._stopping = True
+                self._buffer_changed.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[list[dict[int, Result]]]:
+        """Takes the oldest result from the buffer, waiting for it if needed
+
+        Results received before an error in the reader thread are returned before the error is
+        raised.
+
+        :returns: The extended results, or ``None`` on timeout or if the prefetcher is stopped
+        """
+        with self._buffer_changed:
+            self._buffer_changed.wait_for(lambda: bool(self._buffer) or self._stopping, timeout)
+
+            if self._buffer:
+                extended_results = self._buffer.popleft()
+                self._buffer_changed.notify_all()
+                return extended_results
+
+        if self._error is not None:
+            raise self._error
+
+        return None
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Stops the reader thread once it has received the result it is waiting for
+
+        Results which have not been taken from the buffer are dropped.
+
+        :returns: Whether the thread stopped within ``timeout``
+        """
+        with self._buffer_changed:
+            self._stopping = True
+            self._num_dropped += len(self._buffer)
+            self._buffer.clear()
+            self._buffer_changed.notify_all()
+
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    @property
+    def stats(self) -> PrefetchStats:
+        with self._buffer_changed:
+            return PrefetchStats(
+                num_received=self._num_received,
+                num_dropped=self._num_dropped,
+                num_buffered=len(self._buffer),
+            )
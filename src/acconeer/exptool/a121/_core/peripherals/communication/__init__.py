@@ -1,6 +1,8 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
+from .async_client import AsyncClient
+from .async_links import AsyncSocketLink, ThreadedAsyncLink
 from .client import Client
 from .exploration_protocol import (
     ExplorationProtocol,
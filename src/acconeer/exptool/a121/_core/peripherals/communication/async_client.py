@@ -0,0 +1,110 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+from typing import Optional, Type, Union
+
+import acconeer.exptool as et
+from acconeer.exptool.a121._core.entities import ClientInfo
+from acconeer.exptool.a121._core.mediators import (
+    AsyncAgnosticClient,
+    AsyncBufferedLink,
+    CommunicationProtocol,
+    OverflowPolicy,
+)
+
+from .async_links import AsyncSocketLink, ThreadedAsyncLink
+from .client import (
+    autodetermine_client_link,
+    link_factory,
+    make_client_info,
+    select_server_protocol,
+)
+from .exploration_protocol import ExplorationProtocol
+from .links import NullLinkError
+
+
+def async_link_factory(client_info: ClientInfo) -> AsyncBufferedLink:
+    if client_info.ip_address is not None:
+        return AsyncSocketLink(host=client_info.ip_address)
+
+    # There is no asyncio serial or USB transport, the blocking links are run in an executor
+    return ThreadedAsyncLink(link_factory(client_info))
+
+
+class AsyncClient(AsyncAgnosticClient):
+    """The asyncio counterpart of :class:`Client`
+
+    Results are received and decoded in the background while the current one is processed:
+
+    .. code-block:: python
+
+        async with a121.AsyncClient(ip_address="192.168.0.1") as client:
+            await client.setup_session(a121.SensorConfig())
+            await client.start_session()
+
+            async for result in client.results():
+                ...
+
+    Several clients can run concurrently in the same event loop.
+
+    :param prefetch_size: Number of results to buffer
+    :param overflow:
+        What to do when the prefetch buffer is full. Either ``"block"``, to stop receiving
+        until there is room, or ``"drop_oldest"``.
+    """
+
+    _protocol_overridden: bool
+    _client_info: ClientInfo
+
+    def __init__(
+        self,
+        ip_address: Optional[str] = None,
+        serial_port: Optional[str] = None,
+        usb_device: Optional[Union[str, et.utils.USBDevice]] = None,
+        override_baudrate: Optional[int] = None,
+        *,
+        prefetch_size: int = 8,
+        overflow: OverflowPolicy = "block",
+        _override_protocol: Optional[Type[CommunicationProtocol]] = None,
+    ):
+        self._client_info = make_client_info(
+            ip_address=ip_address,
+            serial_port=serial_port,
+            usb_device=usb_device,
+            override_baudrate=override_baudrate,
+        )
+
+        protocol: Type[CommunicationProtocol] = ExplorationProtocol
+        self._protocol_overridden = False
+
+        if _override_protocol is not None:
+            protocol = _override_protocol
+            self._protocol_overridden = True
+
+        super().__init__(
+            link=async_link_factory(self._client_info),
+            protocol=protocol,
+            prefetch_size=prefetch_size,
+            overflow=overflow,
+        )
+
+    @property
+    def client_info(self) -> ClientInfo:
+        return self._client_info
+
+    async def connect(self) -> None:
+        try:
+            await super().connect()
+        except NullLinkError:
+            self._client_info = autodetermine_client_link(self._client_info)
+            self._link = async_link_factory(self.client_info)
+            await super().connect()
+
+        if not self._protocol_overridden:
+            try:
+                self._protocol = select_server_protocol(self._protocol, self.server_info)
+            except Exception:
+                await self.disconnect()
+                raise
@@ -0,0 +1,126 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+from typing import Any, Callable, Optional, TypeVar
+
+from acconeer.exptool.a111._clients.links import LinkError  # type: ignore[import]
+from acconeer.exptool.a121._core.mediators import AsyncBufferedLink, BufferedLink
+
+
+T = TypeVar("T")
+
+
+class AsyncSocketLink(AsyncBufferedLink):
+    """Socket link using asyncio streams, the asyncio counterpart of ``AdaptedSocketLink``"""
+
+    _PORT = 6110
+    _STREAM_LIMIT = 2**20
+
+    def __init__(self, host: str, port: int = _PORT) -> None:
+        self._host = host
+        self._port = port
+        self._timeout = 2.0
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        self._timeout = timeout
+
+    async def _with_timeout(self, coro: Any) -> Any:
+        try:
+            return await asyncio.wait_for(coro, self._timeout)
+        except asyncio.TimeoutError as e:
+            raise LinkError("recv timeout") from e
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            raise LinkError from e
+
+    async def connect(self) -> None:
+        try:
+            self._reader, self._writer = await self._with_timeout(
+                asyncio.open_connection(self._host, self._port, limit=self._STREAM_LIMIT)
+            )
+        except LinkError as e:
+            raise LinkError("failed to connect") from e
+
+    async def recv(self, num_bytes: int) -> bytes:
+        assert self._reader is not None
+        return bytes(await self._with_timeout(self._reader.readexactly(num_bytes)))
+
+    async def recv_until(self, byte_sequence: bytes) -> bytes:
+        assert self._reader is not None
+        return bytes(await self._with_timeout(self._reader.readuntil(byte_sequence)))
+
+    async def send(self, bytes_: bytes) -> None:
+        assert self._writer is not None
+        self._writer.write(bytes_)
+        await self._with_timeout(self._writer.drain())
+
+    async def disconnect(self) -> None:
+        assert self._writer is not None
+        self._writer.close()
+
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
+
+        self._reader = None
+        self._writer = None
+
+
+class ThreadedAsyncLink(AsyncBufferedLink):
+    """Adapts a blocking :class:`BufferedLink` (e.g. a serial or USB link) to asyncio
+
+    The blocking calls are run in the event loop's default executor. A cancelled call returns
+    once the blocking call has finished, i.e. at the latest after the link's timeout, so that
+    the link is never used by two threads at once.
+    """
+
+    def __init__(self, link: BufferedLink) -> None:
+        self._link = link
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_event_loop()
+        future = loop.run_in_executor(None, functools.partial(func, *args))
+
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The blocking call can not be interrupted, only waited for
+            with contextlib.suppress(Exception):
+                await future
+
+            raise
+
+    @property
+    def timeout(self) -> float:
+        return self._link.timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        self._link.timeout = timeout
+
+    async def connect(self) -> None:
+        await self._run(self._link.connect)
+
+    async def recv(self, num_bytes: int) -> bytes:
+        return await self._run(self._link.recv, num_bytes)
+
+    async def recv_until(self, byte_sequence: bytes) -> bytes:
+        return await self._run(self._link.recv_until, byte_sequence)
+
+    async def send(self, bytes_: bytes) -> None:
+        await self._run(self._link.send, bytes_)
+
+    async def disconnect(self) -> None:
+        await self._run(self._link.disconnect)
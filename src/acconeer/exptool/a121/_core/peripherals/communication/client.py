@@ -9,7 +9,7 @@ from typing import Optional, Type, Union
 import attrs
 
 import acconeer.exptool as et
-from acconeer.exptool.a121._core.entities import ClientInfo
+from acconeer.exptool.a121._core.entities import ClientInfo, ServerInfo
 from acconeer.exptool.a121._core.mediators import (
     AgnosticClient,
     BufferedLink,
@@ -59,6 +59,39 @@ def determine_usb_device(usb_device: Optional[USBDevice]) -> USBDevice:
         return usb_device
 
 
+def make_client_info(
+    ip_address: Optional[str],
+    serial_port: Optional[str],
+    usb_device: Optional[Union[str, USBDevice]],
+    override_baudrate: Optional[int],
+) -> ClientInfo:
+    if len([e for e in [ip_address, serial_port, usb_device] if e is not None]) > 1:
+        raise ValueError("Only one connection can be selected")
+
+    if isinstance(usb_device, str):
+        raise NotImplementedError("Selecting device by serial number not supported")
+
+    return ClientInfo(
+        ip_address=ip_address,
+        override_baudrate=override_baudrate,
+        serial_port=serial_port,
+        usb_device=usb_device,
+    )
+
+
+def select_server_protocol(
+    protocol: Type[CommunicationProtocol], server_info: ServerInfo
+) -> Type[CommunicationProtocol]:
+    """Selects the version of the Exploration protocol that the server speaks
+
+    :returns: The protocol to use, ``protocol`` itself if it is not an Exploration protocol
+    """
+    if issubclass(protocol, ExplorationProtocol):
+        return get_exploration_protocol(server_info.parsed_rss_version)
+
+    return protocol
+
+
 def link_factory(client_info: ClientInfo) -> BufferedLink:
 
     if client_info.ip_address is not None:
@@ -118,11 +151,12 @@ class Client(AgnosticClient):
         override_baudrate: Optional[int] = None,
         _override_protocol: Optional[Type[CommunicationProtocol]] = None,
     ):
-        if len([e for e in [ip_address, serial_port, usb_device] if e is not None]) > 1:
-            raise ValueError("Only one connection can be selected")
-
-        if isinstance(usb_device, str):
-            raise NotImplementedError("Selecting device by serial number not supported")
+        self._client_info = make_client_info(
+            ip_address=ip_address,
+            serial_port=serial_port,
+            usb_device=usb_device,
+            override_baudrate=override_baudrate,
+        )
 
         protocol: Type[CommunicationProtocol] = ExplorationProtocol
         self._protocol_overridden = False
@@ -131,13 +165,6 @@ class Client(AgnosticClient):
             protocol = _override_protocol
             self._protocol_overridden = True
 
-        self._client_info = ClientInfo(
-            ip_address=ip_address,
-            override_baudrate=override_baudrate,
-            serial_port=serial_port,
-            usb_device=usb_device,
-        )
-
         super().__init__(
             link=link_factory(self._client_info),
             protocol=protocol,
@@ -156,11 +183,8 @@ class Client(AgnosticClient):
             super().connect()
 
         if not self._protocol_overridden:
-            if issubclass(self._protocol, ExplorationProtocol):
-                try:
-                    new_protocol = get_exploration_protocol(self.server_info.parsed_rss_version)
-                except Exception:
-                    self.disconnect()
-                    raise
-                else:
-                    self._protocol = new_protocol
+            try:
+                self._protocol = select_server_protocol(self._protocol, self.server_info)
+            except Exception:
+                self.disconnect()
+                raise
@@ -4,9 +4,8 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Callable, Optional, Tuple, Type, Union
 
-import attrs
 import numpy as np
 from typing_extensions import Literal, NotRequired, TypedDict
 
@@ -25,6 +24,14 @@ from acconeer.exptool.a121._core.mediators import CommunicationProtocol
 from acconeer.exptool.a121._core.utils import map_over_extended_structure
 
 
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
 GoodStatus = Union[Literal["ok"], Literal["start"], Literal["stop"], Literal["end"]]
 BadStatus = Literal["error"]
 
@@ -325,66 +332,104 @@ class ExplorationProtocol(CommunicationProtocol):
     def get_next_header(
         cls, bytes_: bytes, extended_metadata: list[dict[int, Metadata]], ticks_per_second: int
     ) -> Tuple[int, list[dict[int, Result]]]:
-        header_dict: GetNextHeader = json.loads(bytes_)
-        cls.check_status(header_dict, expected="ok")
-
-        payload_size = header_dict["payload_size"]
-
-        extended_partial_results = []
-        partial_result_groups = header_dict["result_info"]
-
-        for partial_result_group, metadata_group in zip(partial_result_groups, extended_metadata):
-            inner_result = {}
-            for partial_result_dict, (sensor_id, metadata) in zip(
-                partial_result_group, metadata_group.items()
-            ):
-                inner_result[sensor_id] = cls._create_partial_result(
-                    **partial_result_dict, metadata=metadata, ticks_per_second=ticks_per_second
-                )
-
-            extended_partial_results.append(inner_result)
-
-        return payload_size, extended_partial_results
+        return cls.get_next_header_decoder(extended_metadata, ticks_per_second)(bytes_)
 
     @classmethod
-    def _create_partial_result(
-        cls,
-        *,
-        tick: int,
-        ticks_per_second: int,
-        data_saturated: bool,
-        temperature: int,
-        frame_delayed: bool,
-        calibration_needed: bool,
-        metadata: Metadata,
-    ) -> Result:
-        return Result(
-            tick=tick,
-            data_saturated=data_saturated,
-            frame=np.array([0]),
-            temperature=temperature,
-            frame_delayed=frame_delayed,
-            calibration_needed=calibration_needed,
-            context=ResultContext(
-                metadata=metadata,
-                ticks_per_second=ticks_per_second,
-            ),
-        )
+    def get_next_header_decoder(
+        cls, extended_metadata: list[dict[int, Metadata]], ticks_per_second: int
+    ) -> GetNextHeaderDecoder:
+        return GetNextHeaderDecoder(cls, extended_metadata, ticks_per_second)
 
     @classmethod
     def get_next_payload(
         cls, bytes_: bytes, partial_results: list[dict[int, Result]]
     ) -> list[dict[int, Result]]:
+        # The whole payload is interpreted once. Every frame is then a reshaped view into that
+        # single buffer, i.e. no data is copied when decoding. The buffer is owned by the
+        # Results, as it is never reused by the link.
+        payload = np.frombuffer(bytes_, dtype=INT_16_COMPLEX)
+
         start = 0
         for partial_group in partial_results:
             for sensor_id, partial_result in partial_group.items():
                 metadata = partial_result._context.metadata
-                end = start + metadata.frame_data_length * 4  # 4 = sizeof(int_16_complex)
+                num_sweeps, sweep_data_length = metadata.frame_shape
+                end = start + metadata.frame_data_length
 
-                raw_frame_data = bytes_[start:end]
-                assert len(raw_frame_data) == end - start
-                np_frame = np.frombuffer(raw_frame_data, dtype=INT_16_COMPLEX)
-                resized_frame = np.resize(np_frame, metadata.frame_shape)
-                partial_group[sensor_id] = attrs.evolve(partial_result, frame=resized_frame)
+                if end > payload.size:
+                    raise ExplorationProtocolError(
+                        f"Payload is too short. Expected at least {end * INT_16_COMPLEX.itemsize}"
+                        + f" bytes, got {len(bytes_)}."
+                    )
+
+                frame = payload[start : start + num_sweeps * sweep_data_length].reshape(
+                    num_sweeps, sweep_data_length
+                )
+                partial_group[sensor_id] = Result(
+                    data_saturated=partial_result.data_saturated,
+                    frame_delayed=partial_result.frame_delayed,
+                    calibration_needed=partial_result.calibration_needed,
+                    temperature=partial_result.temperature,
+                    frame=frame,
+                    tick=partial_result.tick,
+                    context=partial_result._context,
+                )
                 start = end
         return partial_results
+
+
+class GetNextHeaderDecoder:
+    """Parses headers of data packages for a specific session.
+
+    Everything that is constant during a session, e.g. the ``ResultContext`` of every entry,
+    is created once. Parsing a header is then only a matter of reading the json (using
+    ``orjson`` if it is installed) and creating the partial ``Result``.
+    """
+
+    _EMPTY_FRAME = np.array([0])
+
+    def __init__(
+        self,
+        protocol: Type[ExplorationProtocol],
+        extended_metadata: list[dict[int, Metadata]],
+        ticks_per_second: int,
+    ) -> None:
+        self._protocol = protocol
+        self._layout = [
+            [
+                (
+                    sensor_id,
+                    ResultContext(metadata=metadata, ticks_per_second=ticks_per_second),
+                )
+                for sensor_id, metadata in metadata_group.items()
+            ]
+            for metadata_group in extended_metadata
+        ]
+
+    def __call__(self, bytes_: bytes) -> Tuple[int, list[dict[int, Result]]]:
+        header_dict: GetNextHeader = _json_loads(bytes_)
+
+        if header_dict["status"] != "ok":
+            self._protocol.check_status(header_dict, expected="ok")
+
+        extended_partial_results = []
+
+        for partial_result_group, group_layout in zip(header_dict["result_info"], self._layout):
+            extended_partial_results.append(
+                {
+                    sensor_id: Result(
+                        tick=partial_result_dict["tick"],
+                        data_saturated=partial_result_dict["data_saturated"],
+                        frame=self._EMPTY_FRAME,
+                        temperature=partial_result_dict["temperature"],
+                        frame_delayed=partial_result_dict["frame_delayed"],
+                        calibration_needed=partial_result_dict["calibration_needed"],
+                        context=context,
+                    )
+                    for partial_result_dict, (sensor_id, context) in zip(
+                        partial_result_group, group_layout
+                    )
+                }
+            )
+
+        return header_dict["payload_size"], extended_partial_results
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 import re
-from typing import Callable, Iterator, Tuple, TypeVar
+from typing import Callable, Iterator, Optional, Tuple, TypeVar, Union
 
 import h5py
 import numpy as np
@@ -25,11 +25,27 @@ from acconeer.exptool.a121._core.entities import (
 T = TypeVar("T")
 
 
+# Approximate amount of frame data read per HDF5 call when iterating over results
+_ITERATION_CHUNK_NBYTES = 2**20
+
+
 class H5Record(PersistentRecord):
+    """Record wrapping an HDF5 file
+
+    The session structure, metadata and server info are read once and then cached, so the file
+    must not be modified while it is wrapped.
+    """
+
     file: h5py.File
+    _entries: Optional[list[dict[int, h5py.Group]]]
+    _server_info: Optional[ServerInfo]
+    _result_contexts: dict[str, ResultContext]
 
     def __init__(self, file: h5py.File) -> None:
         self.file = file
+        self._entries = None
+        self._server_info = None
+        self._result_contexts = {}
 
     @property
     def client_info(self) -> ClientInfo:
@@ -43,21 +59,59 @@ class H5Record(PersistentRecord):
     def extended_stacked_results(self) -> list[dict[int, StackedResults]]:
         return self._map_over_entries(self._entry_group_to_stacked_results)
 
-    def _entry_group_to_stacked_results(self, entry_group: h5py.Group) -> StackedResults:
+    def extended_stacked_results_at(self, frames: slice) -> list[dict[int, StackedResults]]:
+        frame_range = range(self.num_frames)[frames]
+
+        if frame_range.step < 0:
+            raise ValueError("Negative steps are not supported")
+
+        # An empty range may have stop < start, which h5py doesn't accept
+        stop = max(frame_range.start, frame_range.stop)
+        h5_slice = slice(frame_range.start, stop, frame_range.step)
+
+        return self._map_over_entries(
+            lambda entry_group: self._entry_group_to_stacked_results(entry_group, h5_slice)
+        )
+
+    def _entry_group_to_stacked_results(
+        self, entry_group: h5py.Group, frames: Union[slice, Tuple[()]] = ()
+    ) -> StackedResults:
         return StackedResults(
-            data_saturated=entry_group["result/data_saturated"][()],
-            calibration_needed=entry_group["result/calibration_needed"][()],
-            temperature=entry_group["result/temperature"][()],
-            tick=entry_group["result/tick"][()],
-            frame_delayed=entry_group["result/frame_delayed"][()],
-            frame=entry_group["result/frame"][()],
+            data_saturated=entry_group["result/data_saturated"][frames],
+            calibration_needed=entry_group["result/calibration_needed"][frames],
+            temperature=entry_group["result/temperature"][frames],
+            tick=entry_group["result/tick"][frames],
+            frame_delayed=entry_group["result/frame_delayed"][frames],
+            frame=entry_group["result/frame"][frames],
             context=self._get_result_context_for_entry_group(entry_group),
         )
 
     @property
     def extended_results(self) -> Iterator[list[dict[int, Result]]]:
-        for frame_no in range(self.num_frames):
-            yield self._get_result_for_all_entries(frame_no)
+        num_frames = self.num_frames
+        chunk_size = self._get_iteration_chunk_size()
+
+        for chunk_start in range(0, num_frames, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, num_frames)
+            chunk = self.extended_stacked_results_at(slice(chunk_start, chunk_stop))
+
+            for frame_no in range(chunk_stop - chunk_start):
+                yield utils.map_over_extended_structure(
+                    lambda stacked_results: stacked_results[frame_no], chunk
+                )
+
+    def extended_result_at(self, index: int) -> list[dict[int, Result]]:
+        frame_no = range(self.num_frames)[index]
+        return self._get_result_for_all_entries(frame_no)
+
+    def _get_iteration_chunk_size(self) -> int:
+        """Number of frames to read per HDF5 call when iterating over results"""
+
+        frame_nbytes: int = max(
+            entry["result/frame"].dtype.itemsize * int(np.prod(entry["result/frame"].shape[1:]))
+            for _, _, entry in self._iterate_entries()
+        )
+        return max(1, _ITERATION_CHUNK_NBYTES // max(frame_nbytes, 1))
 
     def _get_result_for_all_entries(self, frame_no: int) -> list[dict[int, Result]]:
         def entry_group_to_result(entry_group: h5py.Group) -> Result:
@@ -74,10 +128,16 @@ class H5Record(PersistentRecord):
         return self._map_over_entries(entry_group_to_result)
 
     def _get_result_context_for_entry_group(self, entry_group: h5py.Group) -> ResultContext:
-        return ResultContext(
-            metadata=self._get_metadata_for_entry_group(entry_group),
-            ticks_per_second=self.server_info.ticks_per_second,
-        )
+        context = self._result_contexts.get(entry_group.name)
+
+        if context is None:
+            context = ResultContext(
+                metadata=self._get_metadata_for_entry_group(entry_group),
+                ticks_per_second=self.server_info.ticks_per_second,
+            )
+            self._result_contexts[entry_group.name] = context
+
+        return context
 
     @property
     def lib_version(self) -> str:
@@ -90,7 +150,10 @@ class H5Record(PersistentRecord):
 
     @property
     def server_info(self) -> ServerInfo:
-        return ServerInfo.from_json(self.file["server_info"][()])
+        if self._server_info is None:
+            self._server_info = ServerInfo.from_json(self.file["server_info"][()])
+
+        return self._server_info
 
     @property
     def session_config(self) -> SessionConfig:
@@ -113,6 +176,12 @@ class H5Record(PersistentRecord):
         self.file.close()
 
     def _get_entries(self) -> list[dict[int, h5py.Group]]:
+        if self._entries is None:
+            self._entries = self._read_entries()
+
+        return self._entries
+
+    def _read_entries(self) -> list[dict[int, h5py.Group]]:
         structure: dict[int, dict[int, h5py.Group]] = {}
 
         for k, v in self.file["session"].items():
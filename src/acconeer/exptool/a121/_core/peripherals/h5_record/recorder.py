@@ -45,22 +45,49 @@ def get_uuid() -> str:
 
 
 class H5Recorder(Recorder):
+    """Records to a HDF5 file
+
+    :param path_or_file: A path or an opened file (:class:`h5py.File`) to record to.
+    :param mode: The mode used if a path is given.
+    :param buffer_size:
+        Number of frames (per entry) kept in memory before they are written to the file. With a
+        ``buffer_size`` larger than 1, frames are written in batches and the datasets are grown
+        geometrically, which is considerably faster for high frame rates. The buffered frames
+        are always written when the recording is stopped, but frames still in the buffer are
+        lost if the program crashes.
+    :param compression: Optional compression of the result datasets, ``"gzip"`` or ``"lzf"``.
+    """
+
     path: Optional[os.PathLike]
     file: h5py.File
     owns_file: bool
     _num_frames: int
+    _buffer_size: int
+    _compression: Optional[str]
+    _writers: list[list[_ResultWriter]]
 
     def __init__(
         self,
         path_or_file: PathOrH5File,
         mode: str = "x",
         *,
+        buffer_size: int = 1,
+        compression: Optional[str] = None,
         _lib_version: Optional[str] = None,
         _timestamp: Optional[str] = None,
         _uuid: Optional[str] = None,
     ) -> None:
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+
+        if compression not in [None, "gzip", "lzf"]:
+            raise ValueError(f"Unsupported compression: {compression}")
+
         self.file, self.owns_file = h5_file_factory(path_or_file, h5_file_mode=mode)
         self.path = Path(self.file.filename) if self.owns_file else None
+        self._buffer_size = buffer_size
+        self._compression = compression
+        self._writers = []
 
         if _lib_version is None:
             _lib_version = importlib_metadata.version("acconeer-exptool")
@@ -130,6 +157,7 @@ class H5Recorder(Recorder):
 
         for i, metadata_group_dict in enumerate(extended_metadata):
             group_group = session_group.create_group(f"group_{i}")
+            writer_group = []
 
             for entry_id, (sensor_id, metadata) in enumerate(metadata_group_dict.items()):
                 entry_group = group_group.create_group(f"entry_{entry_id}")
@@ -143,90 +171,32 @@ class H5Recorder(Recorder):
                 )
 
                 result_group = entry_group.create_group("result")
-                self._create_result_datasets(result_group, metadata)
+                writer_group.append(
+                    _ResultWriter(
+                        result_group,
+                        metadata,
+                        buffer_size=self._buffer_size,
+                        compression=self._compression,
+                    )
+                )
+
+            self._writers.append(writer_group)
 
     def _sample(self, extended_result: list[dict[int, Result]]) -> None:
-        for group_index, result_group_dict in enumerate(extended_result):
-            for entry_id, result in enumerate(result_group_dict.values()):
-                result_group = self.file[f"session/group_{group_index}/entry_{entry_id}/result"]
-                self._write_result(result_group, self._num_frames, result)
+        for result_group_dict, writer_group in zip(extended_result, self._writers):
+            for result, writer in zip(result_group_dict.values(), writer_group):
+                writer.append(result)
 
         self._num_frames += 1
 
     def _stop(self) -> Any:
+        for writer_group in self._writers:
+            for writer in writer_group:
+                writer.close()
+
         if self.owns_file:
             self.file.close()
 
-    @staticmethod
-    def _create_result_datasets(g: h5py.Group, metadata: Metadata) -> None:
-        g.create_dataset(
-            "data_saturated",
-            shape=(0,),
-            maxshape=(None,),
-            dtype=bool,
-            track_times=False,
-        )
-        g.create_dataset(
-            "frame_delayed",
-            shape=(0,),
-            maxshape=(None,),
-            dtype=bool,
-            track_times=False,
-        )
-        g.create_dataset(
-            "calibration_needed",
-            shape=(0,),
-            maxshape=(None,),
-            dtype=bool,
-            track_times=False,
-        )
-        g.create_dataset(
-            "temperature",
-            shape=(0,),
-            maxshape=(None,),
-            dtype=int,
-            track_times=False,
-        )
-
-        g.create_dataset(
-            "tick",
-            shape=(0,),
-            maxshape=(None,),
-            dtype=np.dtype("int64"),
-            track_times=False,
-        )
-
-        g.create_dataset(
-            "frame",
-            shape=(0, *metadata.frame_shape),
-            maxshape=(None, *metadata.frame_shape),
-            dtype=INT_16_COMPLEX,
-            track_times=False,
-        )
-
-    @staticmethod
-    def _write_result(g: h5py.Group, index: int, result: Result) -> None:
-        """Extends the Dataset to the appropriate (new) size with .resize,
-        and then copies the data over
-        """
-        datasets_to_extend = [
-            "data_saturated",
-            "frame_delayed",
-            "calibration_needed",
-            "temperature",
-            "tick",
-            "frame",
-        ]
-        for dataset_name in datasets_to_extend:
-            g[dataset_name].resize(size=index + 1, axis=0)
-
-        g["data_saturated"][index] = result.data_saturated
-        g["frame_delayed"][index] = result.frame_delayed
-        g["calibration_needed"][index] = result.calibration_needed
-        g["temperature"][index] = result.temperature
-        g["tick"][index] = result.tick
-        g["frame"][index] = result._frame
-
     def require_algo_group(self, key: str) -> h5py.Group:
         group = self.file.require_group("algo")
 
@@ -243,3 +213,115 @@ class H5Recorder(Recorder):
             )
 
         return group
+
+
+class _ResultWriter:
+    """Writes the Results of a single entry to its "result" group
+
+    Results are buffered column-wise and written with a single slice assignment per dataset
+    every ``buffer_size`` frames. The datasets are grown geometrically if ``buffer_size > 1``,
+    and trimmed to the number of written frames on :meth:`close`.
+    """
+
+    _FRAME_CHUNK_BYTES = 2**20
+    _SCALAR_CHUNK_LENGTH = 4096
+    _SCALAR_DTYPES = {
+        "data_saturated": np.dtype(bool),
+        "frame_delayed": np.dtype(bool),
+        "calibration_needed": np.dtype(bool),
+        "temperature": np.dtype(int),
+        "tick": np.dtype("int64"),
+    }
+
+    def __init__(
+        self,
+        g: h5py.Group,
+        metadata: Metadata,
+        *,
+        buffer_size: int,
+        compression: Optional[str],
+    ) -> None:
+        self._buffer_size = buffer_size
+        self._num_buffered = 0
+        self._num_written = 0
+        self._capacity = 0
+
+        self._datasets = {
+            name: g.create_dataset(
+                name,
+                shape=(0,),
+                maxshape=(None,),
+                dtype=dtype,
+                chunks=(self._SCALAR_CHUNK_LENGTH,),
+                compression=compression,
+                track_times=False,
+            )
+            for name, dtype in self._SCALAR_DTYPES.items()
+        }
+        self._buffers = {
+            name: np.empty(buffer_size, dtype=dtype) for name, dtype in self._SCALAR_DTYPES.items()
+        }
+
+        frame_shape = metadata.frame_shape
+        frame_num_bytes = metadata.frame_data_length * INT_16_COMPLEX.itemsize
+        frames_per_chunk = max(1, self._FRAME_CHUNK_BYTES // frame_num_bytes)
+        self._datasets["frame"] = g.create_dataset(
+            "frame",
+            shape=(0, *frame_shape),
+            maxshape=(None, *frame_shape),
+            dtype=INT_16_COMPLEX,
+            chunks=(frames_per_chunk, *frame_shape),
+            compression=compression,
+            track_times=False,
+        )
+        self._buffers["frame"] = np.empty((buffer_size, *frame_shape), dtype=INT_16_COMPLEX)
+
+    def append(self, result: Result) -> None:
+        i = self._num_buffered
+        buffers = self._buffers
+
+        buffers["data_saturated"][i] = result.data_saturated
+        buffers["frame_delayed"][i] = result.frame_delayed
+        buffers["calibration_needed"][i] = result.calibration_needed
+        buffers["temperature"][i] = result.temperature
+        buffers["tick"][i] = result.tick
+        buffers["frame"][i] = result._frame
+
+        self._num_buffered += 1
+
+        if self._num_buffered == self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered Results to the datasets"""
+        if self._num_buffered == 0:
+            return
+
+        start = self._num_written
+        end = start + self._num_buffered
+
+        if end > self._capacity:
+            if self._buffer_size > 1:
+                self._capacity = max(end, 2 * self._capacity)
+            else:
+                self._capacity = end
+
+            self._resize(self._capacity)
+
+        for name, dataset in self._datasets.items():
+            dataset[start:end] = self._buffers[name][: self._num_buffered]
+
+        self._num_written = end
+        self._num_buffered = 0
+
+    def close(self) -> None:
+        """Flushes the buffer and trims the datasets to the number of written frames"""
+        self.flush()
+
+        if self._capacity != self._num_written:
+            self._capacity = self._num_written
+            self._resize(self._capacity)
+
+    def _resize(self, size: int) -> None:
+        for dataset in self._datasets.values():
+            dataset.resize(size, axis=0)
@@ -2,3 +2,4 @@
 # All rights reserved
 
 from ._replaying_client import _ReplayingClient, _StopReplay
+from ._simulated_server import _SimulatedExplorationServer
@@ -10,6 +10,7 @@ from acconeer.exptool.a121 import (
     Client,
     ClientError,
     ClientInfo,
+    LatencyMonitor,
     Metadata,
     Record,
     Recorder,
@@ -18,6 +19,7 @@ from acconeer.exptool.a121 import (
     ServerInfo,
     SessionConfig,
 )
+from acconeer.exptool.a121._core.mediators import OverflowPolicy
 
 
 class _StopReplay(Exception):
@@ -54,10 +56,23 @@ class _ReplayingClient(Client):  # TODO: Add a Client ABC/Protocol
         else:
             return self._record.metadata
 
-    def start_session(self, recorder: Optional[Recorder] = None) -> None:
+    def start_session(
+        self,
+        recorder: Optional[Recorder] = None,
+        *,
+        latency_monitor: Optional[LatencyMonitor] = None,
+        prefetch_depth: Optional[int] = None,
+        prefetch_overflow: OverflowPolicy = "block",
+    ) -> None:
         if recorder is not None:
             raise ValueError(f"{type(self).__name__} can not record")
 
+        if latency_monitor is not None:
+            raise ValueError(f"{type(self).__name__} can not monitor latency")
+
+        if prefetch_depth is not None:
+            raise ValueError(f"{type(self).__name__} can not prefetch")
+
         if self.session_config.extended:
             self._result_iterator = self._record.extended_results
         else:
@@ -0,0 +1,524 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import socketserver
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from acconeer.exptool.a121 import (
+    SDK_VERSION,
+    Metadata,
+    Profile,
+    Record,
+    SensorConfig,
+    SessionConfig,
+    load_record,
+)
+from acconeer.exptool.a121._core.entities import INT_16_COMPLEX
+from acconeer.exptool.a121._core.peripherals.communication.exploration_protocol import (
+    ExplorationProtocol,
+)
+
+
+log = logging.getLogger(__name__)
+
+_PRF_FROM_STR = {value: key for key, value in ExplorationProtocol.PRF_MAPPING.items()}
+_IDLE_STATE_FROM_STR = {
+    value: key for key, value in ExplorationProtocol.IDLE_STATE_MAPPING.items()
+}
+
+# Rough timing model of a sweep, used for the max sweep rate in the metadata
+_POINT_DURATION_S = 0.5e-6
+_SUBSWEEP_OVERHEAD_S = 20e-6
+
+_BASE_STEP_LENGTH_M = 2.5e-3
+_CALIBRATION_TEMPERATURE = 25
+_NUM_SYNTHETIC_FRAMES = 8
+
+
+def session_config_from_setup_command(command: dict[str, Any]) -> SessionConfig:
+    """Parses a setup command, as created by ``ExplorationProtocol.setup_command``"""
+
+    groups = []
+    for group_list in command["groups"]:
+        group = {}
+        for entry in group_list:
+            config_dict = dict(entry["config"])
+            config_dict["sweep_rate"] = config_dict["sweep_rate"] or None
+            config_dict["frame_rate"] = config_dict["frame_rate"] or None
+            config_dict["inter_frame_idle_state"] = _IDLE_STATE_FROM_STR[
+                config_dict["inter_frame_idle_state"]
+            ]
+            config_dict["inter_sweep_idle_state"] = _IDLE_STATE_FROM_STR[
+                config_dict["inter_sweep_idle_state"]
+            ]
+            config_dict["subsweeps"] = [
+                dict(
+                    subsweep_dict,
+                    profile=Profile(subsweep_dict["profile"]),
+                    prf=_PRF_FROM_STR[subsweep_dict["prf"]],
+                )
+                for subsweep_dict in config_dict["subsweeps"]
+            ]
+            group[entry["sensor_id"]] = SensorConfig.from_dict(config_dict)
+
+        groups.append(group)
+
+    return SessionConfig(groups, update_rate=command.get("update_rate"), extended=True)
+
+
+def simulate_metadata(sensor_config: SensorConfig) -> Metadata:
+    """Computes the metadata the sensor would report for ``sensor_config``"""
+
+    subsweep_data_length = np.array([subsweep.num_points for subsweep in sensor_config.subsweeps])
+    subsweep_data_offset = np.concatenate(([0], np.cumsum(subsweep_data_length)[:-1]))
+    sweep_data_length = int(subsweep_data_length.sum())
+    sweep_duration = sum(
+        subsweep.num_points * subsweep.hwaas * _POINT_DURATION_S + _SUBSWEEP_OVERHEAD_S
+        for subsweep in sensor_config.subsweeps
+    )
+
+    return Metadata(
+        frame_data_length=sweep_data_length * sensor_config.sweeps_per_frame,
+        sweep_data_length=sweep_data_length,
+        subsweep_data_offset=subsweep_data_offset,
+        subsweep_data_length=subsweep_data_length,
+        calibration_temperature=_CALIBRATION_TEMPERATURE,
+        tick_period=0,
+        base_step_length_m=_BASE_STEP_LENGTH_M,
+        max_sweep_rate=1.0 / sweep_duration,
+    )
+
+
+def simulate_update_period(
+    session_config: SessionConfig, extended_metadata: list[dict[int, Metadata]]
+) -> float:
+    """The time between two data packages of the session, in seconds"""
+
+    if session_config.update_rate is not None:
+        return 1.0 / session_config.update_rate
+
+    # The groups are measured one after the other, the sensors of a group simultaneously
+    period = 0.0
+    for config_group, metadata_group in zip(session_config.groups, extended_metadata):
+        group_period = 0.0
+
+        for sensor_id, sensor_config in config_group.items():
+            if sensor_config.frame_rate is not None:
+                frame_period = 1.0 / sensor_config.frame_rate
+            else:
+                sweep_rate = sensor_config.sweep_rate or metadata_group[sensor_id].max_sweep_rate
+                frame_period = sensor_config.sweeps_per_frame / sweep_rate
+
+            group_period = max(group_period, frame_period)
+
+        period += group_period
+
+    return period
+
+
+def _synthetic_frames(metadata: Metadata, seed: int) -> list[npt.NDArray[Any]]:
+    """A few frames of noise and a single, slowly moving, echo"""
+
+    rng = np.random.default_rng(seed)
+    num_sweeps, sweep_data_length = metadata.frame_shape
+    echo_envelope = 1000 * np.exp(
+        -0.5 * ((np.arange(sweep_data_length) - 0.4 * sweep_data_length) / 4) ** 2
+    )
+
+    frames = []
+    for i in range(_NUM_SYNTHETIC_FRAMES):
+        phase = 2 * np.pi * (i / _NUM_SYNTHETIC_FRAMES + np.arange(num_sweeps)[:, None] / 64)
+        noise = rng.normal(scale=20, size=(2, num_sweeps, sweep_data_length))
+        complex_frame = echo_envelope * np.exp(1j * phase) + noise[0] + 1j * noise[1]
+
+        frame = np.empty((num_sweeps, sweep_data_length), dtype=INT_16_COMPLEX)
+        frame["real"] = np.round(complex_frame.real)
+        frame["imag"] = np.round(complex_frame.imag)
+        frames.append(frame)
+
+    return frames
+
+
+class _StreamingSession:
+    """Streams the data packages of a set up session over a connection"""
+
+    def __init__(
+        self,
+        connection: _ConnectionHandler,
+        session_config: SessionConfig,
+        extended_metadata: list[dict[int, Metadata]],
+    ) -> None:
+        server = connection.server
+        assert isinstance(server, _TCPServer)
+        simulator = server.simulator
+
+        self._connection = connection
+        self._ticks_per_second = simulator.ticks_per_second
+        self._period = simulator.time_scale * simulate_update_period(
+            session_config, extended_metadata
+        )
+        self._realtime = simulator.time_scale > 0
+
+        if simulator.record is not None:
+            self._payloads = self._record_payloads(simulator.record)
+        else:
+            self._payloads = self._synthetic_payloads(extended_metadata)
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def _synthetic_payloads(
+        extended_metadata: list[dict[int, Metadata]]
+    ) -> Iterator[tuple[list[list[dict[str, Any]]], bytes]]:
+        entries = [
+            [_synthetic_frames(metadata, seed=sensor_id) for sensor_id, metadata in group.items()]
+            for group in extended_metadata
+        ]
+        payloads = [
+            b"".join(frames[i].tobytes() for group in entries for frames in group)
+            for i in range(_NUM_SYNTHETIC_FRAMES)
+        ]
+        result_info = [
+            [
+                dict(
+                    data_saturated=False,
+                    frame_delayed=False,
+                    calibration_needed=False,
+                    temperature=_CALIBRATION_TEMPERATURE,
+                )
+                for _ in group
+            ]
+            for group in entries
+        ]
+
+        while True:
+            for payload in payloads:
+                yield result_info, payload
+
+    @staticmethod
+    def _record_payloads(
+        record: Record,
+    ) -> Iterator[tuple[list[list[dict[str, Any]]], bytes]]:
+        while True:
+            for extended_results in record.extended_results:
+                result_info = [
+                    [
+                        dict(
+                            data_saturated=bool(result.data_saturated),
+                            frame_delayed=False,
+                            calibration_needed=bool(result.calibration_needed),
+                            temperature=int(result.temperature),
+                        )
+                        for result in group.values()
+                    ]
+                    for group in extended_results
+                ]
+                payload = b"".join(
+                    np.ascontiguousarray(result._frame).tobytes()
+                    for group in extended_results
+                    for result in group.values()
+                )
+                yield result_info, payload
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        start_time = time.monotonic()
+        next_time = start_time
+
+        try:
+            for result_info, payload in self._payloads:
+                now = time.monotonic()
+                frame_delayed = False
+
+                if self._realtime:
+                    if next_time > now:
+                        if self._stop_event.wait(next_time - now):
+                            return
+
+                        now = time.monotonic()
+                    elif now - next_time > self._period:
+                        # The client did not keep up, the sensor would have skipped frames
+                        frame_delayed = True
+                        next_time = now
+
+                if self._stop_event.is_set():
+                    return
+
+                tick = int((now - start_time) * self._ticks_per_second) & 0xFFFFFFFF
+
+                for group in result_info:
+                    for entry in group:
+                        entry["tick"] = tick
+                        entry["frame_delayed"] = frame_delayed
+
+                header = {"status": "ok", "result_info": result_info, "payload_size": len(payload)}
+                self._connection.send(
+                    json.dumps(header, separators=(",", ":")).encode() + b"\n" + payload
+                )
+
+                next_time += self._period
+        except OSError:
+            log.debug("Connection lost while streaming")
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    def setup(self) -> None:
+        super().setup()
+        self._send_lock = threading.Lock()
+        self._session_config: Optional[SessionConfig] = None
+        self._extended_metadata: Optional[list[dict[int, Metadata]]] = None
+        self._streaming_session: Optional[_StreamingSession] = None
+
+    def send(self, bytes_: bytes) -> None:
+        with self._send_lock:
+            self.request.sendall(bytes_)
+
+    def _respond(self, response: dict[str, Any]) -> None:
+        self.send(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+
+    def handle(self) -> None:
+        try:
+            for line in self.rfile:
+                try:
+                    command = json.loads(line)
+                    response = self._handle_command(command)
+                except Exception as exc:
+                    response = {"status": "error", "message": str(exc)}
+
+                if response is not None:
+                    self._respond(response)
+        except OSError:
+            pass
+        finally:
+            if self._streaming_session is not None:
+                self._streaming_session.stop()
+
+    def _handle_command(self, command: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Handles a command, returning the response to it (if not already sent)"""
+        server = self.server
+        assert isinstance(server, _TCPServer)
+        simulator = server.simulator
+
+        cmd = command["cmd"]
+
+        if cmd == "get_sensor_info":
+            return {
+                "status": "ok",
+                "sensor_info": [
+                    {"connected": True, "serial": f"SIM-{i}"}
+                    for i in range(1, simulator.sensor_count + 1)
+                ],
+            }
+
+        if cmd == "get_system_info":
+            return {
+                "status": "ok",
+                "system_info": {
+                    "rss_version": simulator.rss_version,
+                    "sensor": "a121",
+                    "sensor_count": simulator.sensor_count,
+                    "ticks_per_second": simulator.ticks_per_second,
+                    "hw": "simulated",
+                },
+            }
+
+        if cmd == "setup":
+            if self._streaming_session is not None:
+                raise RuntimeError("Can not setup while streaming")
+
+            session_config = session_config_from_setup_command(command)
+            session_config.validate()
+
+            for group in session_config.groups:
+                for sensor_id in group:
+                    if not 1 <= sensor_id <= simulator.sensor_count:
+                        raise ValueError(f"Sensor {sensor_id} is not connected")
+
+            if simulator.record is not None:
+                if session_config.groups != simulator.record.session_config.groups:
+                    raise ValueError("The session config does not match the record")
+
+                extended_metadata = simulator.record.extended_metadata
+            else:
+                extended_metadata = [
+                    {sensor_id: simulate_metadata(config) for sensor_id, config in group.items()}
+                    for group in session_config.groups
+                ]
+
+            self._session_config = session_config
+            self._extended_metadata = extended_metadata
+
+            update_period = simulate_update_period(session_config, extended_metadata)
+            return {
+                "status": "ok",
+                "tick_period": round(update_period * simulator.ticks_per_second),
+                "metadata": [
+                    [
+                        {
+                            "frame_data_length": metadata.frame_data_length,
+                            "sweep_data_length": metadata.sweep_data_length,
+                            "subsweep_data_offset": metadata.subsweep_data_offset.tolist(),
+                            "subsweep_data_length": metadata.subsweep_data_length.tolist(),
+                            "calibration_temperature": metadata.calibration_temperature,
+                            "base_step_length_m": metadata.base_step_length_m,
+                            "max_sweep_rate": metadata.max_sweep_rate,
+                        }
+                        for metadata in group.values()
+                    ]
+                    for group in extended_metadata
+                ],
+            }
+
+        if cmd == "start_streaming":
+            if self._session_config is None or self._extended_metadata is None:
+                raise RuntimeError("Session is not set up")
+
+            if self._streaming_session is not None:
+                raise RuntimeError("Already streaming")
+
+            self._streaming_session = _StreamingSession(
+                self, self._session_config, self._extended_metadata
+            )
+            # The response has to be sent before the first data package
+            self._respond({"status": "start"})
+            self._streaming_session.start()
+            return None
+
+        if cmd == "stop_streaming":
+            if self._streaming_session is None:
+                raise RuntimeError("Not streaming")
+
+            self._streaming_session.stop()
+            self._streaming_session = None
+            return {"status": "stop"}
+
+        raise ValueError(f"Unknown command {cmd!r}")
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, simulator: _SimulatedExplorationServer, address: tuple[str, int]) -> None:
+        self.simulator = simulator
+        super().__init__(address, _ConnectionHandler)
+
+
+class _SimulatedExplorationServer:
+    """A local simulated Exploration Server, speaking the same protocol as the real one
+
+    Connect to it with ``a121.Client(ip_address="localhost")``. The simulator computes the
+    metadata from the set up session config and streams synthetic frames at the rate of the
+    session, or, if given a record, the frames of the record. Every connection is served in
+    its own thread, so several clients can stream at once.
+
+    .. code-block:: python
+
+        with a121._SimulatedExplorationServer():
+            with a121.Client(ip_address="localhost") as client:
+                ...
+
+    :param host: The address to listen on
+    :param port: The port to listen on. Clients always connect to 6110.
+    :param record: Optional record to stream the frames of, repeatedly
+    :param sensor_count: Number of simulated sensors
+    :param ticks_per_second: The rate of the server's tick counter
+    :param time_scale:
+        Scales the time between the frames. ``0`` streams as fast as the client receives.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6110,
+        *,
+        record: Optional[Record] = None,
+        sensor_count: int = 5,
+        ticks_per_second: int = 1000000,
+        time_scale: float = 1.0,
+    ) -> None:
+        if time_scale < 0:
+            raise ValueError("time_scale can not be negative")
+
+        self.record = record
+        self.sensor_count = sensor_count
+        self.ticks_per_second = ticks_per_second
+        self.time_scale = time_scale
+        self.rss_version = f"a121-v{SDK_VERSION}"
+        self._tcp_server = _TCPServer(self, (host, port))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self._tcp_server.server_address[:2]
+        return (str(host), int(port))
+
+    def start(self) -> None:
+        """Starts serving in a background thread"""
+        self._thread = threading.Thread(target=self._tcp_server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        self._tcp_server.serve_forever()
+
+    def stop(self) -> None:
+        self._tcp_server.shutdown()
+        self._tcp_server.server_close()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> _SimulatedExplorationServer:
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulated A121 Exploration Server")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6110)
+    parser.add_argument("--record", help="Stream the frames of this record")
+    parser.add_argument("--sensor-count", type=int, default=5)
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    server = _SimulatedExplorationServer(
+        args.host,
+        args.port,
+        record=None if args.record is None else load_record(args.record),
+        sensor_count=args.sensor_count,
+        time_scale=args.time_scale,
+    )
+    log.info(f"Listening on {server.address}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -8,4 +8,9 @@ from ._base import (
     GenericProcessorBase,
     ProcessorBase,
 )
-from ._utils import get_approx_fft_vels, get_approx_sweep_rate, get_distances_m
+from ._utils import (
+    get_approx_fft_vels,
+    get_approx_sweep_rate,
+    get_distances_m,
+    get_stacked_frames,
+)
@@ -6,7 +6,7 @@ from __future__ import annotations
 import abc
 import enum
 import json
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar
 
 import attrs
 
@@ -37,6 +37,14 @@ class GenericProcessorBase(abc.ABC, Generic[InputT, ConfigT, ResultT, MetadataT]
     def process(self, result: InputT) -> ResultT:
         ...
 
+    def process_batch(self, results: Iterable[InputT]) -> list[ResultT]:
+        """Processes a batch of results, e.g. a :class:`a121.StackedResults`
+
+        Gives the same processor results as calling :meth:`process` for every result, in order.
+        Processors may override this with a vectorized implementation.
+        """
+        return [self.process(result) for result in results]
+
     @abc.abstractmethod
     def update_config(self, config: ConfigT) -> None:
         ...
@@ -7,6 +7,8 @@ import abc
 import logging
 from typing import Generic, Optional, TypeVar
 
+import attrs
+
 import pyqtgraph as pg
 
 from acconeer.exptool.app.new import (
@@ -14,6 +16,7 @@ from acconeer.exptool.app.new import (
     BackendPlugin,
     GeneralMessage,
     PlotPlugin,
+    SharedMemoryPayload,
     ViewPlugin,
 )
 
@@ -53,7 +56,17 @@ class A121PlotPluginBase(PlotPlugin):
             return
 
         try:
-            self.update_from_message(self._plot_job)
+            message = self._plot_job
+
+            if isinstance(message.data, SharedMemoryPayload):
+                data = message.data.load()
+
+                if data is None:  # Overwritten by newer plot data, which will be drawn instead
+                    return
+
+                message = attrs.evolve(message, data=data)
+
+            self.update_from_message(message)
         finally:
             self._plot_job = None
 
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Iterable, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -39,3 +39,15 @@ def get_approx_fft_vels(config: a121.SensorConfig) -> Tuple[npt.NDArray, float]:
     freqs = np.fft.fftshift(np.fft.fftfreq(spf))  # type: ignore[call-overload]
     f_to_v = 2.5e-3 * sweep_rate
     return freqs * f_to_v, f_res * f_to_v
+
+
+def get_stacked_frames(results: Iterable[a121.Result]) -> npt.NDArray[np.complex_]:
+    """Gets the frames of a batch of results, stacked in the first dimension
+
+    A :class:`a121.StackedResults` is converted in one go, without creating a :class:`a121.Result`
+    per frame.
+    """
+    if isinstance(results, a121.StackedResults):
+        return results.frame
+
+    return np.array([result.frame for result in results])
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import copy
 import enum
-from typing import Any, List, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Tuple, cast
 
 import attrs
 import numpy as np
@@ -13,7 +13,18 @@ import numpy.typing as npt
 from scipy.signal import butter, filtfilt
 
 from acconeer.exptool import a121
-from acconeer.exptool.a121.algo import AlgoConfigBase, AlgoParamEnum, ProcessorBase
+from acconeer.exptool._algo_utils import (  # type: ignore[import]
+    calculate_cfar_window_mean,
+    find_peaks,
+    interpolate_peaks,
+)
+from acconeer.exptool.a121._core.entities.containers.utils import get_subsweeps_from_frame
+from acconeer.exptool.a121.algo import (
+    AlgoConfigBase,
+    AlgoParamEnum,
+    ProcessorBase,
+    get_stacked_frames,
+)
 
 
 DEFAULT_SC_BG_NUM_STD_DEV = 6.0
@@ -295,23 +306,7 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
             raise ValueError(ERROR_MSG)
 
     def process(self, result: a121.Result) -> ProcessorResult:
-        range_subframes = [result.subframes[i] for i in self.range_subsweep_indexes]
-        frame = np.concatenate(range_subframes, axis=1)
-        if self.processor_config.measurement_type == MeasurementType.CLOSE_RANGE:
-            lb_angle = np.angle(result.subframes[self.CLOSE_RANGE_LOOPBACK_IDX]).astype(float)
-            if (
-                self.processor_config.processor_mode
-                == ProcessorMode.RECORDED_THRESHOLD_CALIBRATION
-            ):
-                lb_angle += self.PHASE_JITTER_RESTART_STD / (self.threshold_sensitivity + 1e-10)
-
-            if self.processor_mode != ProcessorMode.LEAKAGE_CALIBRATION:
-                frame = self._apply_phase_jitter_compensation(self.context, frame, lb_angle)
-
-        sweep = frame.mean(axis=0)
-        filtered_sweep = filtfilt(self.b, self.a, sweep)
-        abs_sweep = np.abs(filtered_sweep)
-        abs_sweep = abs_sweep[self.filt_margin : -self.filt_margin]
+        frame, lb_angle, abs_sweep = self._calculate_abs_sweep(result.subframes)
 
         if self.processor_mode == ProcessorMode.DISTANCE_ESTIMATION:
             return self._process_distance_estimation(abs_sweep)
@@ -325,6 +320,61 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
 
         raise RuntimeError
 
+    def process_batch(self, results: Iterable[a121.Result]) -> list[ProcessorResult]:
+        frames = get_stacked_frames(results)
+        if frames.size == 0:
+            return []
+
+        subframes = get_subsweeps_from_frame(frames, self.metadata)
+        frames, lb_angles, abs_sweeps = self._calculate_abs_sweep(subframes)
+
+        if self.processor_mode == ProcessorMode.DISTANCE_ESTIMATION:
+            return self._process_distance_estimation_batch(abs_sweeps)
+        elif self.processor_mode == ProcessorMode.LEAKAGE_CALIBRATION:
+            return [
+                ProcessorResult(
+                    phase_jitter_comp_reference=None if lb_angles is None else lb_angles[i],
+                    direct_leakage=frame,
+                )
+                for i, frame in enumerate(frames)
+            ]
+        elif self.processor_mode == ProcessorMode.RECORDED_THRESHOLD_CALIBRATION:
+            # The calibration accumulates over frames, so only the sweeps are vectorized
+            return [
+                self._process_recorded_threshold_calibration(abs_sweep) for abs_sweep in abs_sweeps
+            ]
+
+        raise RuntimeError
+
+    def _calculate_abs_sweep(
+        self, subframes: list[npt.NDArray[np.complex_]]
+    ) -> Tuple[npt.NDArray[np.complex_], Optional[npt.NDArray[np.float_]], npt.NDArray[np.float_]]:
+        """Calculates the filtered absolute sweep of a frame, or of frames stacked in the first
+        dimension.
+
+        :returns: The (compensated) range frame, the loopback angle and the absolute sweep
+        """
+        range_subframes = [subframes[i] for i in self.range_subsweep_indexes]
+        frame = np.concatenate(range_subframes, axis=-1)
+        lb_angle = None
+        if self.processor_config.measurement_type == MeasurementType.CLOSE_RANGE:
+            lb_angle = np.angle(subframes[self.CLOSE_RANGE_LOOPBACK_IDX]).astype(float)
+            if (
+                self.processor_config.processor_mode
+                == ProcessorMode.RECORDED_THRESHOLD_CALIBRATION
+            ):
+                lb_angle += self.PHASE_JITTER_RESTART_STD / (self.threshold_sensitivity + 1e-10)
+
+            if self.processor_mode != ProcessorMode.LEAKAGE_CALIBRATION:
+                frame = self._apply_phase_jitter_compensation(self.context, frame, lb_angle)
+
+        sweep = frame.mean(axis=-2)
+        filtered_sweep = filtfilt(self.b, self.a, sweep, axis=-1)
+        abs_sweep = np.abs(filtered_sweep)
+        abs_sweep = abs_sweep[..., self.filt_margin : -self.filt_margin]
+
+        return frame, lb_angle, abs_sweep
+
     @staticmethod
     def _apply_phase_jitter_compensation(
         context: ProcessorContext,
@@ -395,22 +445,57 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
             self.base_step_length_m,
         )
 
+        return ProcessorResult(
+            estimated_distances=estimated_distances,
+            estimated_amplitudes=estimated_amplitudes,
+            extra_result=self._get_distance_estimation_extra_result(abs_sweep, self.threshold),
+        )
+
+    def _process_distance_estimation_batch(
+        self, abs_sweeps: npt.NDArray[np.float_]
+    ) -> list[ProcessorResult]:
+        thresholds = np.broadcast_to(self._update_threshold(abs_sweeps), abs_sweeps.shape)
+        self.threshold = thresholds[-1].copy()
+
+        found_peaks_idxs = cast(List[List[int]], find_peaks(abs_sweeps, thresholds))
+        num_peaks = [len(peak_idxs) for peak_idxs in found_peaks_idxs]
+        frame_idxs = np.repeat(np.arange(len(abs_sweeps)), num_peaks)
+        peak_locs, peak_amplitudes = interpolate_peaks(
+            abs_sweeps, np.concatenate(found_peaks_idxs), frame_idxs=frame_idxs
+        )
+        peak_distances = (
+            self.start_point_cropped + peak_locs * self.step_length
+        ) * self.base_step_length_m
+
+        splits = np.cumsum(num_peaks)[:-1]
+        return [
+            ProcessorResult(
+                estimated_distances=estimated_distances.tolist(),
+                estimated_amplitudes=estimated_amplitudes.tolist(),
+                extra_result=self._get_distance_estimation_extra_result(abs_sweep, threshold),
+            )
+            for abs_sweep, threshold, estimated_distances, estimated_amplitudes in zip(
+                abs_sweeps,
+                thresholds,
+                np.split(peak_distances, splits),
+                np.split(peak_amplitudes, splits),
+            )
+        ]
+
+    def _get_distance_estimation_extra_result(
+        self, abs_sweep: npt.NDArray[np.float_], threshold: npt.NDArray[np.float_]
+    ) -> ProcessorExtraResult:
         if self.processor_config.threshold_method == ThresholdMethod.CFAR:
             cfar_margin_slice = slice(self.cfar_margin, -self.cfar_margin)
-            extra_result = ProcessorExtraResult(
+            return ProcessorExtraResult(
                 abs_sweep=abs_sweep[cfar_margin_slice],
-                used_threshold=self.threshold[cfar_margin_slice],
+                used_threshold=threshold[cfar_margin_slice],
                 distances_m=self.distances_m[cfar_margin_slice],
             )
         else:
-            extra_result = ProcessorExtraResult(
-                abs_sweep=abs_sweep, used_threshold=self.threshold, distances_m=self.distances_m
+            return ProcessorExtraResult(
+                abs_sweep=abs_sweep, used_threshold=threshold, distances_m=self.distances_m
             )
-        return ProcessorResult(
-            estimated_distances=estimated_distances,
-            estimated_amplitudes=estimated_amplitudes,
-            extra_result=extra_result,
-        )
 
     def _init_recorded_threshold_calibration(self) -> None:
         self.bg_sc_mean = np.zeros(self.num_points_cropped)
@@ -519,19 +604,10 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
         one_side: bool,
         abs_noise_std: npt.NDArray,
     ) -> npt.NDArray[np.float_]:
-        threshold = np.full(abs_sweep.shape, np.nan)
-        start_idx = int(np.max(idx_cfar_pts))
-        if one_side:
-            take_relative_indexes = -idx_cfar_pts
-            end_idx = abs_sweep.size
-        else:
-            take_relative_indexes = np.concatenate((-idx_cfar_pts, +idx_cfar_pts), axis=0)
-            end_idx = abs_sweep.size - start_idx
-
-        for idx in np.arange(start_idx, end_idx):
-            take_indexes = idx + take_relative_indexes
-            threshold[idx] = np.mean(np.take(abs_sweep, take_indexes))
-
+        threshold = cast(
+            npt.NDArray[np.float_],
+            calculate_cfar_window_mean(abs_sweep, idx_cfar_pts, one_side),
+        )
         threshold += abs_noise_std
         threshold *= 1.0 / (alpha + 1e-10)
         return threshold
@@ -542,41 +618,7 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
     ) -> list[int]:
         if threshold is None:
             raise ValueError
-        found_peaks = []
-        d = 1
-        N = len(abs_sweep)
-        while d < (N - 1):
-            if np.isnan(threshold[d - 1]):
-                d += 1
-                continue
-            if np.isnan(threshold[d + 1]):
-                break
-            if abs_sweep[d] <= threshold[d]:
-                d += 2
-                continue
-            if abs_sweep[d - 1] <= threshold[d - 1]:
-                d += 1
-                continue
-            if abs_sweep[d - 1] >= abs_sweep[d]:
-                d += 1
-                continue
-            d_upper = d + 1
-            while True:
-                if (d_upper) >= (N - 1):
-                    break
-                if np.isnan(threshold[d_upper]):
-                    break
-                if abs_sweep[d_upper] <= threshold[d_upper]:
-                    break
-                if abs_sweep[d_upper] > abs_sweep[d]:
-                    break
-                elif abs_sweep[d_upper] < abs_sweep[d]:
-                    found_peaks.append(int(np.argmax(abs_sweep[d:d_upper]) + d))
-                    break
-                else:
-                    d_upper += 1
-            d = d_upper
-        return found_peaks
+        return cast(List[int], find_peaks(abs_sweep, threshold))
 
     @staticmethod
     def interpolate_peaks(
@@ -586,21 +628,9 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
         step_length: int,
         step_length_m: float,
     ) -> Tuple[list[float], list[float]]:
-        estimated_distances = []
-        estimated_amplitudes = []
-        for peak_idx in peak_idxs:
-            # (https://math.stackexchange.com/questions/680646/get-polynomial-function-from-3-points)
-            x = np.arange(peak_idx - 1, peak_idx + 2, 1)
-            y = abs_sweep[peak_idx - 1 : peak_idx + 2]
-            a = (x[0] * (y[2] - y[1]) + x[1] * (y[0] - y[2]) + x[2] * (y[1] - y[0])) / (
-                (x[0] - x[1]) * (x[0] - x[2]) * (x[1] - x[2])
-            )
-            b = (y[1] - y[0]) / (x[1] - x[0]) - a * (x[0] + x[1])
-            c = y[0] - a * x[0] ** 2 - b * x[0]
-            peak_loc = -b / (2 * a)
-            estimated_distances.append((start_point + peak_loc * step_length) * step_length_m)
-            estimated_amplitudes.append(a * peak_loc**2 + b * peak_loc + c)
-        return estimated_distances, estimated_amplitudes
+        peak_locs, peak_amplitudes = interpolate_peaks(abs_sweep, peak_idxs)
+        estimated_distances = (start_point + peak_locs * step_length) * step_length_m
+        return estimated_distances.tolist(), peak_amplitudes.tolist()
 
     @classmethod
     def distance_filter_edge_margin(cls, profile: a121.Profile, step_length: int) -> int:
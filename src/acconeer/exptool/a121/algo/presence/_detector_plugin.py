@@ -284,6 +284,15 @@ class BackendPlugin(DetectorBackendPluginBase[SharedState]):
             GeneralMessage(name="result_tick_time", data=result.service_result.tick_time)
         )
 
+        # The presence history is a view which the next frame overwrites, while the message
+        # may be kept until the GUI has room for it
+        extra_result = result.processor_extra_result
+        result = attrs.evolve(
+            result,
+            processor_extra_result=attrs.evolve(
+                extra_result, presence_history=extra_result.presence_history.copy()
+            ),
+        )
         self.callback(GeneralMessage(name="plot", data=result, recipient="plot_plugin"))
 
 
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, Optional
 
 import attrs
 import numpy as np
@@ -12,8 +12,10 @@ from numpy import cos, pi, sqrt, square
 from scipy.special import binom
 
 from acconeer.exptool import a121
+from acconeer.exptool._algo_utils import HistoryBuffer
+from acconeer.exptool.a121._core.entities.containers.utils import get_subsweeps_from_frame
 from acconeer.exptool.a121.algo import AlgoConfigBase, ProcessorBase
-from acconeer.exptool.a121.algo._utils import get_distances_m
+from acconeer.exptool.a121.algo._utils import get_distances_m, get_stacked_frames
 
 
 @attrs.mutable(kw_only=True)
@@ -44,6 +46,7 @@ class ProcessorExtraResult:
     depthwise_presence: npt.NDArray[np.float_] = attrs.field()
     presence_distance_index: int = attrs.field()
     presence_history: npt.NDArray[np.float_] = attrs.field()
+    """Read-only view into the processor's history, valid until the next call to ``process``"""
 
 
 @attrs.frozen(kw_only=True)
@@ -126,7 +129,9 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
         self.presence_distance_index = 0
         self.presence_distance = 0
 
-        self.presence_history = np.zeros(int(round(self.f * processor_config.history_length_s)))
+        self.presence_history = HistoryBuffer(
+            int(round(self.f * processor_config.history_length_s))
+        )
         self.update_index = 0
 
         self.threshold = processor_config.detection_threshold
@@ -206,8 +211,20 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
             return np.correlate(a, b, mode="same")[pad_width:-pad_width]
 
     def process(self, result: a121.Result) -> ProcessorResult:
-        frame = result.subframes[self.subsweep_index]
+        return self._process_frame(result.subframes[self.subsweep_index])
+
+    def process_batch(self, results: Iterable[a121.Result]) -> list[ProcessorResult]:
+        # The processing is recursive over frames, so only the frame conversion is batched
+        frames = get_stacked_frames(results)
+        if frames.size == 0:
+            return []
 
+        subframes = get_subsweeps_from_frame(frames, self.metadata)[self.subsweep_index]
+        return [self._process_frame(frame, copy_history=True) for frame in subframes]
+
+    def _process_frame(
+        self, frame: npt.NDArray[np.complex_], copy_history: bool = False
+    ) -> ProcessorResult:
         # Noise estimation
 
         nd = self.noise_est_diff_order
@@ -271,8 +288,7 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
         presence_detected = self.presence_score > self.threshold
 
         # TODO: self.presence_history will be removed in the future
-        self.presence_history = np.roll(self.presence_history, -1)
-        self.presence_history[-1] = self.presence_score
+        self.presence_history.push(self.presence_score)
 
         if max_depthwise_presence > self.threshold:
             self.presence_distance_index = int(np.argmax(depthwise_presence))
@@ -280,6 +296,11 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
 
         self.update_index += 1
 
+        # A view valid until the next frame, unless the results are kept as a batch
+        presence_history = self.presence_history.ordered
+        if copy_history:
+            presence_history = presence_history.copy()
+
         extra_result = ProcessorExtraResult(
             frame=frame,
             mean_sweep=mean_sweep,
@@ -290,7 +311,7 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
             intra=intra * self.intra_weight,
             depthwise_presence=depthwise_presence,
             presence_distance_index=self.presence_distance_index,
-            presence_history=self.presence_history,
+            presence_history=presence_history,
         )
 
         return ProcessorResult(
@@ -3,12 +3,19 @@
 
 from __future__ import annotations
 
+from typing import Iterable
+
 import attrs
 import numpy as np
 import numpy.typing as npt
 
 from acconeer.exptool import a121
-from acconeer.exptool.a121.algo import AlgoConfigBase, AlgoParamEnum, ProcessorBase
+from acconeer.exptool.a121.algo import (
+    AlgoConfigBase,
+    AlgoParamEnum,
+    ProcessorBase,
+    get_stacked_frames,
+)
 
 
 class AmplitudeMethod(AlgoParamEnum):
@@ -46,24 +53,41 @@ class Processor(ProcessorBase[ProcessorConfig, ProcessorResult]):
         self.window /= np.sum(self.window)
 
     def process(self, result: a121.Result) -> ProcessorResult:
-        frame = result.frame
+        return ProcessorResult(**self._process_frames(result.frame))
+
+    def process_batch(self, results: Iterable[a121.Result]) -> list[ProcessorResult]:
+        frames = get_stacked_frames(results)
+        if frames.size == 0:
+            return []
+
+        processed = self._process_frames(frames)
+        return [
+            ProcessorResult(**{name: array[i] for name, array in processed.items()})
+            for i in range(len(frames))
+        ]
 
-        z_ft = np.fft.fftshift(np.fft.fft(frame * self.window, axis=0), axes=(0,))
+    def _process_frames(self, frame: npt.NDArray[np.complex_]) -> dict[str, npt.NDArray]:
+        """Processes a frame, or frames stacked in the first dimension"""
+        sweep_axis = -2
+
+        z_ft = np.fft.fftshift(
+            np.fft.fft(frame * self.window, axis=sweep_axis), axes=(sweep_axis,)
+        )
         abs_z_ft = np.abs(z_ft)
 
         amplitude_method = self.processor_config.amplitude_method
         if amplitude_method == AmplitudeMethod.COHERENT:
-            ampls = np.abs(frame.mean(axis=0))
+            ampls = np.abs(frame.mean(axis=sweep_axis))
         elif amplitude_method == AmplitudeMethod.NONCOHERENT:
-            ampls = np.abs(frame).mean(axis=0)
+            ampls = np.abs(frame).mean(axis=sweep_axis)
         elif amplitude_method == AmplitudeMethod.FFT_MAX:
-            ampls = abs_z_ft.mean(axis=0)
+            ampls = abs_z_ft.mean(axis=sweep_axis)
         else:
             raise RuntimeError(f"Unknown AmplitudeMethod: {amplitude_method}")
 
-        phases = np.angle(frame.mean(axis=0))
+        phases = np.angle(frame.mean(axis=sweep_axis))
 
-        return ProcessorResult(
+        return dict(
             frame=frame,
             distance_velocity_map=abs_z_ft,
             amplitudes=ampls,
@@ -11,6 +11,13 @@ from ._enums import (
 from ._exceptions import HandledException
 from .app import main
 from .app_model import AppModel, PlotPlugin, Plugin, ViewPlugin
-from .backend import BackendPlugin, GeneralMessage, Message, PluginStateMessage, is_task
+from .backend import (
+    BackendPlugin,
+    GeneralMessage,
+    Message,
+    PluginStateMessage,
+    SharedMemoryPayload,
+    is_task,
+)
 from .storage import get_temp_dir, get_temp_h5_path
 from .ui import BUTTON_ICON_COLOR
@@ -319,7 +319,7 @@ class AppModel(QObject):
         elif message.name == "result_tick_time":
             update_time = message.data
 
-            rate, jitter = self.rate_calc.update(update_time)
+            rate, jitter = self.rate_calc.update(update_time, message.num_dropped + 1)
             self.sig_update_rate.emit(rate, jitter)
         else:
             raise RuntimeError(f"Got unknown general message '{message.name}'")
@@ -16,7 +16,7 @@ class RateCalculator:
         self.last_time = None
         self.fifo = np.full(200, np.nan)
 
-    def update(self, time: Optional[float]) -> Tuple[float, float]:
+    def update(self, time: Optional[float], num_updates: int = 1) -> Tuple[float, float]:
         if time is None:
             self._reset()
             return np.nan, np.nan
@@ -27,7 +27,8 @@ class RateCalculator:
         if last_time is None:
             return np.nan, np.nan
 
-        delta_time = time - last_time
+        # Updates in between may have been dropped, see GeneralMessage.num_dropped
+        delta_time = (time - last_time) / num_updates
 
         self.fifo = np.roll(self.fifo, -1)
         self.fifo[-1] = delta_time
@@ -12,3 +12,4 @@ from ._message import (
     StatusMessage,
 )
 from ._model import is_task
+from ._shared_memory import SharedMemoryPayload, SharedMemoryRing
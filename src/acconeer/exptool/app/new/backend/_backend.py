@@ -14,7 +14,9 @@ import attrs
 from typing_extensions import Literal
 
 from ._message import GeneralMessage, Message
+from ._message_channel import MessageChannel, MessageSender
 from ._model import Model
+from ._shared_memory import SharedMemoryRing
 
 
 log = logging.getLogger(__name__)
@@ -41,15 +43,25 @@ FromBackendQueueItem = Union[Message, ClosedTask]
 
 class Backend:
     def __init__(self):
-        self._recv_queue: mp.Queue[FromBackendQueueItem] = mp.Queue()
+        self._recv_channel = MessageChannel()
         self._send_queue: mp.Queue[ToBackendQueueItem] = mp.Queue()
         self._stop_event = mp.Event()
+
+        # Plot data is passed through shared memory if possible, see process_program
+        self._shared_memory_ring: Optional[SharedMemoryRing] = None
+        if SharedMemoryRing.is_available():
+            try:
+                self._shared_memory_ring = SharedMemoryRing.create()
+            except OSError:
+                log.warning("Could not create shared memory, plot data will be pickled")
+
         self._process = mp.Process(
             target=process_program,
             args=(
                 self._send_queue,
-                self._recv_queue,
+                self._recv_channel,
                 self._stop_event,
+                None if self._shared_memory_ring is None else self._shared_memory_ring.spec,
             ),
             daemon=True,
         )
@@ -76,6 +88,14 @@ class Backend:
 
         self._process.close()
 
+        for (_, name), num_dropped in self._recv_channel.drop_counts.items():
+            if num_dropped > 0:
+                log.debug(f"Dropped {num_dropped} {name!r} messages in favor of newer ones")
+
+        if self._shared_memory_ring is not None:
+            self._shared_memory_ring.close()
+            self._shared_memory_ring = None
+
     def put_task(self, task: Task) -> uuid.UUID:
         key = uuid.uuid4()
         self._send(("task", (key, task)))
@@ -85,22 +105,38 @@ class Backend:
         self._send_queue.put(item)
 
     def recv(self, timeout: Optional[float] = None) -> FromBackendQueueItem:
-        return self._recv_queue.get(timeout=timeout)
+        return self._recv_channel.get(timeout=timeout)  # type: ignore[return-value]
 
 
 def process_program(
     recv_queue: mp.Queue[ToBackendQueueItem],
-    send_queue: mp.Queue[FromBackendQueueItem],
+    send_channel: MessageChannel,
     stop_event: mp._EventType,
+    shared_memory_ring_spec: Optional[Tuple[str, int, int]] = None,
 ) -> None:
+    shared_memory_ring = None
+    if shared_memory_ring_spec is not None:
+        shared_memory_ring = SharedMemoryRing.attach(*shared_memory_ring_spec)
+
+    def pack(message: GeneralMessage) -> GeneralMessage:
+        # Large plot data is put in shared memory rather than pickled through the queue.
+        # Packing happens as the message is sent, so coalesced plot data is never copied.
+        if shared_memory_ring is not None and message.name == "plot":
+            message = attrs.evolve(message, data=shared_memory_ring.pack(message.data))
+
+        return message
+
+    sender = MessageSender(send_channel, pack=pack)
+
     try:
-        model = Model(task_callback=send_queue.put)
+        model = Model(task_callback=sender.put)
         model_wants_to_idle = False
 
         while not stop_event.is_set():
             msg = None
 
             if not model_wants_to_idle:
+                sender.flush(force=True)
                 log.debug("Backend is waiting patiently for a new command ...")
                 msg = recv_queue.get()
                 log.debug(f"Backend received the command: {msg}")
@@ -114,9 +150,10 @@ def process_program(
             if msg is None:  # Model wanted idle and nothing in queue
                 try:
                     model_wants_to_idle = model.idle()
+                    sender.flush()
                 except Exception as exc:
                     model_wants_to_idle = False
-                    send_queue.put(
+                    sender.put(
                         GeneralMessage(
                             name="error",
                             exception=exc,
@@ -139,13 +176,16 @@ def process_program(
                 try:
                     model.execute_task(name, kwargs, plugin)
                 except Exception as exc:
-                    send_queue.put(ClosedTask(key, exc, traceback.format_exc()))
+                    sender.put(ClosedTask(key, exc, traceback.format_exc()))
                 else:
-                    send_queue.put(ClosedTask(key))
+                    sender.put(ClosedTask(key))
 
                 model_wants_to_idle = True
             else:
                 raise RuntimeError
     finally:
         recv_queue.close()
-        send_queue.close()
+        send_channel.close()
+
+        if shared_memory_ring is not None:
+            shared_memory_ring.close()
@@ -48,3 +48,5 @@ class GeneralMessage(Message):
     kwargs: Optional[dict[str, Any]] = attrs.field(default=None)
     exception: Optional[Exception] = attrs.field(default=None)
     traceback_format_exc: Optional[str] = attrs.field(default=None)
+    num_dropped: int = attrs.field(default=0)
+    """Number of earlier messages with the same recipient and name dropped in favor of this one"""
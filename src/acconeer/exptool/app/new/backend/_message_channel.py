@@ -0,0 +1,125 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import attrs
+
+from ._message import GeneralMessage, Message
+
+
+MessageKey = Tuple[Optional[str], str]
+
+COALESCED_MESSAGE_KEYS: Tuple[MessageKey, ...] = (
+    ("plot_plugin", "plot"),
+    (None, "result_tick_time"),
+)
+"""The (recipient, name) of the messages of which only the latest value is of interest"""
+
+
+def get_coalescing_key(item: object) -> Optional[MessageKey]:
+    # Messages without data (resets) and errors are control messages, which must not be dropped
+    if not isinstance(item, GeneralMessage) or item.exception is not None or item.data is None:
+        return None
+
+    key = (item.recipient, item.name)
+    return key if key in COALESCED_MESSAGE_KEYS else None
+
+
+class MessageChannel:
+    """A multiprocessing queue from the backend process which coalesces messages
+
+    Messages with a key in :data:`COALESCED_MESSAGE_KEYS` are only put on the queue while
+    fewer than ``max_in_flight`` of them are waiting to be received. Otherwise, the
+    :class:`MessageSender` keeps only the latest one, which is sent when the receiver has caught
+    up. The number of messages dropped in favor of a message is passed in
+    :attr:`GeneralMessage.num_dropped`.
+
+    All other messages (state, errors, resets without data, closed tasks, ...) are passed
+    losslessly and in order.
+    Pending coalesced messages are sent before them, to keep the order between the two.
+
+    :param max_in_flight: Number of coalesced messages per key that may wait in the queue
+    """
+
+    def __init__(self, max_in_flight: int = 1) -> None:
+        self._queue: mp.Queue[Union[Message, object]] = mp.Queue()
+        self._max_in_flight = max_in_flight
+        self._in_flight = {key: mp.Value("i", 0) for key in COALESCED_MESSAGE_KEYS}
+        self.drop_counts: Dict[MessageKey, int] = {key: 0 for key in COALESCED_MESSAGE_KEYS}
+        """Number of dropped coalesced messages per key, counted by the receiver"""
+
+    def get(self, timeout: Optional[float] = None) -> Union[Message, object]:
+        item = self._queue.get(timeout=timeout)
+
+        key = get_coalescing_key(item)
+        if key is not None:
+            assert isinstance(item, GeneralMessage)
+
+            in_flight = self._in_flight[key]
+            with in_flight.get_lock():
+                in_flight.value -= 1
+
+            self.drop_counts[key] += item.num_dropped
+
+        return item
+
+    def close(self) -> None:
+        self._queue.close()
+
+
+class MessageSender:
+    """The sending end of a :class:`MessageChannel`, used in the backend process
+
+    :param channel: The channel to send through
+    :param pack: Optional function applied to coalesced messages right before they are sent
+    """
+
+    def __init__(
+        self,
+        channel: MessageChannel,
+        pack: Optional[Callable[[GeneralMessage], GeneralMessage]] = None,
+    ) -> None:
+        self._channel = channel
+        self._pack = pack
+        self._pending: Dict[MessageKey, GeneralMessage] = {}
+
+    def put(self, item: Union[Message, object]) -> None:
+        key = get_coalescing_key(item)
+
+        if key is None:
+            self.flush(force=True)
+            self._channel._queue.put(item)
+            return
+
+        assert isinstance(item, GeneralMessage)
+
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            item = attrs.evolve(item, num_dropped=item.num_dropped + pending.num_dropped + 1)
+
+        self._pending[key] = item
+        self.flush()
+
+    def flush(self, force: bool = False) -> None:
+        """Sends the pending coalesced messages which the receiver has room for
+
+        :param force: Send all pending messages, regardless of the receiver
+        """
+        for key in list(self._pending):
+            in_flight = self._channel._in_flight[key]
+
+            with in_flight.get_lock():
+                if not force and in_flight.value >= self._channel._max_in_flight:
+                    continue
+
+                in_flight.value += 1
+
+            message = self._pending.pop(key)
+            if self._pack is not None:
+                message = self._pack(message)
+
+            self._channel._queue.put(message)
@@ -0,0 +1,215 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import struct
+from typing import Any, Optional, Tuple
+
+import attrs
+
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # Python < 3.8
+    SharedMemory = None  # type: ignore[assignment, misc]
+
+
+log = logging.getLogger(__name__)
+
+# Per slot header: the sequence number of the payload in the slot, -1 while it is written
+_SLOT_HEADER = struct.Struct("<q")
+_WRITING_SEQUENCE_NUMBER = -1
+_BUFFER_ALIGNMENT = 64
+
+# The shared memory rings opened in this process, by name
+_open_rings: dict[str, SharedMemoryRing] = {}
+
+
+@attrs.frozen(kw_only=True)
+class SharedMemoryPayload:
+    """A small descriptor of an object that was packed into a :class:`SharedMemoryRing`
+
+    Sent in place of the object itself. Only the pickled object, without its large buffers, is
+    carried by the descriptor.
+    """
+
+    ring_name: str = attrs.field()
+    slot_start: int = attrs.field()
+    sequence_number: int = attrs.field()
+    pickled: bytes = attrs.field(repr=False)
+    buffer_spans: Tuple[Tuple[int, int], ...] = attrs.field()
+    """The (offset, number of bytes) within the slot of every out-of-band buffer"""
+
+    def load(self) -> Optional[Any]:
+        """Unpacks the object
+
+        :returns:
+            The object, or ``None`` if the slot has since been overwritten by a newer one or the
+            ring has been closed by its owner
+        """
+        try:
+            ring = SharedMemoryRing.attach(self.ring_name)
+        except FileNotFoundError:  # The backend stopped after sending the payload
+            return None
+
+        return ring.unpack(self)
+
+
+class SharedMemoryRing:
+    """A ring of fixed size slots in shared memory, used to pass large NumPy arrays between
+    processes without pickling them
+
+    Objects are pickled with protocol 5, which hands contiguous buffers (like the data of NumPy
+    arrays) over out-of-band. These buffers are copied into the next slot of the ring, and a
+    small :class:`SharedMemoryPayload` descriptor is returned in place of the object. The slots
+    are reused in order, so a receiver that only loads the newest descriptor never waits for, or
+    copies, the frames it skips.
+
+    A single process may write to a ring. Use :meth:`create` in the owning process and
+    :meth:`attach` in the other.
+    """
+
+    def __init__(
+        self, shared_memory: SharedMemory, num_slots: int, slot_size: int, owner: bool
+    ) -> None:
+        self._shared_memory = shared_memory
+        self._num_slots = num_slots
+        self._slot_size = slot_size
+        self._owner = owner
+        self._next_sequence_number = 0
+        self._pid = os.getpid()
+        _open_rings[self.name] = self
+
+    @staticmethod
+    def is_available() -> bool:
+        return SharedMemory is not None
+
+    @classmethod
+    def create(cls, num_slots: int = 4, slot_size: int = 2**23) -> SharedMemoryRing:
+        if SharedMemory is None:
+            raise RuntimeError("Shared memory is not available (requires Python 3.8)")
+
+        ring = cls(
+            SharedMemory(create=True, size=num_slots * slot_size), num_slots, slot_size, owner=True
+        )
+        for slot in range(num_slots):
+            _SLOT_HEADER.pack_into(ring._buf, slot * slot_size, _WRITING_SEQUENCE_NUMBER)
+
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, num_slots: int = 4, slot_size: int = 2**23) -> SharedMemoryRing:
+        existing_ring = _open_rings.get(name)
+        # A forked process inherits the rings of its parent, which it must not own
+        if existing_ring is not None and existing_ring._pid == os.getpid():
+            return existing_ring
+
+        if SharedMemory is None:
+            raise RuntimeError("Shared memory is not available (requires Python 3.8)")
+
+        return cls(SharedMemory(name=name), num_slots, slot_size, owner=False)
+
+    @property
+    def name(self) -> str:
+        return str(self._shared_memory.name)
+
+    @property
+    def _buf(self) -> memoryview:
+        buf = self._shared_memory.buf
+        assert buf is not None  # Only released by close()
+        return buf
+
+    @property
+    def spec(self) -> Tuple[str, int, int]:
+        """The arguments to :meth:`attach` this ring in another process"""
+        return (self.name, self._num_slots, self._slot_size)
+
+    def pack(self, obj: Any, min_nbytes: int = 2**16) -> Any:
+        """Packs an object into the next slot
+
+        :param obj: The object to pack
+        :param min_nbytes:
+            Objects with less than this amount of buffer data are not worth packing
+        :returns:
+            A :class:`SharedMemoryPayload`, or ``obj`` itself if it has too little or too much
+            buffer data to be packed
+        """
+        buffers: list[pickle.PickleBuffer] = []
+        pickled = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+
+        buffer_spans = []
+        offset = _SLOT_HEADER.size
+        for raw_buffer in raw_buffers:
+            offset = -(-offset // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+            buffer_spans.append((offset, raw_buffer.nbytes))
+            offset += raw_buffer.nbytes
+
+        nbytes = sum(raw_buffer.nbytes for raw_buffer in raw_buffers)
+        if nbytes < min_nbytes:
+            return obj
+
+        if offset > self._slot_size:
+            log.debug(f"{nbytes} bytes do not fit in a shared memory slot, sending it pickled")
+            return obj
+
+        sequence_number = self._next_sequence_number
+        self._next_sequence_number += 1
+        slot = sequence_number % self._num_slots
+        slot_start = slot * self._slot_size
+        buf = self._buf
+
+        _SLOT_HEADER.pack_into(buf, slot_start, _WRITING_SEQUENCE_NUMBER)
+        for (buffer_offset, buffer_nbytes), raw_buffer in zip(buffer_spans, raw_buffers):
+            start = slot_start + buffer_offset
+            buf[start : start + buffer_nbytes] = raw_buffer.cast("B")
+        _SLOT_HEADER.pack_into(buf, slot_start, sequence_number)
+
+        return SharedMemoryPayload(
+            ring_name=self.name,
+            slot_start=slot_start,
+            sequence_number=sequence_number,
+            pickled=pickled,
+            buffer_spans=tuple(buffer_spans),
+        )
+
+    def unpack(self, payload: SharedMemoryPayload) -> Optional[Any]:
+        """Unpacks an object packed by :meth:`pack`, possibly in another process
+
+        The buffers are copied out of the slot, so the returned object stays valid after the
+        slot is reused.
+
+        :returns: The object, or ``None`` if the slot has since been overwritten by a newer one
+        """
+        slot_start = payload.slot_start
+        buf = self._buf
+
+        if not self._slot_holds(payload):
+            return None
+
+        buffers = [
+            bytearray(buf[slot_start + offset : slot_start + offset + nbytes])
+            for offset, nbytes in payload.buffer_spans
+        ]
+
+        # The writer may have started on the slot while it was copied
+        if not self._slot_holds(payload):
+            return None
+
+        return pickle.loads(payload.pickled, buffers=buffers)
+
+    def _slot_holds(self, payload: SharedMemoryPayload) -> bool:
+        (sequence_number,) = _SLOT_HEADER.unpack_from(self._buf, payload.slot_start)
+        return bool(sequence_number == payload.sequence_number)
+
+    def close(self) -> None:
+        """Closes the ring in this process. The owner also frees the shared memory."""
+        _open_rings.pop(self.name, None)
+        self._shared_memory.close()
+
+        if self._owner and self._pid == os.getpid():
+            self._shared_memory.unlink()
@@ -6,6 +6,7 @@ import warnings
 
 from PySide6.QtCore import QThread
 
+from acconeer.exptool._algo_utils import copy_read_only_arrays
 from acconeer.exptool.a111 import _modes
 from acconeer.exptool.a111.recording import Recorder
 
@@ -135,4 +136,5 @@ class DataProcessing:
             self.parent._emit("sweep_info", "", subinfo)
 
     def draw_canvas(self, plot_data):
-        self.parent._emit("update_external_plots", "", plot_data)
+        # Plotted from the GUI thread, after the processor has moved on to later frames
+        self.parent._emit("update_external_plots", "", copy_read_only_arrays(plot_data))
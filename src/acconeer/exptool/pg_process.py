@@ -2,6 +2,7 @@
 # All rights reserved
 
 import multiprocessing as mp
+import pickle
 import queue
 import signal
 from time import sleep, time
@@ -29,8 +30,12 @@ class PGProcess:
             self.close()
             raise PGProccessDiedException
 
+        # Pickled right away rather than by the queue's feeder thread, since processor outputs
+        # may be views which are overwritten by the processing of the next frame
+        pickled_data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
         try:
-            self._queue.put(data)
+            self._queue.put(pickled_data)
         except BrokenPipeError:
             self.close()
             raise PGProccessDiedException
@@ -79,7 +84,7 @@ def pg_process_program(q, exit_event, updater, max_freq):
         data_time = time()
 
         if data is not None:
-            updater.update(data)
+            updater.update(pickle.loads(data))
 
         app.processEvents()
 
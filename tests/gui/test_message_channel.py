@@ -0,0 +1,101 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import pytest
+
+from acconeer.exptool.app.new._enums import PluginState
+from acconeer.exptool.app.new.backend import GeneralMessage, PluginStateMessage
+from acconeer.exptool.app.new.backend._message_channel import MessageChannel, MessageSender
+
+
+TIMEOUT = 5.0
+PLOT_KEY = ("plot_plugin", "plot")
+TICK_TIME_KEY = (None, "result_tick_time")
+
+
+def plot_message(data):
+    return GeneralMessage(name="plot", recipient="plot_plugin", data=data)
+
+
+def tick_time_message(data):
+    return GeneralMessage(name="result_tick_time", data=data)
+
+
+@pytest.fixture
+def channel():
+    channel = MessageChannel(max_in_flight=1)
+    yield channel
+    channel.close()
+
+
+def test_coalesces_to_the_latest_message(channel):
+    sender = MessageSender(channel)
+
+    for i in range(4):
+        sender.put(plot_message(i))
+
+    first = channel.get(timeout=TIMEOUT)
+    assert (first.data, first.num_dropped) == (0, 0)
+
+    sender.flush()
+
+    latest = channel.get(timeout=TIMEOUT)
+    assert (latest.data, latest.num_dropped) == (3, 2)
+    assert channel.drop_counts[PLOT_KEY] == 2
+
+
+def test_sends_pending_messages_before_other_messages(channel):
+    sender = MessageSender(channel)
+    state_message = PluginStateMessage(state=PluginState.LOADED_IDLE)
+
+    sender.put(plot_message(0))
+    sender.put(plot_message(1))
+    sender.put(state_message)
+
+    assert channel.get(timeout=TIMEOUT).data == 0
+    assert channel.get(timeout=TIMEOUT).data == 1
+    assert channel.get(timeout=TIMEOUT) == state_message
+
+
+def test_never_coalesces_messages_without_data(channel):
+    sender = MessageSender(channel)
+
+    sender.put(tick_time_message(1.0))
+    sender.put(tick_time_message(None))
+    sender.put(tick_time_message(None))
+
+    received = [channel.get(timeout=TIMEOUT) for _ in range(3)]
+
+    assert [message.data for message in received] == [1.0, None, None]
+    assert channel.drop_counts[TICK_TIME_KEY] == 0
+
+
+def test_never_coalesces_errors(channel):
+    sender = MessageSender(channel)
+    error_message = GeneralMessage(
+        name="plot", recipient="plot_plugin", data=0, exception=RuntimeError()
+    )
+
+    sender.put(plot_message(0))
+    sender.put(error_message)
+    sender.put(plot_message(1))
+
+    assert channel.get(timeout=TIMEOUT).data == 0
+    assert channel.get(timeout=TIMEOUT).exception is not None
+
+    sender.flush()
+
+    assert channel.get(timeout=TIMEOUT).num_dropped == 0
+
+
+def test_packs_coalesced_messages_only(channel):
+    def pack(message):
+        return GeneralMessage(name=message.name, recipient=message.recipient, data="packed")
+
+    sender = MessageSender(channel, pack=pack)
+
+    sender.put(plot_message(0))
+    sender.put(tick_time_message(None))
+
+    assert channel.get(timeout=TIMEOUT).data == "packed"
+    assert channel.get(timeout=TIMEOUT).data is None
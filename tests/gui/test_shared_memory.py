@@ -0,0 +1,64 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import numpy as np
+import pytest
+
+from acconeer.exptool.app.new.backend import SharedMemoryPayload, SharedMemoryRing
+
+
+pytestmark = pytest.mark.skipif(
+    not SharedMemoryRing.is_available(), reason="Shared memory requires Python 3.8"
+)
+
+
+@pytest.fixture
+def ring():
+    ring = SharedMemoryRing.create(num_slots=2, slot_size=2**16)
+    yield ring
+    ring.close()
+
+
+def test_round_trip(ring):
+    data = {"frame": np.arange(1000, dtype=np.float64), "label": "frame"}
+
+    payload = ring.pack(data, min_nbytes=0)
+
+    assert isinstance(payload, SharedMemoryPayload)
+    loaded = payload.load()
+    assert loaded["label"] == "frame"
+    np.testing.assert_array_equal(loaded["frame"], data["frame"])
+
+
+def test_small_and_large_objects_are_not_packed(ring):
+    small = np.zeros(10)
+    large = np.zeros(2**16)
+
+    assert ring.pack(small) is small
+    assert ring.pack(large, min_nbytes=0) is large
+
+
+def test_wrap_around_overwrites_oldest_slot(ring):
+    payloads = [ring.pack(np.full(100, i), min_nbytes=0) for i in range(3)]
+
+    assert payloads[0].slot_start == payloads[2].slot_start
+    assert payloads[0].load() is None
+    np.testing.assert_array_equal(payloads[1].load(), np.full(100, 1))
+    np.testing.assert_array_equal(payloads[2].load(), np.full(100, 2))
+
+
+def test_loaded_object_outlives_slot(ring):
+    loaded = ring.pack(np.full(100, 0), min_nbytes=0).load()
+
+    for i in range(1, 3):
+        ring.pack(np.full(100, i), min_nbytes=0)
+
+    np.testing.assert_array_equal(loaded, np.full(100, 0))
+
+
+def test_stale_payload_after_close():
+    ring = SharedMemoryRing.create(num_slots=2, slot_size=2**16)
+    payload = ring.pack(np.zeros(100), min_nbytes=0)
+    ring.close()
+
+    assert payload.load() is None
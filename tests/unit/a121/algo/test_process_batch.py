@@ -0,0 +1,156 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import copy
+
+import attrs
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core.entities import INT_16_COMPLEX, ResultContext
+from acconeer.exptool.a121.algo import distance, presence, sparse_iq
+
+
+NUM_FRAMES = 20
+
+
+def stacked_results_for(sensor_config):
+    num_points = sensor_config.num_points
+    metadata = a121.Metadata(
+        frame_data_length=sensor_config.sweeps_per_frame * num_points,
+        sweep_data_length=num_points,
+        subsweep_data_offset=np.array([0]),
+        subsweep_data_length=np.array([num_points]),
+        calibration_temperature=0,
+        tick_period=0,
+        base_step_length_m=2.5e-3,
+        max_sweep_rate=0,
+    )
+
+    # A stationary target on top of noise, so that distance processors find peaks
+    rng = np.random.default_rng(0)
+    shape = (NUM_FRAMES, sensor_config.sweeps_per_frame, num_points)
+    target = 2000 * np.exp(-0.5 * ((np.arange(num_points) - num_points / 2) / 4) ** 2)
+    frame = np.zeros(shape, dtype=INT_16_COMPLEX)
+    frame["real"] = target + rng.normal(0, 50, shape)
+    frame["imag"] = rng.normal(0, 50, shape)
+
+    stacked_results = a121.StackedResults(
+        calibration_needed=np.zeros(NUM_FRAMES, dtype=bool),
+        data_saturated=np.zeros(NUM_FRAMES, dtype=bool),
+        frame_delayed=np.zeros(NUM_FRAMES, dtype=bool),
+        temperature=np.zeros(NUM_FRAMES, dtype=int),
+        tick=np.arange(NUM_FRAMES),
+        frame=frame,
+        context=ResultContext(metadata=metadata, ticks_per_second=1),
+    )
+    return metadata, stacked_results
+
+
+def assert_processor_results_equal(actual, expected):
+    if attrs.has(type(expected)):
+        assert type(actual) is type(expected)
+        for field in attrs.fields(type(expected)):
+            assert_processor_results_equal(
+                getattr(actual, field.name), getattr(expected, field.name)
+            )
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected):
+            assert_processor_results_equal(a, e)
+    elif expected is None:
+        assert actual is None
+    else:
+        np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+
+def assert_batch_matches_sequential(create_processor, stacked_results):
+    processor = create_processor()
+    # Compared as returned, since histories are only valid until the next frame is processed
+    expected = [copy.deepcopy(processor.process(result)) for result in stacked_results]
+
+    assert_processor_results_equal(create_processor().process_batch(stacked_results), expected)
+    assert_processor_results_equal(
+        create_processor().process_batch(list(stacked_results)), expected
+    )
+
+
+@pytest.mark.parametrize("amplitude_method", list(sparse_iq.AmplitudeMethod))
+def test_sparse_iq(amplitude_method):
+    sensor_config = sparse_iq.get_sensor_config()
+    metadata, stacked_results = stacked_results_for(sensor_config)
+
+    def create_processor():
+        return sparse_iq.Processor(
+            sensor_config=sensor_config,
+            metadata=metadata,
+            processor_config=sparse_iq.ProcessorConfig(amplitude_method=amplitude_method),
+        )
+
+    assert_batch_matches_sequential(create_processor, stacked_results)
+
+
+@pytest.mark.parametrize(
+    "processor_config",
+    [
+        distance.ProcessorConfig(threshold_method=distance.ThresholdMethod.CFAR),
+        distance.ProcessorConfig(
+            threshold_method=distance.ThresholdMethod.FIXED, fixed_threshold_value=500.0
+        ),
+        distance.ProcessorConfig(
+            processor_mode=distance.ProcessorMode.RECORDED_THRESHOLD_CALIBRATION
+        ),
+    ],
+)
+def test_distance(processor_config):
+    sensor_config = a121.SensorConfig(
+        sweeps_per_frame=4,
+        num_points=200,
+        step_length=2,
+        profile=a121.Profile.PROFILE_1,
+        phase_enhancement=True,
+    )
+    metadata, stacked_results = stacked_results_for(sensor_config)
+
+    def create_processor():
+        return distance.Processor(
+            sensor_config=sensor_config,
+            metadata=metadata,
+            processor_config=processor_config,
+            context=distance.ProcessorContext(bg_noise_std=[10.0]),
+        )
+
+    assert_batch_matches_sequential(create_processor, stacked_results)
+
+    # The kept threshold is not a view into the thresholds of the batch
+    processor = create_processor()
+    processor.process_batch(stacked_results)
+    threshold = getattr(processor, "threshold", None)
+    assert threshold is None or threshold.flags.owndata
+
+
+def test_presence():
+    sensor_config = a121.SensorConfig(sweeps_per_frame=16, num_points=40, frame_rate=10.0)
+    metadata, stacked_results = stacked_results_for(sensor_config)
+
+    def create_processor():
+        return presence.Processor(
+            sensor_config=sensor_config,
+            metadata=metadata,
+            processor_config=presence.ProcessorConfig(),
+        )
+
+    assert_batch_matches_sequential(create_processor, stacked_results)
+
+
+def test_empty_batch():
+    sensor_config = sparse_iq.get_sensor_config()
+    metadata, stacked_results = stacked_results_for(sensor_config)
+    processor = sparse_iq.Processor(
+        sensor_config=sensor_config,
+        metadata=metadata,
+        processor_config=sparse_iq.ProcessorConfig(),
+    )
+
+    assert processor.process_batch([]) == []
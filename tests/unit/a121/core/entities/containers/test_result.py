@@ -1,6 +1,9 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
+import copy
+import pickle
+
 import numpy as np
 import pytest
 
@@ -98,3 +101,40 @@ def test_subframes(good_result):
 
 def test_tick_time(good_result):
     assert np.isclose(good_result.tick_time, 1.5)
+
+
+def test_frame_is_converted_once_and_read_only(good_result):
+    frame = good_result.frame
+
+    assert good_result.frame is frame
+    assert not frame.flags.writeable
+
+
+def test_frame_cache_is_ignored_in_comparison(good_result, good_context, good_raw_frame):
+    _ = good_result.frame
+
+    assert good_result == a121.Result(
+        data_saturated=False,
+        frame_delayed=False,
+        calibration_needed=False,
+        temperature=0,
+        tick=120,
+        frame=good_raw_frame,
+        context=good_context,
+    )
+
+
+@pytest.mark.parametrize("duplicate", [pickle.dumps, copy.copy, copy.deepcopy])
+def test_frame_cache_is_not_duplicated(good_result, duplicate):
+    nbytes_before = len(pickle.dumps(good_result))
+    _ = good_result.frame
+
+    assert len(pickle.dumps(good_result)) == nbytes_before
+
+    duplicated = duplicate(good_result)
+    if isinstance(duplicated, bytes):
+        duplicated = pickle.loads(duplicated)
+
+    assert duplicated == good_result
+    assert duplicated._converted_frame is None
+    np.testing.assert_array_equal(duplicated.frame, good_result.frame)
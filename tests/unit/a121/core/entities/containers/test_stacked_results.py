@@ -1,6 +1,8 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
+import pickle
+
 import numpy as np
 import pytest
 
@@ -136,6 +138,21 @@ class TestStackedResultWithASingleFrame:
     def test_reports_the_number_of_results_in_len(self, stacked_results):
         assert len(stacked_results) == 1
 
+    def test_is_iterable_and_yields_results(self, stacked_results, result):
+        assert list(stacked_results) == [result]
+
+    def test_can_be_sliced(self, stacked_results):
+        assert stacked_results[:] == stacked_results
+        assert len(stacked_results[1:]) == 0
+
+    def test_frame_cache_is_not_pickled(self, stacked_results):
+        _ = stacked_results.frame
+        unpickled = pickle.loads(pickle.dumps(stacked_results))
+
+        assert unpickled == stacked_results
+        assert unpickled._converted_frame is None
+        np.testing.assert_array_equal(unpickled.frame, stacked_results.frame)
+
 
 class TestStackedResultWithMultipleFrames:
     @pytest.fixture
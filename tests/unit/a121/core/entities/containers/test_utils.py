@@ -2,7 +2,9 @@
 # All rights reserved
 
 import numpy as np
+import pytest
 
+from acconeer.exptool.a121._core.entities import INT_16_COMPLEX
 from acconeer.exptool.a121._core.entities.containers import Metadata, utils
 
 
@@ -39,3 +41,32 @@ def test_get_subsweeps_from_frame():
     ]
 
     np.testing.assert_array_equal(utils.get_subsweeps_from_frame(input_array, metadata), expected)
+
+
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+@pytest.mark.parametrize(
+    "index",
+    [
+        np.s_[:],
+        np.s_[1],
+        np.s_[:, ::2],
+        np.s_[:, 1:3],
+        np.s_[::2],
+        np.s_[1, 2],
+    ],
+)
+def test_int16_complex_array_to_complex(dtype, index):
+    array = np.zeros((3, 5), dtype=INT_16_COMPLEX)
+    array["real"] = np.arange(15).reshape(3, 5) - 7
+    array["imag"] = 2**15 - 1 - np.arange(15).reshape(3, 5)
+    array = array[index]
+
+    converted = utils.int16_complex_array_to_complex(array, dtype)
+
+    assert converted.dtype == dtype
+    np.testing.assert_array_equal(converted, array["real"] + 1j * array["imag"])
+
+
+def test_int16_complex_array_to_complex_rejects_non_complex_dtype():
+    with pytest.raises(ValueError):
+        utils.int16_complex_array_to_complex(np.zeros(3, dtype=INT_16_COMPLEX), np.float64)
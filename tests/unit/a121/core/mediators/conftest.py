@@ -0,0 +1,67 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+from functools import partial
+from unittest.mock import DEFAULT, Mock
+
+import numpy as np
+import pytest
+
+from acconeer.exptool.a121._core.entities import Metadata, SensorInfo, ServerInfo
+
+
+@pytest.fixture
+def metadata():
+    return Metadata(
+        frame_data_length=1,
+        sweep_data_length=1,
+        subsweep_data_length=np.array([1]),
+        subsweep_data_offset=np.array([0]),
+        calibration_temperature=0,
+        tick_period=0,
+        base_step_length_m=0,
+        max_sweep_rate=0,
+    )
+
+
+@pytest.fixture
+def mock_protocol(metadata):
+    def mock_get_next_header(bytes_, extended_metadata, ticks_per_second):
+        if bytes_ == b"data_header":
+            return DEFAULT
+
+        raise Exception
+
+    class MockCommunicationProtocol:
+        end_sequence = b""
+        get_system_info_command = Mock(return_value=b"get_system_info")
+        get_system_info_response = Mock(
+            return_value=(
+                ServerInfo(
+                    rss_version="rss_version",
+                    sensor_count=1,
+                    ticks_per_second=1,
+                    sensor_infos={1: SensorInfo(connected=True)},
+                ),
+                "a121",
+            )
+        )
+        get_sensor_info_command = Mock(return_value=b"get_sensor_info")
+        get_sensor_info_response = Mock(return_value=[1])
+        setup_command = Mock(return_value=b"setup")
+        setup_response = Mock(return_value=[{1: metadata}])
+        start_streaming_command = Mock(return_value=b"start_streaming")
+        start_streaming_response = Mock(return_value=True)
+        stop_streaming_command = Mock(return_value=b"stop_streaming")
+        stop_streaming_response = Mock(return_value=True)
+        get_next_header = Mock(return_value=(0, []), side_effect=mock_get_next_header)
+        get_next_header_decoder = Mock(
+            side_effect=lambda extended_metadata, ticks_per_second: partial(
+                MockCommunicationProtocol.get_next_header,
+                extended_metadata=extended_metadata,
+                ticks_per_second=ticks_per_second,
+            )
+        )
+        get_next_payload = Mock(return_value=[])
+
+    return MockCommunicationProtocol()
@@ -1,63 +1,13 @@
 # Copyright (c) Acconeer AB, 2022
 # All rights reserved
 
-from unittest.mock import DEFAULT, Mock, call
+import time
+from unittest.mock import Mock, call
 
-import numpy as np
 import pytest
 
-from acconeer.exptool.a121._core.entities import Metadata, SensorInfo, ServerInfo, SessionConfig
-from acconeer.exptool.a121._core.mediators import AgnosticClient, ClientError
-
-
-@pytest.fixture
-def metadata():
-    return Metadata(
-        frame_data_length=1,
-        sweep_data_length=1,
-        subsweep_data_length=np.array([1]),
-        subsweep_data_offset=np.array([0]),
-        calibration_temperature=0,
-        tick_period=0,
-        base_step_length_m=0,
-        max_sweep_rate=0,
-    )
-
-
-@pytest.fixture
-def mock_protocol(metadata):
-    def mock_get_next_header(bytes_, extended_metadata, ticks_per_second):
-        if bytes_ == b"data_header":
-            return DEFAULT
-
-        raise Exception
-
-    class MockCommunicationProtocol:
-        end_sequence = b""
-        get_system_info_command = Mock(return_value=b"get_system_info")
-        get_system_info_response = Mock(
-            return_value=(
-                ServerInfo(
-                    rss_version="rss_version",
-                    sensor_count=1,
-                    ticks_per_second=1,
-                    sensor_infos={1: SensorInfo(connected=True)},
-                ),
-                "a121",
-            )
-        )
-        get_sensor_info_command = Mock(return_value=b"get_sensor_info")
-        get_sensor_info_response = Mock(return_value=[1])
-        setup_command = Mock(return_value=b"setup")
-        setup_response = Mock(return_value=[{1: metadata}])
-        start_streaming_command = Mock(return_value=b"start_streaming")
-        start_streaming_response = Mock(return_value=True)
-        stop_streaming_command = Mock(return_value=b"stop_streaming")
-        stop_streaming_response = Mock(return_value=True)
-        get_next_header = Mock(return_value=(0, []), side_effect=mock_get_next_header)
-        get_next_payload = Mock(return_value=[])
-
-    return MockCommunicationProtocol()
+from acconeer.exptool.a121._core.entities import SessionConfig
+from acconeer.exptool.a121._core.mediators import AgnosticClient, ClientError, LatencyMonitor
 
 
 class TestAnUnconnectedClient:
@@ -233,6 +183,55 @@ class TestAStartedClient:
         mock_protocol.stop_streaming_response.assert_called_once_with(b"end")
 
 
+class TestAStartedClientWithALatencyMonitor:
+    @pytest.fixture
+    def link(self):
+        link = Mock()
+        link.timeout = 2
+        link.recv_until.side_effect = ([b"data_header"] * 20) + [b"stop_streaming"]
+        return link
+
+    @pytest.fixture
+    def callback(self):
+        return Mock()
+
+    @pytest.fixture
+    def latency_monitor(self, callback):
+        return LatencyMonitor(capacity=4, callback=callback, callback_interval=2)
+
+    @pytest.fixture(autouse=True)
+    def client(self, link, mock_protocol, latency_monitor):
+        client = AgnosticClient(link, mock_protocol)
+        client.connect()
+        client.setup_session(SessionConfig(extended=True))
+        client.start_session(latency_monitor=latency_monitor)
+        return client
+
+    def test_exposes_the_monitor(self, client, latency_monitor):
+        assert client.latency_monitor is latency_monitor
+
+    def test_can_get_next(self, client):
+        result = client.get_next()
+        assert result == []
+
+    def test_records_every_stage(self, client, latency_monitor):
+        for _ in range(6):
+            client.get_next()
+
+        stats = latency_monitor.stats
+        assert stats.num_frames == 6
+        assert list(stats.p50) == list(LatencyMonitor.STAGES) + ["total"]
+        assert all(latency >= 0 for latency in stats.p99.values())
+        assert stats.p50["total"] <= stats.p99["total"]
+
+    def test_calls_the_callback_every_interval(self, client, callback):
+        for _ in range(5):
+            client.get_next()
+
+        assert callback.call_count == 2
+        assert callback.call_args.args[0].num_frames == 4
+
+
 class TestAStoppedClient:
     @pytest.fixture
     def link(self):
@@ -284,3 +283,68 @@ class TestADisconnectedClient:
 
     def test_disconnects_link(self, link):
         link.disconnect.assert_called_once_with()
+
+
+class TestAStartedClientWithPrefetch:
+    @pytest.fixture
+    def link(self):
+        link = Mock()
+        link.timeout = 2
+        link.recv_until.side_effect = ([b"data_header"] * 20) + [b"stop_streaming"]
+        return link
+
+    @pytest.fixture
+    def prefetch_overflow(self):
+        return "block"
+
+    @pytest.fixture(autouse=True)
+    def client(self, link, mock_protocol, prefetch_overflow):
+        client = AgnosticClient(link, mock_protocol)
+        client.connect()
+        client.setup_session(SessionConfig(extended=True))
+        client.start_session(prefetch_depth=4, prefetch_overflow=prefetch_overflow)
+        return client
+
+    def test_can_get_next(self, client):
+        result = client.get_next()
+        assert result == []
+        assert client.prefetch_stats.num_received >= 1
+
+    @pytest.mark.parametrize("prefetch_overflow", ["block", "drop_oldest"])
+    def test_counts_dropped_results(self, client, mock_protocol, prefetch_overflow):
+        deadline = time.monotonic() + 5
+        while client.prefetch_stats.num_buffered < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        if prefetch_overflow == "block":
+            # The reader receives one more result, which it holds until there is room
+            while client.prefetch_stats.num_received < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert client.prefetch_stats.num_dropped == 0
+            assert client.prefetch_stats.num_received == 5
+        else:
+            # 4 of the 20 responses of the link are consumed before streaming
+            while client.prefetch_stats.num_received < 16 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert client.prefetch_stats.num_dropped == 12
+
+        assert client.prefetch_stats.num_buffered == 4
+
+    def test_can_stop(self, link, client, mock_protocol):
+        client.get_next()
+        client.stop_session()
+
+        assert not client.session_is_started
+        link.send.assert_called_with(b"stop_streaming")
+        mock_protocol.stop_streaming_response.assert_called_once_with(b"stop_streaming")
+
+    def test_keeps_the_final_stats_after_stop(self, client):
+        client.get_next()
+        client.stop_session()
+
+        # The results which were not taken by get_next are dropped
+        stats = client.prefetch_stats
+        assert stats.num_dropped == stats.num_received - 1
+        assert stats.num_buffered == 0
@@ -0,0 +1,230 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from acconeer.exptool.a121._core.entities import SessionConfig
+from acconeer.exptool.a121._core.mediators import AsyncAgnosticClient, ClientError
+from acconeer.exptool.a121._core.peripherals.communication import ThreadedAsyncLink
+
+
+class MockAsyncLink:
+    """Responds to commands with the command itself. While streaming, serves ``num_frames``
+    data headers and then waits for the stop command.
+    """
+
+    def __init__(self, num_frames, data_header=b"data_header"):
+        self.timeout = 2.0
+        self.sent = []
+        self._headers = [data_header] * num_frames
+        self._response = None
+        self._stop_requested = asyncio.Event()
+
+    async def connect(self):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    async def send(self, bytes_):
+        self.sent.append(bytes_)
+
+        if bytes_ == b"stop_streaming":
+            self._stop_requested.set()
+        else:
+            self._response = bytes_
+
+    async def recv(self, num_bytes):
+        await asyncio.sleep(0)
+        return bytes(num_bytes)
+
+    async def recv_until(self, byte_sequence):
+        await asyncio.sleep(0)
+
+        if self._response is not None:
+            response, self._response = self._response, None
+            return response
+
+        if self._headers:
+            return self._headers.pop(0)
+
+        await self._stop_requested.wait()
+        return b"stop_streaming"
+
+
+class BlockingMockLink:
+    """A blocking link responding like :class:`MockAsyncLink`, which blocks for ``block_s``
+    while streaming, longer than the client waits for the stop response
+    """
+
+    def __init__(self, block_s):
+        self.timeout = 0.05
+        self.num_blocked_calls = 0
+        self._block_s = block_s
+        self._response = None
+        self._lock = threading.Lock()
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def send(self, bytes_):
+        if bytes_ != b"stop_streaming":
+            self._response = bytes_
+
+    def recv(self, num_bytes):
+        return bytes(num_bytes)
+
+    def recv_until(self, byte_sequence):
+        if self._response is not None:
+            response, self._response = self._response, None
+            return response
+
+        with self._lock:
+            self.num_blocked_calls += 1
+
+        time.sleep(self._block_s)
+
+        with self._lock:
+            self.num_blocked_calls -= 1
+
+        return b"data_header"
+
+
+async def start_client(link, mock_protocol, **kwargs):
+    client = AsyncAgnosticClient(link, mock_protocol, **kwargs)
+    await client.connect()
+    await client.setup_session(SessionConfig(extended=True))
+    await client.start_session()
+    return client
+
+
+def test_cannot_get_next_before_start(mock_protocol):
+    async def main():
+        client = AsyncAgnosticClient(MockAsyncLink(0), mock_protocol)
+        await client.connect()
+
+        with pytest.raises(ClientError):
+            await client.get_next()
+
+    asyncio.run(main())
+
+
+def test_can_get_next_and_stop(mock_protocol):
+    async def main():
+        link = MockAsyncLink(20)
+        client = await start_client(link, mock_protocol)
+
+        assert client.session_is_started
+        assert await client.get_next() == []
+
+        await client.stop_session()
+        assert not client.session_is_started
+        assert link.sent[-1] == b"stop_streaming"
+        mock_protocol.stop_streaming_response.assert_called_once_with(b"stop_streaming")
+
+        await client.disconnect()
+        assert not client.connected
+
+    asyncio.run(main())
+
+
+def test_results_ends_when_the_session_is_stopped(mock_protocol):
+    async def main():
+        client = await start_client(MockAsyncLink(20), mock_protocol, prefetch_size=2)
+
+        num_results = 0
+        async for _ in client.results():
+            num_results += 1
+
+            if num_results == 5:
+                await client.stop_session()
+
+        assert num_results == 5
+
+    asyncio.run(main())
+
+
+def test_get_next_is_woken_up_by_stop(mock_protocol):
+    async def main():
+        client = await start_client(MockAsyncLink(0), mock_protocol)
+
+        get_next_task = asyncio.ensure_future(client.get_next())
+        await asyncio.sleep(0)
+        await client.stop_session()
+
+        with pytest.raises(ClientError):
+            await get_next_task
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("overflow", ["block", "drop_oldest"])
+def test_prefetch_overflow(mock_protocol, overflow):
+    async def main():
+        client = await start_client(
+            MockAsyncLink(10), mock_protocol, prefetch_size=3, overflow=overflow
+        )
+
+        for _ in range(50):
+            await asyncio.sleep(0)
+
+        assert len(client._buffer) == 3
+
+        if overflow == "block":
+            assert client.num_dropped_results == 0
+            assert mock_protocol.get_next_payload.call_count == 4
+        else:
+            assert client.num_dropped_results == 7
+            assert mock_protocol.get_next_payload.call_count == 10
+
+        await client.stop_session()
+        assert mock_protocol.get_next_payload.call_count == 10
+
+    asyncio.run(main())
+
+
+def test_reader_errors_are_raised_after_the_buffered_results(mock_protocol):
+    async def main():
+        link = MockAsyncLink(2)
+        link._headers.append(b"garbage")
+        client = await start_client(link, mock_protocol)
+
+        assert await client.get_next() == []
+        assert await client.get_next() == []
+
+        with pytest.raises(Exception):
+            await client.get_next()
+
+    asyncio.run(main())
+
+
+def test_invalid_arguments(mock_protocol):
+    with pytest.raises(ValueError):
+        AsyncAgnosticClient(MockAsyncLink(0), mock_protocol, prefetch_size=0)
+
+    with pytest.raises(ValueError):
+        AsyncAgnosticClient(
+            MockAsyncLink(0), mock_protocol, overflow="drop_everything"  # type: ignore[arg-type]
+        )
+
+
+def test_stop_timeout_waits_for_the_reader_to_let_go_of_the_link(mock_protocol):
+    async def main():
+        link = BlockingMockLink(block_s=1.5)
+        client = await start_client(ThreadedAsyncLink(link), mock_protocol)
+        await asyncio.sleep(0.1)
+
+        with pytest.raises(ClientError):
+            await client.stop_session()
+
+        assert link.num_blocked_calls == 0
+        assert not client.session_is_started
+
+    asyncio.run(main())
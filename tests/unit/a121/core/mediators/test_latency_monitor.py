@@ -0,0 +1,73 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from acconeer.exptool.a121._core.entities import SensorConfig, SessionConfig
+from acconeer.exptool.a121._core.mediators import LatencyMonitor
+
+
+def monitor_frame(monitor, tick, frame_delayed=False):
+    monitor._begin_frame()
+    for stage_index in range(len(LatencyMonitor.STAGES)):
+        monitor._stamp(stage_index)
+    monitor._end_frame([{1: SimpleNamespace(tick=tick, frame_delayed=frame_delayed)}])
+
+
+def test_stats_without_frames_are_nan():
+    stats = LatencyMonitor().stats
+
+    assert stats.num_frames == 0
+    assert all(math.isnan(latency) for latency in stats.p50.values())
+    assert all(math.isnan(latency) for latency in stats.p99.values())
+    assert stats.p50 is not stats.p99
+
+
+def test_counts_dropped_frames_from_ticks():
+    monitor = LatencyMonitor()
+    monitor._start(SessionConfig(SensorConfig(frame_rate=10.0)), ticks_per_second=1000)
+
+    for tick in [0, 100, 200, 500, 600, 610]:
+        monitor_frame(monitor, tick)
+
+    assert monitor.stats.dropped_frames == 2
+
+
+def test_does_not_count_dropped_frames_without_a_rate():
+    monitor = LatencyMonitor()
+    monitor._start(SessionConfig(SensorConfig()), ticks_per_second=1000)
+
+    for tick in [0, 100, 500]:
+        monitor_frame(monitor, tick)
+
+    assert monitor.stats.dropped_frames == 0
+
+
+def test_counts_delayed_frames():
+    monitor = LatencyMonitor()
+    monitor._start(SessionConfig(SensorConfig()), ticks_per_second=1000)
+
+    for frame_delayed in [False, True, True, False]:
+        monitor_frame(monitor, 0, frame_delayed)
+
+    assert monitor.stats.delayed_frames == 2
+
+
+def test_only_keeps_the_latest_frames():
+    monitor = LatencyMonitor(capacity=3)
+    monitor._start(SessionConfig(SensorConfig()), ticks_per_second=1000)
+
+    for _ in range(10):
+        monitor_frame(monitor, 0)
+
+    assert monitor.stats.num_frames == 10
+    assert len(monitor._timestamps) == 3
+
+
+@pytest.mark.parametrize("kwargs", [dict(capacity=0), dict(callback_interval=0)])
+def test_rejects_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        LatencyMonitor(**kwargs)
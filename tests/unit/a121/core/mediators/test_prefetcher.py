@@ -0,0 +1,70 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import time
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from acconeer.exptool.a121._core.mediators import ResultPrefetcher
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert condition()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ResultPrefetcher(list, 0, "block")
+
+    with pytest.raises(ValueError):
+        ResultPrefetcher(list, 1, "drop_everything")  # type: ignore[arg-type]
+
+
+def test_gets_results_in_order():
+    results: list[list[dict[int, Any]]] = [[{1: Mock(tick=tick)}] for tick in range(100)]
+    prefetcher = ResultPrefetcher(iter(results).__next__, 2, "block")
+    prefetcher.start()
+
+    assert [prefetcher.get(timeout=5.0) for _ in range(3)] == results[:3]
+    assert prefetcher.stop(timeout=5.0)
+
+
+def test_results_not_taken_at_stop_are_dropped():
+    prefetcher = ResultPrefetcher(list, 2, "block")
+    prefetcher.start()
+
+    # Two results are buffered and the reader is blocked on the third one
+    wait_for(lambda: prefetcher.stats.num_received == 3)
+    assert prefetcher.get(timeout=5.0) == []
+    assert prefetcher.stats.num_dropped == 0
+
+    assert prefetcher.stop(timeout=5.0)
+
+    stats = prefetcher.stats
+    assert stats.num_dropped == stats.num_received - 1
+    assert stats.num_buffered == 0
+
+
+def test_reader_error_is_raised_after_buffered_results():
+    calls: list[None] = []
+
+    def read_next():
+        calls.append(None)
+        if len(calls) > 1:
+            raise RuntimeError
+
+        return []
+
+    prefetcher = ResultPrefetcher(read_next, 2, "block")
+    prefetcher.start()
+
+    assert prefetcher.get(timeout=5.0) == []
+
+    with pytest.raises(RuntimeError):
+        prefetcher.get(timeout=5.0)
@@ -0,0 +1,89 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from acconeer.exptool.a111._clients.links import LinkError  # type: ignore[import]
+from acconeer.exptool.a121._core.peripherals.communication.async_links import (
+    AsyncSocketLink,
+    ThreadedAsyncLink,
+)
+
+
+class SmallLimitSocketLink(AsyncSocketLink):
+    _STREAM_LIMIT = 16
+
+
+def run_with_server(data, test):
+    """Runs ``test`` with a link connected to a server which sends ``data`` and closes"""
+
+    async def handle(reader, writer):
+        writer.write(data)
+        await writer.drain()
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async with server:
+            link = SmallLimitSocketLink("127.0.0.1", port)
+            await link.connect()
+
+            try:
+                await test(link)
+            finally:
+                await link.disconnect()
+
+    asyncio.run(main())
+
+
+def test_recv_until():
+    async def test(link):
+        assert await link.recv_until(b"\n") == b"abc\n"
+        assert await link.recv(3) == b"def"
+
+    run_with_server(b"abc\ndef", test)
+
+
+def test_recv_until_overrun_raises_link_error():
+    async def test(link):
+        with pytest.raises(LinkError):
+            await link.recv_until(b"\n")
+
+    run_with_server(bytes(64), test)
+
+
+def test_incomplete_recv_raises_link_error():
+    async def test(link):
+        with pytest.raises(LinkError):
+            await link.recv(4)
+
+    run_with_server(b"abc", test)
+
+
+def test_cancelled_threaded_call_waits_for_the_blocking_call():
+    finished = []
+
+    def recv(num_bytes):
+        time.sleep(0.2)
+        finished.append(num_bytes)
+        return bytes(num_bytes)
+
+    link = ThreadedAsyncLink(Mock(recv=recv))
+
+    async def main():
+        task = asyncio.ensure_future(link.recv(3))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert finished == [3]
+
+    asyncio.run(main())
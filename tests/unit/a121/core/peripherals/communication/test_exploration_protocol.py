@@ -17,6 +17,7 @@ from acconeer.exptool.a121._core.entities import (
 )
 from acconeer.exptool.a121._core.peripherals import (
     ExplorationProtocol,
+    ExplorationProtocolError,
     ServerError,
     get_exploration_protocol,
 )
@@ -297,6 +298,47 @@ def test_get_next_header(single_sweep_metadata):
     ]
 
 
+def test_get_next_header_decoder_reuses_contexts(single_sweep_metadata):
+    get_next_header = json.dumps(
+        {
+            "status": "ok",
+            "result_info": [
+                [
+                    {
+                        "tick": 10,
+                        "data_saturated": True,
+                        "temperature": 25,
+                        "frame_delayed": False,
+                        "calibration_needed": False,
+                    }
+                ]
+            ],
+            "payload_size": 400,
+        }
+    ).encode("ascii")
+    extended_metadata = [{1: single_sweep_metadata}]
+
+    decoder = ExplorationProtocol.get_next_header_decoder(extended_metadata, ticks_per_second=10)
+    first_payload_size, first_partial_results = decoder(get_next_header)
+    _, second_partial_results = decoder(get_next_header)
+
+    assert (first_payload_size, first_partial_results) == ExplorationProtocol.get_next_header(
+        get_next_header, extended_metadata, ticks_per_second=10
+    )
+    assert first_partial_results[0][1].tick == 10
+    assert first_partial_results[0][1].data_saturated
+    assert first_partial_results[0][1]._context is second_partial_results[0][1]._context
+
+
+def test_get_next_header_decoder_raises_on_error_status(single_sweep_metadata):
+    decoder = ExplorationProtocol.get_next_header_decoder(
+        [{1: single_sweep_metadata}], ticks_per_second=10
+    )
+
+    with pytest.raises(ServerError):
+        decoder(json.dumps({"status": "error", "message": "error"}).encode("ascii"))
+
+
 def test_get_next_payload_single_sweep(single_sweep_metadata):
     partial_results = [
         {
@@ -376,6 +418,54 @@ def test_get_next_payload_multiple_sweep(single_sweep_metadata):
     )
 
 
+def test_get_next_payload_returns_views_into_payload(single_sweep_metadata):
+    context = ResultContext(metadata=single_sweep_metadata, ticks_per_second=0)
+    partial_result = a121.Result(
+        data_saturated=False,
+        tick=0,
+        frame_delayed=False,
+        calibration_needed=False,
+        temperature=0,
+        frame=np.array([0]),
+        context=context,
+    )
+    partial_results = [{1: partial_result}, {1: partial_result, 2: partial_result}]
+
+    data_array = np.array(range(300), dtype=INT_16_COMPLEX)
+    mock_payload = data_array.tobytes()
+
+    full_results = ExplorationProtocol.get_next_payload(mock_payload, partial_results)
+    frames = [result._frame for group in full_results for result in group.values()]
+
+    for i, frame in enumerate(frames):
+        assert frame.shape == (1, 100)
+        assert frame.base is frames[0].base
+        np.testing.assert_array_equal(frame.ravel(), data_array[i * 100 : (i + 1) * 100])
+
+
+def test_get_next_payload_too_short(single_sweep_metadata):
+    partial_results = [
+        {
+            1: a121.Result(
+                data_saturated=False,
+                tick=0,
+                frame_delayed=False,
+                calibration_needed=False,
+                temperature=0,
+                frame=np.array([0]),
+                context=ResultContext(
+                    metadata=single_sweep_metadata,
+                    ticks_per_second=0,
+                ),
+            )
+        }
+    ]
+    mock_payload = np.array(range(99), dtype=INT_16_COMPLEX).tobytes()
+
+    with pytest.raises(ExplorationProtocolError):
+        ExplorationProtocol.get_next_payload(mock_payload, partial_results)
+
+
 @pytest.mark.parametrize(
     ("rss_version", "expected_protocol"),
     [
@@ -15,6 +15,9 @@ round-trip through:
 import numpy as np
 import pytest
 
+from acconeer.exptool.a121._core.peripherals.h5_record import record as h5_record_module
+from acconeer.exptool.a121._core.utils import iterate_extended_structure_values
+
 
 def test_lib_version(ref_record, ref_lib_version):
     assert ref_record.lib_version == ref_lib_version
@@ -81,3 +84,58 @@ def test_sensor_id(ref_record, ref_structure):
     else:
         with pytest.raises(ValueError):
             _ = ref_record.sensor_id
+
+
+def test_extended_results_are_read_in_chunks(ref_record, ref_num_frames, monkeypatch):
+    monkeypatch.setattr(h5_record_module, "_ITERATION_CHUNK_NBYTES", 1)
+
+    ticks = [
+        result.tick
+        for extended_result in ref_record.extended_results
+        for result in iterate_extended_structure_values(extended_result)
+    ]
+
+    assert ticks == [
+        tick
+        for tick in range(ref_num_frames)
+        for _ in iterate_extended_structure_values(ref_record.extended_metadata)
+    ]
+
+
+def test_result_contexts_are_shared(ref_record):
+    first, last = ref_record.extended_result_at(0), ref_record.extended_result_at(-1)
+
+    for first_result, last_result in zip(
+        iterate_extended_structure_values(first), iterate_extended_structure_values(last)
+    ):
+        assert first_result._context is last_result._context
+
+
+@pytest.mark.parametrize("index", [0, -1])
+def test_extended_result_at(ref_record, ref_num_frames, ref_frame, index):
+    for result in iterate_extended_structure_values(ref_record.extended_result_at(index)):
+        assert result.tick == range(ref_num_frames)[index]
+        np.testing.assert_array_equal(result.frame, ref_frame)
+
+
+def test_extended_result_at_out_of_range(ref_record, ref_num_frames):
+    with pytest.raises(IndexError):
+        ref_record.extended_result_at(ref_num_frames)
+
+
+@pytest.mark.parametrize(
+    "frames", [slice(None), slice(1, None), slice(None, -1), slice(0, None, 2), slice(2, 1)]
+)
+def test_extended_stacked_results_at(ref_record, ref_num_frames, frames):
+    expected_ticks = np.arange(ref_num_frames)[frames]
+
+    for stacked_results in iterate_extended_structure_values(
+        ref_record.extended_stacked_results_at(frames)
+    ):
+        np.testing.assert_array_equal(stacked_results.tick, expected_ticks)
+        assert len(stacked_results) == len(expected_ticks)
+
+
+def test_extended_stacked_results_at_rejects_negative_steps(ref_record):
+    with pytest.raises(ValueError):
+        ref_record.extended_stacked_results_at(slice(None, None, -1))
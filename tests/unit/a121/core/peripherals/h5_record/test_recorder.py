@@ -3,6 +3,7 @@
 
 import h5py
 import importlib_metadata
+import pytest
 
 from acconeer.exptool import a121
 
@@ -47,10 +48,16 @@ def test_init_defaults_with_file_object(tmp_file_path):
         assert f["generation"][()].decode() == "a121"
 
 
-def test_sample_whole_record(tmp_path, ref_record):
+@pytest.mark.parametrize(
+    ("buffer_size", "compression"),
+    [(1, None), (2, None), (100, None), (2, "gzip"), (2, "lzf")],
+)
+def test_sample_whole_record(tmp_path, ref_record, buffer_size, compression):
     filename = tmp_path / "empty.h5"
     recorder = a121.H5Recorder(
         filename,
+        buffer_size=buffer_size,
+        compression=compression,
         _lib_version=ref_record.lib_version,
         _timestamp=ref_record.timestamp,
         _uuid=ref_record.uuid,
@@ -72,3 +79,34 @@ def test_sample_whole_record(tmp_path, ref_record):
 
     record = a121.load_record(filename)
     assert_record_equals(record, ref_record)
+
+
+def test_buffered_frames_are_written_on_stop(tmp_path, ref_record):
+    filename = tmp_path / "empty.h5"
+    recorder = a121.H5Recorder(filename, buffer_size=100)
+
+    recorder._start(
+        client_info=ref_record.client_info,
+        extended_metadata=ref_record.extended_metadata,
+        server_info=ref_record.server_info,
+        session_config=ref_record.session_config,
+    )
+
+    for extended_results in ref_record.extended_results:
+        recorder._sample(extended_results)
+
+    assert len(recorder.file["session/group_0/entry_0/result/frame"]) == 0
+
+    recorder._stop()
+
+    with a121.open_record(filename) as record:
+        assert record.num_frames == ref_record.num_frames
+
+
+@pytest.mark.parametrize(
+    ("buffer_size", "compression"),
+    [(0, None), (1, "bzip2")],
+)
+def test_invalid_arguments(tmp_file_path, buffer_size, compression):
+    with pytest.raises(ValueError):
+        a121.H5Recorder(tmp_file_path, buffer_size=buffer_size, compression=compression)
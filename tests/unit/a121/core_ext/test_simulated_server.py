@@ -0,0 +1,134 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import contextlib
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core.peripherals.communication.exploration_protocol import (
+    ExplorationProtocol,
+)
+from acconeer.exptool.a121._core.peripherals.communication.links import AdaptedSocketLink
+from acconeer.exptool.a121._core_ext._simulated_server import (
+    session_config_from_setup_command,
+    simulate_metadata,
+)
+
+
+@contextlib.contextmanager
+def simulated_server(monkeypatch, **kwargs):
+    """Starts a server on a free port, to which the clients of the test connect"""
+    with a121._SimulatedExplorationServer(port=0, time_scale=0, **kwargs) as server:
+        _, port = server.address
+        monkeypatch.setattr(AdaptedSocketLink, "_PORT", port)
+        yield server
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with simulated_server(monkeypatch) as server:
+        yield server
+
+
+def test_setup_command_round_trip():
+    session_config = a121.SessionConfig(
+        [
+            {
+                1: a121.SensorConfig(
+                    sweeps_per_frame=4,
+                    frame_rate=10.0,
+                    inter_frame_idle_state=a121.IdleState.SLEEP,
+                    subsweeps=[
+                        a121.SubsweepConfig(
+                            profile=a121.Profile.PROFILE_1, prf=a121.PRF.PRF_6_5_MHz
+                        ),
+                        a121.SubsweepConfig(num_points=10),
+                    ],
+                )
+            },
+            {2: a121.SensorConfig(), 3: a121.SensorConfig(sweep_rate=1000.0)},
+        ],
+        update_rate=20.0,
+        extended=True,
+    )
+    command = ExplorationProtocol._setup_command_preprocessing(session_config)
+    command["groups"] = ExplorationProtocol._translate_groups_representation(command["groups"])
+
+    assert session_config_from_setup_command(command) == session_config
+
+
+def test_simulate_metadata():
+    sensor_config = a121.SensorConfig(
+        sweeps_per_frame=3,
+        subsweeps=[a121.SubsweepConfig(num_points=10), a121.SubsweepConfig(num_points=5)],
+    )
+    metadata = simulate_metadata(sensor_config)
+
+    assert metadata.sweep_data_length == 15
+    assert metadata.frame_data_length == 45
+    assert metadata.subsweep_data_offset.tolist() == [0, 10]
+    assert metadata.subsweep_data_length.tolist() == [10, 5]
+    assert metadata.max_sweep_rate > 0
+
+
+def test_streams_extended_session(server):
+    session_config = a121.SessionConfig(
+        [
+            {1: a121.SensorConfig(sweeps_per_frame=2), 2: a121.SensorConfig()},
+            {3: a121.SensorConfig(subsweeps=[a121.SubsweepConfig(num_points=7)] * 2)},
+        ],
+        extended=True,
+    )
+
+    with a121.Client(ip_address="localhost") as client:
+        assert client.server_info.sensor_count == 5
+
+        extended_metadata = client.setup_session(session_config)
+        client.start_session()
+        extended_results = [client.get_next() for _ in range(10)]
+        client.stop_session()
+
+    assert extended_metadata[1][3].subsweep_data_length.tolist() == [7, 7]
+
+    for extended_result in extended_results:
+        assert [list(group) for group in extended_result] == [[1, 2], [3]]
+        assert extended_result[0][1].frame.shape == (2, 160)
+        assert extended_result[1][3].frame.shape == (1, 14)
+
+    ticks = [extended_result[0][1].tick for extended_result in extended_results]
+    assert ticks == sorted(ticks)
+
+
+def test_rejects_unconnected_sensors(server):
+    with a121.Client(ip_address="localhost") as client:
+        with pytest.raises(a121.ServerError):
+            client.setup_session(a121.SessionConfig({6: a121.SensorConfig()}))
+
+
+def test_streams_record(server, tmp_path, monkeypatch):
+    path = tmp_path / "record.h5"
+    sensor_config = a121.SensorConfig(
+        sweeps_per_frame=2, subsweeps=[a121.SubsweepConfig(num_points=20)]
+    )
+
+    with a121.Client(ip_address="localhost") as client:
+        client.setup_session(sensor_config)
+        client.start_session(recorder=a121.H5Recorder(path))
+        _ = [client.get_next() for _ in range(3)]
+        client.stop_session()
+
+    server.stop()
+    record = a121.load_record(path)
+
+    with simulated_server(monkeypatch, record=record):
+        with a121.Client(ip_address="localhost") as client:
+            client.setup_session(sensor_config)
+            client.start_session()
+            results = [client.get_next() for _ in range(4)]
+            client.stop_session()
+
+    recorded_frames = record.stacked_results.frame
+    for i, result in enumerate(results):
+        np.testing.assert_array_equal(result.frame, recorded_frames[i % 3])
@@ -0,0 +1,48 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import json
+
+import pytest
+
+from acconeer.exptool.a121 import _bench
+
+
+@pytest.mark.parametrize("name", list(_bench.BENCHMARKS))
+@pytest.mark.parametrize("num_subsweeps", [1, 2])
+def test_benchmark_can_run(name, num_subsweeps):
+    case = _bench.BenchmarkCase(sweeps_per_frame=8, num_points=160, num_subsweeps=num_subsweeps)
+    data = _bench._SessionData(case)
+    setup, _ = _bench.BENCHMARKS[name]
+
+    try:
+        try:
+            func = setup(data)
+        except ValueError:
+            assert num_subsweeps > 1
+            return
+
+        for _ in range(3):
+            func()
+    finally:
+        data.close()
+
+
+def test_json_output_and_compare():
+    cases = [_bench.BenchmarkCase(sweeps_per_frame=1, num_points=20, num_subsweeps=1)]
+    results = _bench.run_benchmarks(cases, ["protocol.get_next_header"], repeat=1)
+
+    assert [result.name for result in results] == ["protocol.get_next_header"]
+    assert results[0].params == dict(sweeps_per_frame=1, num_points=20, num_subsweeps=1)
+
+    output = json.loads(json.dumps(_bench.to_json(results)))
+    assert output["schema_version"] == _bench.SCHEMA_VERSION
+
+    (result,) = output["results"]
+    assert result["rate"] == pytest.approx(1 / result["median"])
+
+    baseline = json.loads(json.dumps(output))
+    baseline["results"][0]["median"] = result["median"] / 2
+    assert _bench.compare(baseline, output) == [
+        ("protocol.get_next_header[num_points=20,num_subsweeps=1,sweeps_per_frame=1]", 1.0)
+    ]
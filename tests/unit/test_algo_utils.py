@@ -0,0 +1,204 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import numpy as np
+import pytest
+
+from acconeer.exptool._algo_utils import (
+    HistoryBuffer,
+    calculate_cfar_window_mean,
+    copy_read_only_arrays,
+    find_peaks,
+    interpolate_peaks,
+)
+
+
+def reference_cfar_window_mean(sweep, idx_cfar_pts, one_sided):
+    window_mean = np.full(sweep.shape, np.nan)
+    start_idx = int(np.max(idx_cfar_pts))
+    if one_sided:
+        rel_indexes = -idx_cfar_pts
+        end_idx = sweep.size
+    else:
+        rel_indexes = np.concatenate((-idx_cfar_pts, +idx_cfar_pts), axis=0)
+        end_idx = sweep.size - start_idx
+
+    for idx in range(start_idx, end_idx):
+        window_mean[idx] = np.mean(sweep[idx + rel_indexes])
+
+    return window_mean
+
+
+@pytest.mark.parametrize("one_sided", [True, False])
+@pytest.mark.parametrize("num_points", [3, 40, 500])
+@pytest.mark.parametrize(("guard_half_length", "window_length"), [(0, 1), (2, 5), (7, 12)])
+def test_cfar_window_mean_matches_reference(
+    one_sided, num_points, guard_half_length, window_length
+):
+    sweep = np.random.default_rng(1).random(num_points) * 1000
+    idx_cfar_pts = guard_half_length + np.arange(window_length)
+
+    np.testing.assert_array_equal(
+        calculate_cfar_window_mean(sweep, idx_cfar_pts, one_sided),
+        reference_cfar_window_mean(sweep, idx_cfar_pts, one_sided),
+    )
+
+
+def test_cfar_window_mean_non_contiguous_offsets():
+    sweep = np.arange(20.0)
+    idx_cfar_pts = np.array([0.0, 2.0, 2.0, 4.0])
+
+    np.testing.assert_array_equal(
+        calculate_cfar_window_mean(sweep, idx_cfar_pts, one_sided=False),
+        reference_cfar_window_mean(sweep, idx_cfar_pts.astype(int), one_sided=False),
+    )
+
+
+@pytest.mark.parametrize("one_sided", [True, False])
+def test_cfar_window_mean_stacked_sweeps(one_sided):
+    sweeps = np.random.default_rng(2).random((4, 100))
+    idx_cfar_pts = 3 + np.arange(6)
+
+    window_means = calculate_cfar_window_mean(sweeps, idx_cfar_pts, one_sided)
+
+    assert window_means.shape == sweeps.shape
+    for sweep, window_mean in zip(sweeps, window_means):
+        np.testing.assert_allclose(
+            window_mean, calculate_cfar_window_mean(sweep, idx_cfar_pts, one_sided)
+        )
+
+
+def reference_find_peaks(sweep, threshold, center_plateaus):
+    found_peaks = []
+    d = 1
+    N = len(sweep)
+    while d < (N - 1):
+        if np.isnan(threshold[d - 1]):
+            d += 1
+            continue
+        if np.isnan(threshold[d + 1]):
+            break
+        if sweep[d] <= threshold[d]:
+            d += 2
+            continue
+        if sweep[d - 1] <= threshold[d - 1]:
+            d += 1
+            continue
+        if sweep[d - 1] >= sweep[d]:
+            d += 1
+            continue
+        d_upper = d + 1
+        while True:
+            if d_upper >= (N - 1):
+                break
+            if np.isnan(threshold[d_upper]):
+                break
+            if sweep[d_upper] <= threshold[d_upper]:
+                break
+            if sweep[d_upper] > sweep[d]:
+                break
+            elif sweep[d_upper] < sweep[d]:
+                if center_plateaus:
+                    found_peaks.append(d + (d_upper - d) // 2)
+                else:
+                    found_peaks.append(d)
+                break
+            else:
+                d_upper += 1
+        d = d_upper
+    return found_peaks
+
+
+def random_peaks_input(rng, num_points):
+    # Quantized values give plenty of plateaus
+    sweep = rng.integers(0, 6, num_points).astype(float)
+    threshold = np.full(num_points, rng.integers(0, 3), dtype=float)
+    num_nan_start, num_nan_end = rng.integers(0, 4, 2)
+    threshold[:num_nan_start] = np.nan
+    threshold[num_points - num_nan_end :] = np.nan
+    return sweep, threshold
+
+
+@pytest.mark.parametrize("center_plateaus", [True, False])
+def test_find_peaks_matches_reference(center_plateaus):
+    rng = np.random.default_rng(2)
+
+    for _ in range(500):
+        sweep, threshold = random_peaks_input(rng, int(rng.integers(1, 30)))
+
+        assert find_peaks(sweep, threshold, center_plateaus=center_plateaus) == (
+            reference_find_peaks(sweep, threshold, center_plateaus)
+        )
+
+
+def test_find_peaks_plateau():
+    sweep = np.array([0, 1, 3, 3, 3, 3, 1, 0], dtype=float)
+    threshold = np.full(sweep.shape, 0.5)
+
+    assert find_peaks(sweep, threshold) == [2]
+    assert find_peaks(sweep, threshold, center_plateaus=True) == [4]
+
+
+def test_find_peaks_stacked():
+    rng = np.random.default_rng(3)
+    sweeps, thresholds = zip(*[random_peaks_input(rng, 20) for _ in range(50)])
+
+    assert find_peaks(np.array(sweeps), np.array(thresholds)) == [
+        reference_find_peaks(sweep, threshold, False)
+        for sweep, threshold in zip(sweeps, thresholds)
+    ]
+
+
+def test_interpolate_peaks():
+    x = np.arange(10)
+    sweep = 5.0 - (x - 4.3) ** 2
+
+    peak_locs, peak_amplitudes = interpolate_peaks(sweep, [4])
+
+    np.testing.assert_allclose(peak_locs, [4.3])
+    np.testing.assert_allclose(peak_amplitudes, [5.0])
+
+
+@pytest.mark.parametrize("length", [1, 2, 7])
+@pytest.mark.parametrize("shape", [(), (3,)])
+def test_history_buffer_matches_roll(length, shape):
+    rng = np.random.default_rng(4)
+    history = HistoryBuffer(length, shape, fill_value=np.nan)
+    reference = np.full((length,) + shape, np.nan)
+
+    for _ in range(3 * length + 1):
+        value = rng.random(shape)
+        history.push(value)
+        reference = np.roll(reference, -1, axis=0)
+        reference[-1] = value
+
+        np.testing.assert_array_equal(history.ordered, reference)
+
+    assert len(history) == length
+    assert history.shape == reference.shape
+
+
+def test_history_buffer_ordered_is_read_only():
+    history = HistoryBuffer(4, 2)
+    history.push([1, 2])
+
+    with pytest.raises(ValueError):
+        history.ordered[-1] = 0
+
+    history.fill(3)
+    np.testing.assert_array_equal(history.ordered, np.full((4, 2), 3))
+
+
+def test_copy_read_only_arrays():
+    history = HistoryBuffer(3)
+    writeable = np.zeros(2)
+    output = {"history": history.ordered, "pair": (history.ordered, writeable), "n": 1}
+
+    copied = copy_read_only_arrays(output)
+    history.push(1)
+
+    np.testing.assert_array_equal(copied["history"], [0, 0, 0])
+    assert isinstance(copied["pair"], tuple)
+    np.testing.assert_array_equal(copied["pair"][0], [0, 0, 0])
+    assert copied["pair"][1] is writeable
+    assert copied["n"] == 1
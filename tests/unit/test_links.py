@@ -0,0 +1,74 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import socket
+
+import pytest
+
+from acconeer.exptool.a111._clients.links import RecvBuffer, SocketLink
+
+
+def test_recv_buffer_read_and_find():
+    buf = RecvBuffer(size=8)
+    buf.extend(b"abc\ndef")
+
+    assert len(buf) == 7
+    assert buf.find(b"\n") == 4
+    assert buf.read(4) == bytearray(b"abc\n")
+    assert buf.find(b"\n") == -1
+
+    buf.extend(b"gh\n")
+    assert buf.find(b"\n") == 6
+    assert buf.read(6) == bytearray(b"defgh\n")
+    assert len(buf) == 0
+
+
+def test_recv_buffer_grows_and_compacts():
+    buf = RecvBuffer(size=4)
+    buf.extend(b"0123")
+    assert buf.read(3) == bytearray(b"012")
+
+    buf.extend(b"456")  # Compacts, "3" is moved to the start
+    buf.extend(b"789abc")  # Grows
+    assert len(buf) == 10
+    assert buf.read(10) == bytearray(b"3456789abc")
+
+
+def test_recv_buffer_finds_sequence_split_over_writes():
+    buf = RecvBuffer(size=16)
+    buf.extend(b"xxxx\r")
+    assert buf.find(b"\r\n") == -1
+
+    view = buf.write_view(4)
+    view[:2] = b"\ny"
+    buf.commit(2)
+
+    assert buf.find(b"\r\n") == 6
+    assert buf.read(6) == bytearray(b"xxxx\r\n")
+    assert buf.read(1) == bytearray(b"y")
+
+
+@pytest.fixture
+def socket_link():
+    link_sock, server_sock = socket.socketpair()
+    link = SocketLink()
+    link._sock = link_sock
+    link._buf = RecvBuffer(size=16)
+    link.timeout = 1
+
+    yield link, server_sock
+
+    link_sock.close()
+    server_sock.close()
+
+
+def test_socket_link_recv_until_and_recv(socket_link):
+    link, server_sock = socket_link
+    header = b'{"status": "ok", "payload_size": 40}\n'
+    payload = bytes(range(40))
+
+    server_sock.sendall(header + payload + header)
+
+    assert link.recv_until(b"\n") == header
+    assert link.recv(len(payload)) == payload
+    assert link.recv_until(b"\n") == header
@@ -0,0 +1,84 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import time
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a111
+from acconeer.exptool.a111._clients.mock.client import MockClient
+
+
+@pytest.mark.parametrize("mode", a111.Mode)
+@pytest.mark.parametrize("sensor", [[1], [1, 2, 3]])
+@pytest.mark.parametrize("squeeze", [True, False])
+def test_fast_mode_matches_the_regular_mode(mode, sensor, squeeze):
+    config = a111._configs.MODE_TO_CONFIG_CLASS_MAP[mode]()
+    config.sensor = sensor
+
+    regular_client = MockClient(squeeze=squeeze, paced=False)
+    fast_client = MockClient(squeeze=squeeze, fast=True, paced=False)
+
+    assert regular_client.start_session(config) == fast_client.start_session(config)
+
+    regular_info, regular_data = regular_client.get_next()
+    fast_info, fast_data = fast_client.get_next()
+
+    assert fast_info == regular_info
+    assert fast_data.shape == regular_data.shape
+    assert fast_data.dtype == regular_data.dtype
+
+    regular_client.stop_session()
+    fast_client.stop_session()
+
+
+def test_fast_mode_reuses_the_output_buffer():
+    config = a111.SparseServiceConfig()
+    config.sensor = [1, 2]
+    client = MockClient(fast=True, paced=False)
+    client.start_session(config)
+
+    _, first_data = client.get_next()
+    first_frame = first_data.copy()
+    _, second_data = client.get_next()
+
+    assert second_data is first_data
+    assert not np.array_equal(second_data, first_frame)
+
+
+@pytest.mark.parametrize(
+    "mode,atol",
+    [
+        (a111.Mode.ENVELOPE, 200),
+        (a111.Mode.IQ, 0.05),
+        (a111.Mode.SPARSE, 1000),
+    ],
+)
+def test_fast_mode_follows_the_regular_mode(mode, atol):
+    config = a111._configs.MODE_TO_CONFIG_CLASS_MAP[mode]()
+    config.sensor = [1, 2]
+    config.update_rate = 10
+    regular_client = MockClient(paced=False)
+    fast_client = MockClient(fast=True, paced=False)
+    regular_client.start_session(config)
+    fast_client.start_session(config)
+
+    # The frames differ by the noise, which is small compared to the moving signal
+    for _ in range(20):
+        _, regular_data = regular_client.get_next()
+        _, fast_data = fast_client.get_next()
+        np.testing.assert_allclose(fast_data, regular_data, atol=atol)
+
+
+def test_unpaced():
+    config = a111.EnvelopeServiceConfig()
+    config.update_rate = 1
+    client = MockClient(fast=True, paced=False)
+    client.start_session(config)
+
+    start = time.monotonic()
+    for _ in range(10):
+        client.get_next()
+
+    assert time.monotonic() - start < 1.0
@@ -0,0 +1,69 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+import copy
+import importlib
+
+import numpy as np
+import pytest
+
+from acconeer.exptool._algo_utils import copy_read_only_arrays
+from acconeer.exptool.a111._clients.mock.client import MockClient
+
+
+NUM_FRAMES = 30
+
+
+def assert_outputs_equal(actual, expected):
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            assert_outputs_equal(actual[key], expected[key])
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected)
+        for a, e in zip(actual, expected):
+            assert_outputs_equal(a, e)
+    elif isinstance(expected, (np.ndarray, float, complex)):
+        np.testing.assert_array_equal(actual, expected)
+    else:
+        assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "module_name,squeeze",
+    [
+        ("button_press", True),
+        ("envelope", True),
+        ("iq", True),
+        ("obstacle_detection", True),
+        ("parking", True),
+        ("presence_detection_sparse", True),
+        ("sleep_breathing", True),
+        ("sparse", False),
+        ("sparse_inter_fft", True),
+        ("speed_sparse", True),
+        ("wave_to_exit", True),
+    ],
+)
+def test_copied_outputs_are_not_changed_by_later_frames(module_name, squeeze):
+    module = importlib.import_module(f"acconeer.exptool.a111.algo.{module_name}._processor")
+    sensor_config = module.get_sensor_config()
+    processing_config = module.ProcessingConfiguration()
+
+    np.random.seed(0)
+    client = MockClient(squeeze=squeeze, paced=False)
+    session_info = client.start_session(sensor_config)
+    processor = module.Processor(sensor_config, processing_config, session_info)
+
+    # Histories are views valid until the next frame, which consumers keeping outputs copy
+    kept_outputs = []
+    snapshots = []
+    for _ in range(NUM_FRAMES):
+        data_info, data = client.get_next()
+        output = processor.process(data, data_info)
+        kept_outputs.append(copy_read_only_arrays(output))
+        snapshots.append(copy.deepcopy(output))
+
+    client.stop_session()
+
+    assert_outputs_equal(kept_outputs, snapshots)
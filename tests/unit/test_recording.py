@@ -103,3 +103,217 @@ def test_packing_mode(tmp_path, mode):
     restored = a111.recording.unpack(packed)
 
     assert restored.mode == mode
+
+
+@pytest.mark.parametrize("mode", a111.Mode)
+@pytest.mark.parametrize("num_frames", [3, 5, 12])
+def test_ring_buffer_recorder(mode, num_frames, mocker):
+    config = a111._configs.MODE_TO_CONFIG_CLASS_MAP[mode]()
+    config.sensor = [1, 2]
+    session_info = mocker.start_session(config)
+
+    recorder = a111.recording.Recorder(sensor_config=config, session_info=session_info, max_len=5)
+    ring_buffer_recorder = a111.recording.RingBufferRecorder(
+        sensor_config=config, session_info=session_info, max_len=5
+    )
+
+    for _ in range(num_frames):
+        data_info, data = mocker.get_next()
+        recorder.sample(data_info, data)
+        ring_buffer_recorder.sample(data_info, data)
+
+    assert len(ring_buffer_recorder) == min(num_frames, 5)
+    assert ring_buffer_recorder.num_sampled == num_frames
+
+    expected = recorder.close()
+    record = ring_buffer_recorder.close()
+
+    np.testing.assert_array_equal(record.data, expected.data)
+    assert record.data.dtype == expected.data.dtype
+    assert record.data_info == expected.data_info
+    assert record.sample_times.shape == (len(expected.data),)
+    assert np.all(np.diff(record.sample_times) >= 0)
+    assert record.mode == mode
+    assert record.session_info == session_info
+
+    columns = ring_buffer_recorder.data_info_columns
+    assert columns.shape == (len(expected.data), 2)
+    assert "data_saturated" in columns.dtype.names
+
+    # The data info is converted from the columns when accessed
+    assert np.shares_memory(record.data_info.columns, columns)
+    assert record.data_info[-1] == expected.data_info[-1]
+    assert record.data_info[1:] == expected.data_info[1:]
+
+
+def test_ring_buffer_recorder_snapshot_can_be_saved(tmp_path, mocker):
+    mocker.squeeze = True
+    config = a111.SparseServiceConfig()
+    session_info = mocker.start_session(config)
+    recorder = a111.recording.RingBufferRecorder(
+        sensor_config=config, session_info=session_info, max_len=3
+    )
+
+    for _ in range(4):
+        data_info, data = mocker.get_next()
+        recorder.sample(data_info, data)
+
+    snapshot = recorder.snapshot(copy=True)
+    assert snapshot.data.flags.c_contiguous
+
+    data_info, data = mocker.get_next()
+    recorder.sample(data_info, data)
+    np.testing.assert_array_equal(recorder.snapshot().data[-2], snapshot.data[-1])
+
+    filename = tmp_path / "record.h5"
+    a111.recording.save(filename, snapshot)
+    loaded_record = a111.recording.load(filename)
+
+    np.testing.assert_array_equal(loaded_record.data, snapshot.data)
+    assert loaded_record.data_info == snapshot.data_info
+
+
+def test_ring_buffer_recorder_empty(mocker):
+    config = a111.EnvelopeServiceConfig()
+    session_info = mocker.start_session(config)
+    recorder = a111.recording.RingBufferRecorder(
+        sensor_config=config, session_info=session_info, max_len=3
+    )
+
+    record = recorder.close()
+    assert record.data.shape == (0, 1, session_info["data_length"])
+    assert record.data_info == []
+
+    with pytest.raises(ValueError):
+        a111.recording.RingBufferRecorder(
+            sensor_config=config, session_info=session_info, max_len=0
+        )
+
+
+@pytest.mark.parametrize("mode", a111.Mode)
+@pytest.mark.parametrize("num_frames", [0, 3, 10])
+def test_h5_recorder(tmp_path, mode, num_frames, mocker):
+    config = a111._configs.MODE_TO_CONFIG_CLASS_MAP[mode]()
+    config.sensor = [1, 2]
+    session_info = mocker.start_session(config)
+
+    recorder = a111.recording.Recorder(sensor_config=config, session_info=session_info)
+    filename = tmp_path / "record.h5"
+    h5_recorder = a111.recording.H5Recorder(
+        filename, sensor_config=config, session_info=session_info, chunk_size=4
+    )
+
+    with h5_recorder:
+        for _ in range(num_frames):
+            data_info, data = mocker.get_next()
+            recorder.sample(data_info, data)
+            h5_recorder.sample(data_info, data)
+
+        assert h5_recorder.num_frames == num_frames
+
+    record = recorder.close()
+    loaded_record = a111.recording.load(filename)
+
+    assert loaded_record.mode == mode
+    assert loaded_record.sensor_config_dump == record.sensor_config_dump
+    assert loaded_record.session_info == session_info
+    assert loaded_record.data_info == record.data_info
+    assert loaded_record.data.shape[1:] == (2,) + a111.recording.get_frame_shape(
+        mode, config, session_info
+    )
+    assert len(loaded_record.sample_times) == num_frames
+
+    if num_frames > 0:
+        np.testing.assert_array_equal(loaded_record.data, record.data)
+
+
+def test_h5_recorder_promotes_data_to_float(tmp_path, mocker):
+    mocker.squeeze = True
+    config = a111.EnvelopeServiceConfig()
+    session_info = mocker.start_session(config)
+    filename = tmp_path / "record.h5"
+
+    frames = []
+    with a111.recording.H5Recorder(
+        filename, sensor_config=config, session_info=session_info, chunk_size=2
+    ) as recorder:
+        for i in range(5):
+            data_info, data = mocker.get_next()
+            if i == 3:
+                data = data + 0.5
+
+            frames.append(data)
+            recorder.sample(data_info, data)
+
+    loaded_record = a111.recording.load(filename)
+    np.testing.assert_array_equal(loaded_record.data[:, 0], frames)
+
+
+@pytest.mark.parametrize("num_frames", [2, 6])
+def test_h5_recorder_can_be_loaded_before_closing(tmp_path, num_frames, mocker):
+    mocker.squeeze = True
+    config = a111.SparseServiceConfig()
+    session_info = mocker.start_session(config)
+    filename = tmp_path / "record.h5"
+
+    recorder = a111.recording.H5Recorder(
+        filename, sensor_config=config, session_info=session_info, chunk_size=4
+    )
+
+    for _ in range(num_frames):
+        recorder.sample(*mocker.get_next())
+
+    recorder.file.close()
+
+    # Only full chunks are written
+    num_written = num_frames // 4 * 4
+    loaded_record = a111.recording.load(filename)
+    assert len(loaded_record.data) == num_written
+    assert len(loaded_record.data_info) == num_written
+
+
+@pytest.mark.parametrize("mode", a111.Mode)
+@pytest.mark.parametrize("ext", ["h5", "npz", "uncompressed.npz"])
+def test_open(tmp_path, mode, ext, mocker):
+    config = a111._configs.MODE_TO_CONFIG_CLASS_MAP[mode]()
+    session_info = mocker.start_session(config)
+    recorder = a111.recording.Recorder(sensor_config=config, session_info=session_info)
+
+    for _ in range(10):
+        recorder.sample(*mocker.get_next())
+
+    record = recorder.close()
+    filename = tmp_path / f"record.{ext}"
+
+    if ext == "uncompressed.npz":
+        np.savez(filename, **a111.recording.pack(record))
+    else:
+        a111.recording.save(filename, record)
+
+    loaded_record = a111.recording.load(filename)
+
+    with a111.recording.open(filename) as opened_record:
+        if ext == "uncompressed.npz":
+            assert isinstance(opened_record.data._source, np.memmap)
+
+        assert opened_record.mode == mode
+        assert opened_record.session_info == loaded_record.session_info
+        assert len(opened_record.data) == 10
+        assert opened_record.data.shape == loaded_record.data.shape
+        assert opened_record.data.dtype == loaded_record.data.dtype
+
+        for i, (data_info, data) in enumerate(opened_record):
+            assert data_info == loaded_record.data_info[i]
+            np.testing.assert_array_equal(data, loaded_record.data[i])
+            assert data.dtype == loaded_record.data.dtype
+
+        np.testing.assert_array_equal(opened_record.data[3:7], loaded_record.data[3:7])
+        np.testing.assert_array_equal(opened_record.data[-1], loaded_record.data[-1])
+        assert opened_record.data_info[3:7] == loaded_record.data_info[3:7]
+
+        resaved_filename = tmp_path / "resaved.h5"
+        a111.recording.save(resaved_filename, opened_record)
+
+    resaved_record = a111.recording.load(resaved_filename)
+    np.testing.assert_array_equal(resaved_record.data, loaded_record.data)
+    assert resaved_record.data_info == loaded_record.data_info
@@ -0,0 +1,66 @@
+# Copyright (c) Acconeer AB, 2022
+# All rights reserved
+
+"""Micro-benchmark of the CFAR threshold, per frame, for a range of number of points.
+
+Compares the shared vectorized implementation with the previous point-by-point loop.
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from acconeer.exptool._algo_utils import calculate_cfar_window_mean
+
+
+def loop_cfar_window_mean(sweep, idx_cfar_pts, one_sided):
+    window_mean = np.full(sweep.shape, np.nan)
+    start_idx = int(np.max(idx_cfar_pts))
+    if one_sided:
+        rel_indexes = -idx_cfar_pts
+        end_idx = sweep.size
+    else:
+        rel_indexes = np.concatenate((-idx_cfar_pts, +idx_cfar_pts), axis=0)
+        end_idx = sweep.size - start_idx
+
+    for idx in np.arange(start_idx, end_idx):
+        window_mean[idx] = np.mean(np.take(sweep, idx + rel_indexes))
+
+    return window_mean
+
+
+def time_per_call(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--guard-half-length", type=int, default=28)
+    parser.add_argument("--window-length", type=int, default=7)
+    parser.add_argument("--one-sided", action="store_true")
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    idx_cfar_pts = args.guard_half_length + np.arange(args.window_length)
+    rng = np.random.default_rng()
+
+    print(f"{'num_points':>10} {'loop [us]':>12} {'vectorized [us]':>16} {'speedup':>8}")
+
+    for num_points in [100, 200, 500, 1000, 2000, 5000]:
+        sweep = rng.random(num_points)
+
+        t_loop = time_per_call(
+            lambda: loop_cfar_window_mean(sweep, idx_cfar_pts, args.one_sided), args.number
+        )
+        t_vec = time_per_call(
+            lambda: calculate_cfar_window_mean(sweep, idx_cfar_pts, args.one_sided), args.number
+        )
+
+        print(
+            f"{num_points:>10} {t_loop * 1e6:>12.1f} {t_vec * 1e6:>16.1f} {t_loop / t_vec:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()